@@ -0,0 +1,62 @@
+"""
+Row-count scaling of growing a DataFrame with pd.concat on every page
+versus FrameAccumulator, on a synthetic paginated feed.
+
+    python -m benchmarks.bench_accumulator [max_rows] [page_size]
+"""
+
+import sys
+import time
+
+import pandas as pd
+
+from naas_drivers.accumulator import FrameAccumulator
+
+
+def feed(rows, page_size):
+    for start in range(0, rows, page_size):
+        yield [
+            {
+                "ID": i,
+                "NAME": f"user {i}",
+                "CREATED_AT": "2023-01-01T00:00:00Z",
+                "SCORE": i * 0.5,
+            }
+            for i in range(start, min(start + page_size, rows))
+        ]
+
+
+def concat_loop(pages):
+    df = pd.DataFrame()
+    for page in pages:
+        df = pd.concat([df, pd.DataFrame(page)], axis=0)
+    return df.reset_index(drop=True)
+
+
+def accumulator(pages):
+    acc = FrameAccumulator()
+    for page in pages:
+        acc.extend(page)
+    return acc.to_df()
+
+
+def timed(func, rows, page_size):
+    pages = list(feed(rows, page_size))
+    start = time.perf_counter()
+    df = func(pages)
+    elapsed = time.perf_counter() - start
+    assert len(df) == rows
+    return elapsed
+
+
+def main(max_rows=100_000, page_size=100):
+    sizes = [r for r in (1_000, 10_000, 25_000, 50_000, 100_000) if r <= max_rows]
+    print(f"{'rows':>8} {'concat (s)':>12} {'accumulator (s)':>16} {'speedup':>8}")
+    for rows in sizes:
+        before = timed(concat_loop, rows, page_size)
+        after = timed(accumulator, rows, page_size)
+        print(f"{rows:>8} {before:>12.3f} {after:>16.3f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,486 @@
+"""
+End-to-end benchmark of the drivers on synthetic API responses, replayed
+by a local stub server: best wall time, peak memory (tracemalloc, whole
+process) and rows/sec, per driver and data size. Drivers whose optional
+dependencies are not installed are skipped.
+
+    python -m benchmarks.bench_drivers [--sizes 100,1000] [--only github_issues]
+        [--repeat 3] [--save results.json] [--compare results.json]
+
+With --compare, exits with status 1 when a scenario is slower or uses more
+memory than the saved results by more than --tolerance (default 25%).
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+
+import pandas as pd
+
+from benchmarks.bench_github_issues import fixture as issues_fixture
+from benchmarks.stub_server import StubServer, paginate
+
+PER_PAGE = 100
+SCENARIOS = {}
+
+
+def scenario(func):
+    """Register func(size) -> (routes, run), run(redirect) returns the rows."""
+    SCENARIOS[func.__name__] = func
+    return func
+
+
+def pages(records, page):
+    """Page of records and the page count, for page number APIs."""
+    return paginate(records, page, PER_PAGE), max(-(-len(records) // PER_PAGE), 1)
+
+
+def link_header(url, page, last):
+    links = [f'<{url}?per_page=100&page={last}>; rel="last"']
+    if page < last:
+        links.insert(0, f'<{url}?per_page=100&page={page + 1}>; rel="next"')
+    return {"Link": ", ".join(links)}
+
+
+@scenario
+def github_issues(size):
+    from naas_drivers.tools.github import Github
+
+    issues = issues_fixture(size)
+    url = "https://api.github.com/repos/org/repo/issues"
+
+    def route(method, path, query, body):
+        if path.endswith("/comments"):
+            number = int(path.split("/")[-2])
+            return 200, {}, [{"body": f"comment {i}"} for i in range(number % 3)]
+        page = int(query.get("page", 1))
+        records, last = pages(issues, page)
+        return 200, link_header(url, page, last), records
+
+    def run(redirect):
+        driver = Github().connect("token")
+        driver.session.middlewares.append(redirect)
+        return driver.repos.get_issues("https://github.com/org/repo")
+
+    return {"api.github.com": route}, run
+
+
+@scenario
+def github_stargazers(size):
+    from naas_drivers.tools.github import Github
+
+    stargazers = [
+        {
+            "starred_at": "2023-01-02T03:04:05Z",
+            "user": {
+                "login": f"user{i}",
+                "id": i,
+                "url": f"https://api.github.com/users/user{i}",
+                "type": "User",
+                "site_admin": False,
+            },
+        }
+        for i in range(size)
+    ]
+    url = "https://api.github.com/repos/org/repo/stargazers"
+
+    def route(method, path, query, body):
+        page = int(query.get("page", 1))
+        records, last = pages(stargazers, page)
+        return 200, link_header(url, page, last), records
+
+    def run(redirect):
+        driver = Github().connect("token")
+        driver.session.middlewares.append(redirect)
+        return driver.repos.get_stargazers("https://github.com/org/repo")
+
+    return {"api.github.com": route}, run
+
+
+@scenario
+def hubspot_contacts(size):
+    from naas_drivers.tools.hubspot import HubSpot
+
+    contacts = [
+        {
+            "id": str(i),
+            "properties": {
+                "hs_object_id": str(i),
+                "email": f"user{i}@example.com",
+                "firstname": f"First {i}",
+                "lastname": f"Last {i}",
+                "createdate": "2023-01-02T03:04:05.000Z",
+            },
+        }
+        for i in range(size)
+    ]
+
+    def route(method, path, query, body):
+        start = int(query.get("after", 0))
+        res = {"results": contacts[start:][:PER_PAGE]}
+        if start + PER_PAGE < len(contacts):
+            res["paging"] = {"next": {"after": str(start + PER_PAGE)}}
+        return 200, {}, res
+
+    def run(redirect):
+        driver = HubSpot().connect("token")
+        driver.session.middlewares.append(redirect)
+        return driver.contacts.get_all()
+
+    return {"api.hubapi.com": route}, run
+
+
+@scenario
+def thinkific_users(size):
+    from naas_drivers.tools.thinkific import Thinkific
+
+    users = [
+        {
+            "id": i,
+            "email": f"user{i}@example.com",
+            "first_name": f"First {i}",
+            "last_name": f"Last {i}",
+            "created_at": "2023-01-02T03:04:05.000Z",
+        }
+        for i in range(size)
+    ]
+
+    def route(method, path, query, body):
+        records, last = pages(users, body["page"])
+        meta = {"pagination": {"current_page": body["page"], "total_pages": last}}
+        return 200, {}, {"items": records, "meta": meta}
+
+    def run(redirect):
+        driver = Thinkific().connect("token", "subdomain")
+        driver.session.middlewares.append(redirect)
+        return driver.users.get_all()
+
+    return {"api.thinkific.com": route}, run
+
+
+@scenario
+def qonto_transactions(size):
+    from naas_drivers.tools.qonto import Qonto
+
+    ibans = ["FR7600000000000000000000001", "FR7600000000000000000000002"]
+    organization = {
+        "organization": {
+            "slug": "org",
+            "legal_name": "Org",
+            "bank_accounts": [
+                {
+                    "slug": f"org-bank-account-{n}",
+                    "iban": iban,
+                    "bic": "QNTOFRP1XXX",
+                    "currency": "EUR",
+                    "balance": 1.0,
+                    "balance_cents": 100,
+                    "authorized_balance": 1.0,
+                    "authorized_balance_cents": 100,
+                    "name": f"Account {n}",
+                    "updated_at": "2023-01-02T03:04:05.000Z",
+                    "status": "active",
+                }
+                for n, iban in enumerate(ibans)
+            ],
+        }
+    }
+    transactions = {
+        iban: [
+            {
+                "transaction_id": f"org-{n}-transaction-{i}",
+                "settled_at": "2023-01-02T03:04:05.000Z",
+                "emitted_at": "2023-01-02T03:04:05.000Z",
+                "label": f"Label {i}",
+                "status": "completed",
+                "category": "other",
+                "reference": None,
+                "operation_type": "card",
+                "card_last_digits": "1234",
+                "side": "debit" if i % 2 else "credit",
+                "amount": i * 1.5,
+                "currency": "EUR",
+                "vat_amount": 0.0,
+                "vat_rate": 0.0,
+                "local_amount": i * 1.5,
+                "local_currency": "EUR",
+                "note": None,
+                "attachment_ids": [],
+                "attachment_lost": False,
+                "attachment_required": False,
+            }
+            for i in range(size // len(ibans))
+        ]
+        for n, iban in enumerate(ibans)
+    }
+
+    def route(method, path, query, body):
+        if path.endswith("/organization"):
+            return 200, {}, organization
+        page = int(query["current_page"])
+        records, last = pages(transactions[query["iban"]], page)
+        meta = {"next_page": page + 1 if page < last else None}
+        return 200, {}, {"transactions": records, "meta": meta}
+
+    def run(redirect):
+        driver = Qonto().connect("user", "token")
+        driver.session.middlewares.append(redirect)
+        return driver.transactions.get()
+
+    return {"thirdparty.qonto.com": route}, run
+
+
+@scenario
+def linkedin_posts(size):
+    from naas_drivers.tools.linkedin import LINKEDIN_API, LinkedIn
+
+    posts = [
+        {
+            "ACTIVITY_ID": str(7000000000000000000 + i),
+            "POST_URL": f"https://www.linkedin.com/feed/update/urn:li:activity:{i}",
+            "TEXT": f"Post {i}",
+            "COMMENTS": i % 7,
+            "LIKES": i % 13,
+            "SHARES": i % 3,
+        }
+        for i in range(size)
+    ]
+
+    def route(method, path, query, body):
+        # Every post of a page carries the token of the next page
+        start = int(query.get("pagination_token", 0))
+        end = start + int(query["count"])
+        token = str(end) if end < len(posts) else None
+        page = [{**post, "PAGINATION_TOKEN": token} for post in posts[start:end]]
+        return 200, {}, page
+
+    def run(redirect):
+        driver = LinkedIn().connect(
+            "li_at", "jsessionid", rate_limit={"rate": 1e6, "burst": 1e6}
+        )
+        driver.session.middlewares.append(redirect)
+        return driver.profile.get_posts_feed(
+            None, profile_id="ACoAAB", count=PER_PAGE, limit=-1
+        )
+
+    return {LINKEDIN_API.split("/")[2]: route}, run
+
+
+@scenario
+def gsheet_get(size):
+    from naas_drivers.tools.gsheet import Gsheet
+
+    columns = ["NAME", "EMAIL", "SCORE", "CREATED_AT"]
+    rows = [
+        {
+            "rowNumber": i + 2,
+            "NAME": f"user {i}",
+            "EMAIL": f"user{i}@example.com",
+            "SCORE": str(i * 0.5),
+            "CREATED_AT": "2023-01-02",
+        }
+        for i in range(size)
+    ]
+
+    def route(method, path, query, body):
+        return 200, {}, {"data": rows, "columns": columns}
+
+    def run(redirect):
+        driver = Gsheet().connect("sheet", api_url="https://sheets.naas.test/")
+        driver.session.middlewares.append(redirect)
+        return driver.get("Sheet1")
+
+    return {"sheets.naas.test": route}, run
+
+
+@scenario
+def notion_query(size):
+    from notion_client import Client
+
+    from naas_drivers.tools.notion import Notion
+
+    records = [
+        {
+            "object": "page",
+            "id": f"page-{i}",
+            "created_time": "2023-01-02T03:04:05.000Z",
+            "last_edited_time": "2023-01-02T03:04:05.000Z",
+            "archived": False,
+            "url": f"https://www.notion.so/page-{i}",
+            "parent": {"type": "database_id", "database_id": "db"},
+            "properties": {
+                "Score": {"id": "score", "type": "number", "number": i},
+            },
+        }
+        for i in range(size)
+    ]
+
+    def route(method, path, query, body):
+        start = int(body.get("start_cursor") or 0)
+        end = start + PER_PAGE
+        return (
+            200,
+            {},
+            {
+                "object": "list",
+                "results": records[start:end],
+                "has_more": end < len(records),
+                "next_cursor": str(end) if end < len(records) else None,
+            },
+        )
+
+    def run(redirect):
+        # notion_client does not use the driver session, its base url is the stub
+        driver = Notion()
+        base_url = f"{redirect.base_url}/api.notion.com"
+        driver._Notion__client = Client(auth="token", base_url=base_url)
+        return driver.databases.query("a" * 32)
+
+    return {"api.notion.com": route}, run
+
+
+FakeColumn = namedtuple("FakeColumn", ["name"])
+
+
+class FakeCursor:
+    """Stand-in for a snowflake.connector cursor holding one result set."""
+
+    def __init__(self, rows, columns):
+        self.rows = rows
+        self.description = [FakeColumn(name) for name in columns]
+
+    def execute(self, sql):
+        return self
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def fetchmany(self, n):
+        return self.rows[:n]
+
+
+@scenario
+def snowflake_query(size):
+    from naas_drivers.tools.snowflake import Snowflake
+
+    columns = ["ID", "NAME", "CREATED_AT", "SCORE"]
+    rows = [(i, f"user {i}", "2023-01-02 03:04:05", i * 0.5) for i in range(size)]
+
+    def run(redirect):
+        driver = Snowflake()
+        driver._cursor = FakeCursor(rows, columns)
+        return driver.query_pd("select * from users", n=-1)
+
+    return {}, run
+
+
+@scenario
+def mongo_send_get(size):
+    import mongomock
+
+    from naas_drivers.tools.mongo import Mongo
+
+    df = pd.DataFrame(
+        {
+            "ID": range(size),
+            "NAME": [f"user {i}" for i in range(size)],
+            "SCORE": [i * 0.5 for i in range(size)],
+        }
+    )
+
+    def run(redirect):
+        driver = Mongo()
+        driver._Mongo__client = mongomock.MongoClient()
+        driver.connected = True
+        with contextlib.redirect_stdout(io.StringIO()):
+            driver.send(df.copy(), "users", "bench")
+        return driver.get("users", "bench")
+
+    return {}, run
+
+
+def measure(run, redirect, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = len(run(redirect))
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        run(redirect)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    best = min(timings)
+    return {
+        "rows": rows,
+        "seconds": best,
+        "rows_per_sec": rows / best if best > 0 else None,
+        "peak_mb": peak / 2**20,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Scenarios slower or heavier than the baseline beyond the tolerance."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric in ("seconds", "peak_mb"):
+            if result[metric] > base[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{key} {metric}: {base[metric]:.3f} -> {result[metric]:.3f}"
+                )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="100,1000")
+    parser.add_argument("--only", default=None, help="comma separated scenarios")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", default=None)
+    parser.add_argument("--compare", default=None)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    names = args.only.split(",") if args.only else list(SCENARIOS)
+    results = {}
+    print(f"{'scenario':<24}{'rows':>8}{'best s':>10}{'rows/s':>12}{'peak MB':>10}")
+    for name in names:
+        for size in sizes:
+            try:
+                routes, run = SCENARIOS[name](size)
+            except ImportError as e:
+                print(f"{name:<24}skipped ({e})")
+                break
+            with StubServer(routes) as server:
+                result = measure(run, server.redirect(), args.repeat)
+            key = f"{name}[{size}]"
+            results[key] = result
+            print(
+                f"{key:<24}{result['rows']:>8}{result['seconds']:>10.3f}"
+                f"{result['rows_per_sec'] or 0:>12.0f}{result['peak_mb']:>10.1f}"
+            )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
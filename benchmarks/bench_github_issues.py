@@ -0,0 +1,89 @@
+"""
+Per-cell df.loc writes versus the record builder used by
+Repositories.get_issues, on a 5k-issue fixture shaped like the GitHub
+REST API payload. Comment and linked PR lookups are left out: they cost
+the same network calls in both versions.
+
+    python -m benchmarks.bench_github_issues [issues]
+"""
+
+import sys
+import time
+
+import pandas as pd
+
+from naas_drivers.accumulator import FrameAccumulator
+from naas_drivers.tools.github import ISSUES_COLUMNS, _issue_row
+
+
+def fixture(count):
+    return [
+        {
+            "id": 1000000 + i,
+            "number": i,
+            "html_url": f"https://github.com/org/repo/issues/{i}",
+            "title": f"Issue {i}",
+            "state": "open" if i % 3 else "closed",
+            "labels": [{"name": "bug"}, {"name": "good first issue"}][: i % 3],
+            "assignees": [{"login": f"user{i % 7}"}] if i % 2 else [],
+            "comments": i % 11,
+            "created_at": "2023-01-02T03:04:05Z",
+            "updated_at": "2023-02-03T04:05:06Z",
+            "comments_url": f"https://api.github.com/repos/org/repo/issues/{i}/comments",
+        }
+        for i in range(count)
+    ]
+
+
+def legacy(issues):
+    df = pd.DataFrame()
+    for idx, issue in enumerate(issues):
+        df.loc[idx, "link_to_the_issue"] = issue["html_url"]
+        df.loc[idx, "issue_number"] = issue["number"]
+        df.loc[idx, "issue_title"] = issue["title"]
+        df.loc[idx, "issue_state"] = issue["state"]
+        df.loc[idx, "issue_id"] = issue["id"]
+        labels = [label.get("name") for label in issue["labels"]]
+        df.loc[idx, "issue_labels"] = ", ".join(labels) if labels else "None"
+        assigned = [assignee.get("login") for assignee in issue["assignees"]]
+        df.loc[idx, "issue_assignees"] = ", ".join(assigned) if assigned else "None"
+        df.loc[idx, "comments_till_date"] = issue["comments"]
+        created = issue.get("created_at").strip("Z").split("T")
+        updated = issue.get("updated_at").strip("Z").split("T")
+        df.loc[idx, "last_created_date"] = created[0]
+        df.loc[idx, "last_created_time"] = created[-1]
+        df.loc[idx, "last_updated_date"] = updated[0]
+        df.loc[idx, "last_updated_time"] = updated[-1]
+    df["issue_id"] = df.issue_id.astype("int")
+    df["comments_till_date"] = df.comments_till_date.astype("int")
+    df["issue_number"] = df.issue_number.astype("int")
+    return df
+
+
+def record_builder(issues):
+    acc = FrameAccumulator(
+        columns=ISSUES_COLUMNS[:12],
+        dtypes={"issue_id": "int", "comments_till_date": "int", "issue_number": "int"},
+    )
+    acc.extend(_issue_row(issue) for issue in issues)
+    return acc.to_df()
+
+
+def timed(func, issues):
+    start = time.perf_counter()
+    df = func(issues)
+    return time.perf_counter() - start, df
+
+
+def main(count=5000):
+    issues = fixture(count)
+    print(f"{'issues':>8} {'df.loc (s)':>12} {'records (s)':>12} {'speedup':>8}")
+    for rows in sorted({min(count, n) for n in (500, 1000, 2500, count)}):
+        before, df_before = timed(legacy, issues[:rows])
+        after, df_after = timed(record_builder, issues[:rows])
+        pd.testing.assert_frame_equal(df_before, df_after, check_dtype=False)
+        print(f"{rows:>8} {before:>12.3f} {after:>12.3f} {before / after:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
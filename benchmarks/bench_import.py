@@ -0,0 +1,89 @@
+"""
+Cold import time of naas_drivers and of each driver module, read from
+python -X importtime in a fresh interpreter, with the heaviest packages
+each one pulls in. Modules whose dependencies are missing are skipped.
+
+    python -m benchmarks.bench_import [--only linkedin,qonto] [--budget 500]
+
+With --budget (milliseconds), exits with status 1 when a module takes longer.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+import naas_drivers
+
+TOOLS = os.path.join(os.path.dirname(naas_drivers.__file__), "tools")
+
+
+def importtime(statement):
+    """Top level and per package cumulative import times (ms) of a statement."""
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+    )
+    if res.returncode != 0:
+        raise ImportError(res.stderr.strip().splitlines()[-1])
+    top, packages = {}, {}
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        ms = int(cumulative) / 1000
+        if not name.startswith("  "):
+            top[name.strip()] = ms
+        package = name.strip().split(".")[0]
+        packages[package] = max(packages.get(package, 0), ms)
+    return top, packages
+
+
+def measure(module, startup):
+    """Import time (ms) of module on top of the interpreter startup."""
+    top, packages = importtime(f"import {module}")
+    total = sum(ms for name, ms in top.items() if name not in startup[0])
+    heaviest = sorted(
+        (p for p in packages if p not in startup[1] and p != "naas_drivers"),
+        key=packages.get,
+        reverse=True,
+    )[:3]
+    return total, [(name, packages[name]) for name in heaviest]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--only", default=None, help="comma separated drivers")
+    parser.add_argument("--budget", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    if args.only:
+        modules = [f"naas_drivers.tools.{name}" for name in args.only.split(",")]
+    else:
+        modules = ["naas_drivers", "naas_drivers.driver"] + [
+            f"naas_drivers.tools.{file[:-3]}"
+            for file in sorted(os.listdir(TOOLS))
+            if file.endswith(".py") and not file.startswith("__")
+        ]
+    startup = importtime("pass")
+    over = []
+    for module in modules:
+        try:
+            total, heaviest = measure(module, startup)
+        except ImportError as e:
+            print(f"{module:<44}skipped ({e})")
+            continue
+        deps = ", ".join(f"{name} {ms:.0f}" for name, ms in heaviest)
+        print(f"{module:<44}{total:>8.0f} ms  {deps}")
+        if args.budget is not None and total > args.budget:
+            over.append(module)
+    for module in over:
+        print(f"OVER BUDGET {module}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Local HTTP server replaying synthetic API responses, and the session
+middleware sending driver requests to it instead of the real hosts.
+
+Requests to https://<host>/<path> are served by the route registered for
+<host>: route(method, path, query, body) -> (status, headers, payload).
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _serve(self):
+        parts = urlparse(self.path)
+        host, _, path = parts.path.lstrip("/").partition("/")
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        body = json.loads(body) if body else None
+        route = self.server.routes.get(host)
+        if route is None:
+            status, headers, payload = 404, {}, {"message": f"No route for {host}"}
+        else:
+            query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+            status, headers, payload = route(self.command, f"/{path}", query, body)
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _serve
+
+
+class StubServer:
+    """
+    Context manager running the stub server in a background thread.
+
+    Parameters
+    ----------
+    routes: dict:
+        Host -> route(method, path, query, body).
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+
+    def __enter__(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.daemon_threads = True
+        self.server.routes = self.routes
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.05,), daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def redirect(self):
+        """Session middleware sending the routed hosts to this server."""
+        return Redirect(self.url, self.routes)
+
+
+class Redirect:
+    """Session middleware rewriting https://<host>/... to the stub server."""
+
+    def __init__(self, base_url, hosts):
+        self.base_url = base_url
+        self.hosts = set(hosts)
+
+    def __call__(self, send, method, url, **kwargs):
+        parts = urlparse(url)
+        if parts.netloc in self.hosts:
+            url = f"{self.base_url}/{parts.netloc}{parts.path}"
+            if parts.query:
+                url = f"{url}?{parts.query}"
+        return send(method, url, **kwargs)
+
+
+def paginate(records, page, per_page):
+    """Slice of records served for a 1-based page number."""
+    start = (page - 1) * per_page
+    return records[start:][:per_page]
@@ -1,5 +1,8 @@
-import requests
+import contextlib
+import contextvars
 import os
+import threading
+import time
 from mprop import mproperty
 from subprocess import Popen, PIPE
 import sys
@@ -10,7 +13,12 @@ __github_repo = "jupyter-naas/drivers"
 
 __doc_url = "https://naas.gitbook.io/drivers/"
 
+# Process wide instances, and instances of the current isolated() block
 __loaded_drivers = {}
+__context_drivers = contextvars.ContextVar("naas_drivers_instances", default=None)
+# Driver name -> (create(install=True), extras installed when it fails)
+__driver_loaders = {}
+__loading_lock = threading.RLock()
 
 if os.environ.get("NAAS_DRIVER_LIGHT_INIT"):
     exit()
@@ -25,6 +33,8 @@ def version():
 
 
 def get_last_version():
+    import requests
+
     url = f"https://api.github.com/repos/{__github_repo}/tags"
     response = requests.get(url, headers={"Accept": "application/vnd.github.v3+json"})
     return response.json()[0]["name"]
@@ -34,49 +44,66 @@ def up_to_date():
     return get_last_version() == version()
 
 
+def stats():
+    """
+    Requests, errors, bytes, latency, retries, rate limit waits and DataFrame
+    builds per driver and endpoint. Counted once enabled with
+    naas_drivers.instrumentation.enable() or NAAS_DRIVERS_STATS=1.
+    """
+    from naas_drivers.instrumentation import stats
+
+    return stats()
+
+
 def load_driver(_func=None, *, extra_requires=""):
     def fn_wrapper(loader_fn):
-        @mproperty
-        def wrapper(mod):
-
-            name = loader_fn.__name__
-
-            if name not in __loaded_drivers:
-                try:
-                    loaded = loader_fn()
-                    __loaded_drivers[name] = loaded
-                except Exception as e:
-                    if extra_requires != "":
-                        naas_drivers_path = "/".join(__file__.split("/")[:-2])
-                        if (
-                            os.path.isfile(os.path.join(naas_drivers_path, "setup.py"))
-                            is False
-                        ):
-                            naas_drivers_path = "naas-drivers"
-                        cmd = [
-                            "pip",
-                            "install",
-                            "--user",
-                            f"{naas_drivers_path}[{extra_requires}]",
-                        ]
-                        print(
-                            f"""
+        name = loader_fn.__name__
+
+        def create(install=True):
+            try:
+                return loader_fn()
+            except Exception as e:
+                if not install or extra_requires == "":
+                    raise e
+                naas_drivers_path = "/".join(__file__.split("/")[:-2])
+                if (
+                    os.path.isfile(os.path.join(naas_drivers_path, "setup.py"))
+                    is False
+                ):
+                    naas_drivers_path = "naas-drivers"
+                cmd = [
+                    "pip",
+                    "install",
+                    "--user",
+                    f"{naas_drivers_path}[{extra_requires}]",
+                ]
+                print(
+                    f"""
         👉 Running this command automatically to install missing requirements. $> {(" ").join(cmd)}
 
         ⚠️ You may need to restart your kernel / execution to be able to use the installed packages.
 
         💡 You can also run this command prior to execution next time to install these packages the way you want (venv, etc).
             """
-                        )
-                        process = Popen(cmd, stdout=PIPE, stderr=PIPE)
-                        stdout, stderr = process.communicate()
-                        print(stdout.decode("utf-8"))
-                        print(stderr.decode("utf-8"), file=sys.stderr)
-                        loaded = loader_fn()
-                        __loaded_drivers[name] = loaded
-                    else:
-                        raise e
-            return __loaded_drivers[name]
+                )
+                process = Popen(cmd, stdout=PIPE, stderr=PIPE)
+                stdout, stderr = process.communicate()
+                print(stdout.decode("utf-8"))
+                print(stderr.decode("utf-8"), file=sys.stderr)
+                return loader_fn()
+
+        __driver_loaders[name] = (create, extra_requires)
+
+        @mproperty
+        def wrapper(mod):
+            instances = __context_drivers.get()
+            if instances is None:
+                instances = __loaded_drivers
+            if name not in instances:
+                with __loading_lock:
+                    if name not in instances:
+                        instances[name] = create()
+            return instances[name]
 
         return wrapper
 
@@ -86,6 +113,98 @@ def load_driver(_func=None, *, extra_requires=""):
         return fn_wrapper(_func)
 
 
+def new(name):
+    """
+    Return a new instance of a driver, with its own credentials and session,
+    ex: naas_drivers.new("hubspot").connect(token).
+
+    Parameters
+    ----------
+    name: str:
+        Driver name, as in naas_drivers.<name>.
+    """
+    if name not in __driver_loaders:
+        raise ValueError(f"Unknown driver {name}")
+    return __driver_loaders[name][0]()
+
+
+def preload(names=None, max_in_flight=None):
+    """
+    Import and instantiate drivers concurrently, ex: when a worker starts,
+    so that naas_drivers.<name> is ready before the first job. Missing
+    requirements are reported, never installed.
+    Return a DataFrame with one row per driver: DRIVER, LOADED, SECONDS,
+    ERROR and EXTRA_REQUIRES (extras of naas-drivers to install).
+
+    Parameters
+    ----------
+    names: list (default None):
+        Driver names, all of them if None.
+    max_in_flight: int (default 10):
+        Drivers loaded at once.
+    """
+    import pandas as pd
+
+    from naas_drivers.concurrency import MAX_IN_FLIGHT, fan_out
+
+    names = list(__driver_loaders) if names is None else list(names)
+    unknown = [name for name in names if name not in __driver_loaders]
+    if len(unknown) > 0:
+        raise ValueError(f"Unknown drivers {', '.join(unknown)}")
+    instances = __context_drivers.get()
+    if instances is None:
+        instances = __loaded_drivers
+
+    def load(name):
+        create, extra_requires = __driver_loaders[name]
+        start = time.perf_counter()
+        error = None
+        try:
+            if name not in instances:
+                driver = create(install=False)
+                with __loading_lock:
+                    instances.setdefault(name, driver)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        return {
+            "DRIVER": name,
+            "LOADED": error is None,
+            "SECONDS": time.perf_counter() - start,
+            "ERROR": error,
+            "EXTRA_REQUIRES": extra_requires if error is not None else "",
+        }
+
+    rows = fan_out(load, names, max_in_flight or MAX_IN_FLIGHT)
+    extras = sorted(
+        {e for row in rows for e in row["EXTRA_REQUIRES"].split(",") if e != ""}
+    )
+    if len(extras) > 0:
+        print(
+            "Missing requirements, install them with: "
+            f"pip install naas-drivers[{','.join(extras)}]",
+            file=sys.stderr,
+        )
+    columns = ["DRIVER", "LOADED", "SECONDS", "ERROR", "EXTRA_REQUIRES"]
+    return pd.DataFrame(rows, columns=columns)
+
+
+@contextlib.contextmanager
+def isolated():
+    """
+    Within the block, naas_drivers.<name> returns instances private to the
+    block instead of the process wide ones. Use one block per thread or
+    asyncio task to run several tenants' extractions in parallel:
+
+        with naas_drivers.isolated():
+            naas_drivers.hubspot.connect(token).contacts.get_all()
+    """
+    token = __context_drivers.set({})
+    try:
+        yield
+    finally:
+        __context_drivers.reset(token)
+
+
 @load_driver
 def optimise():
     from naas_drivers.tools.optimise import Optimise
@@ -0,0 +1,86 @@
+import time
+
+import pandas as pd
+
+from naas_drivers.instrumentation import instrumentation
+from naas_drivers.schema import astype
+
+
+class FrameAccumulator:
+    """
+    Collect rows page by page and build the DataFrame once at the end,
+    instead of growing it with pd.concat on every page.
+
+    Parameters
+    ----------
+    columns: list (default None):
+        Columns of the DataFrame, in order. Missing ones are added empty.
+    dtypes: dict (default None):
+        Column -> dtype applied when the DataFrame is built, see schema.astype.
+    ignore_index: bool (default True):
+        Renumber the rows, set False to keep the index of added frames.
+    schema: Schema (default None):
+        Declared columns and dtypes, replaces columns and dtypes.
+    """
+
+    def __init__(self, columns=None, dtypes=None, ignore_index=True, schema=None):
+        self.columns = columns
+        self.dtypes = dtypes or {}
+        self.ignore_index = ignore_index
+        self.schema = schema
+        self._chunks = []
+        self._records = []
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def append(self, record):
+        """Add one row (dict)."""
+        self._records.append(record)
+        self._length += 1
+        return self
+
+    def extend(self, records):
+        """Add a batch of rows (list of dicts)."""
+        records = list(records)
+        self._records.extend(records)
+        self._length += len(records)
+        return self
+
+    def add_columns(self, columns):
+        """Add a batch of rows given as column -> array of values."""
+        return self.add_frame(pd.DataFrame(columns))
+
+    def add_frame(self, df):
+        """Add a batch of rows already in a DataFrame."""
+        self._flush()
+        self._chunks.append(df)
+        self._length += len(df)
+        return self
+
+    def _flush(self):
+        if len(self._records) > 0:
+            self._chunks.append(pd.DataFrame.from_records(self._records))
+            self._records = []
+
+    def to_df(self):
+        """Build the DataFrame and apply the declared columns and dtypes."""
+        start = time.perf_counter()
+        self._flush()
+        if len(self._chunks) == 0:
+            df = pd.DataFrame()
+        elif len(self._chunks) == 1:
+            df = self._chunks[0]
+        else:
+            df = pd.concat(self._chunks, axis=0, ignore_index=self.ignore_index)
+        self._chunks = [df]
+        if self.schema is not None:
+            df = self.schema.apply(df)
+        else:
+            if self.columns is not None:
+                df = df.reindex(columns=self.columns)
+            df = astype(df, self.dtypes)
+        if instrumentation.enabled:
+            instrumentation.frame(len(df), time.perf_counter() - start)
+        return df
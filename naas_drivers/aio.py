@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+import weakref
+from datetime import timedelta
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+class AsyncTransport:
+    """
+    Send prepared requests with httpx on the running event loop and answer
+    them with requests.Response objects, so that session middlewares and
+    drivers read them like the synchronous ones.
+    One httpx.AsyncClient is opened per event loop, clients cannot be shared
+    between loops.
+    Needs httpx (pip install naas-drivers[async]).
+
+    Parameters
+    ----------
+    max_connections: int (default None):
+        Connections open at once, further requests wait for one of them.
+        Unlimited if None.
+    max_keepalive_connections: int (default None):
+        Idle connections kept open.
+    transport: httpx.AsyncBaseTransport (default None):
+        Transport of the clients, ex: httpx.MockTransport.
+    """
+
+    def __init__(
+        self, max_connections=None, max_keepalive_connections=None, transport=None
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.transport = transport
+        self._clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def client(self):
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                limits = httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                )
+                client = httpx.AsyncClient(limits=limits, transport=self.transport)
+                self._clients[loop] = client
+        return client
+
+    async def aclose(self):
+        """Close the client of the running event loop."""
+        with self._lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def send(self, request, timeout=None, allow_redirects=True):
+        """
+        Send a requests.PreparedRequest and return its requests.Response.
+        httpx errors are raised as the matching requests exceptions.
+        """
+        import httpx
+
+        start = time.perf_counter()
+        try:
+            res = await self.client().request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+                timeout=get_timeout(timeout),
+                follow_redirects=allow_redirects,
+            )
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(e, request=request) from e
+        except httpx.TimeoutException as e:
+            raise requests.ReadTimeout(e, request=request) from e
+        except httpx.TooManyRedirects as e:
+            raise requests.TooManyRedirects(e, request=request) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request) from e
+        elapsed = timedelta(seconds=time.perf_counter() - start)
+        return to_response(res, request, elapsed)
+
+
+def get_timeout(timeout):
+    """httpx.Timeout of a requests timeout: seconds or (connect, read)."""
+    import httpx
+
+    # Requests queued for a connection of the pool wait as long as needed
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect, pool=None)
+    return httpx.Timeout(timeout, pool=None)
+
+
+def to_response(res, request, elapsed):
+    """requests.Response holding an httpx.Response already read."""
+    response = requests.Response()
+    response.status_code = res.status_code
+    response.headers = CaseInsensitiveDict(res.headers.items())
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = res.content
+    response.url = str(res.url)
+    response.reason = res.reason_phrase
+    response.elapsed = elapsed
+    response.request = request
+    return response
@@ -0,0 +1,289 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+CACHE_MAX_BYTES = 100 * 1024 * 1024
+PARSED_MAX_ENTRIES = 128
+CACHE_MODES = ("use", "refresh", "bypass")
+
+
+class ConditionalCache:
+    """
+    Session middleware caching GET responses on disk by ETag.
+
+    Cached URLs are requested again with If-None-Match: a 304 answer is
+    served from the cache (with the cached body and headers, status 200).
+    Entries are evicted least recently used first once they take more than
+    `max_bytes`. Parsed JSON bodies of recent hits are kept in memory.
+
+    Parameters
+    ----------
+    path: str:
+        Directory storing the cache entries.
+    max_bytes: int (default 100MB):
+        Maximum size of the cache on disk.
+    hosts: list (default None):
+        Hosts cached, all of them when None.
+    """
+
+    def __init__(self, path, max_bytes=CACHE_MAX_BYTES, hosts=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hosts = hosts
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._parsed = OrderedDict()
+        os.makedirs(path, exist_ok=True)
+        # Least recently used first
+        entries = []
+        for name in os.listdir(path):
+            if name.endswith(".json"):
+                stat = os.stat(os.path.join(path, name))
+                entries.append((stat.st_mtime, name[: -len(".json")], stat.st_size))
+        self._index = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self._bytes = sum(self._index.values())
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._index),
+            "bytes": self._bytes,
+        }
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+            self._parsed.clear()
+
+    @staticmethod
+    def get_key(request):
+        parts = [
+            request.method,
+            request.url,
+            request.headers.get("Accept", ""),
+            request.headers.get("Authorization", ""),
+        ]
+        return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, f"{key}.json")
+
+    def _remove(self, key):
+        self._bytes -= self._index.pop(key, 0)
+        self._parsed.pop(key, None)
+        try:
+            os.remove(self._file(key))
+        except OSError:
+            pass
+
+    def _load(self, key):
+        if key not in self._index:
+            return None
+        try:
+            with open(self._file(key), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._remove(key)
+            return None
+        self._index.move_to_end(key)
+        os.utime(self._file(key))
+        return entry
+
+    def _store(self, key, res):
+        entry = {
+            "etag": res.headers["ETag"],
+            "headers": dict(res.headers),
+            "encoding": res.encoding,
+            "body": res.content.decode(res.encoding or "utf-8"),
+        }
+        data = json.dumps(entry)
+        with open(self._file(key), "w") as f:
+            f.write(data)
+        self._bytes += len(data) - self._index.get(key, 0)
+        self._index[key] = len(data)
+        self._index.move_to_end(key)
+        self._parsed.pop(key, None)
+        while self._bytes > self.max_bytes and len(self._index) > 1:
+            self._remove(next(iter(self._index)))
+            self.evictions += 1
+
+    def _json(self, key, res):
+        def json_from_cache(**kwargs):
+            with self._lock:
+                if key in self._parsed:
+                    self._parsed.move_to_end(key)
+                    return self._parsed[key]
+            data = json.loads(res.text, **kwargs)
+            with self._lock:
+                self._parsed[key] = data
+                while len(self._parsed) > PARSED_MAX_ENTRIES:
+                    self._parsed.popitem(last=False)
+            return data
+
+        return json_from_cache
+
+    def _cached(self, method, url):
+        return method.upper() == "GET" and (
+            self.hosts is None or urlparse(url).netloc in self.hosts
+        )
+
+    def _prepare(self, url, kwargs):
+        """Cache key and entry of a request, with its If-None-Match header."""
+        # The key depends on the final URL (with params)
+        request = requests.Request(
+            "GET", url, params=kwargs.get("params"), headers=kwargs.get("headers")
+        ).prepare()
+        key = self.get_key(request)
+        with self._lock:
+            entry = self._load(key)
+        headers = {**(kwargs.get("headers") or {})}
+        if entry is not None and "If-None-Match" not in headers:
+            headers["If-None-Match"] = entry["etag"]
+        return key, entry, {**kwargs, "headers": headers}
+
+    def _complete(self, key, entry, res):
+        with self._lock:
+            if res.status_code == 304 and entry is not None:
+                self.hits += 1
+                res.status_code = 200
+                headers = CaseInsensitiveDict(entry["headers"])
+                headers.update(res.headers)
+                res.headers = headers
+                res.encoding = entry["encoding"]
+                res._content = entry["body"].encode(entry["encoding"] or "utf-8")
+                res.json = self._json(key, res)
+            else:
+                self.misses += 1
+                if res.status_code == 200 and "ETag" in res.headers:
+                    self._store(key, res)
+        return res
+
+    def __call__(self, send, method, url, **kwargs):
+        if not self._cached(method, url):
+            return send(method, url, **kwargs)
+        key, entry, kwargs = self._prepare(url, kwargs)
+        return self._complete(key, entry, send(method, url, **kwargs))
+
+    async def asend(self, send, method, url, **kwargs):
+        """Async twin of the middleware."""
+        if not self._cached(method, url):
+            return await send(method, url, **kwargs)
+        key, entry, kwargs = self._prepare(url, kwargs)
+        return self._complete(key, entry, await send(method, url, **kwargs))
+
+
+class TTLCache:
+    """
+    Values cached on disk by endpoint and key (ex: "profile.identity" and a
+    LinkedIn public id) for a time to live per endpoint, in a SQLite file
+    that several processes can share.
+
+    Parameters
+    ----------
+    path: str:
+        SQLite file storing the entries.
+    ttls: dict (default None):
+        Endpoint -> seconds an entry stays valid, None never expires.
+    default_ttl: float (default 86400):
+        Time to live of the endpoints missing from ttls.
+    """
+
+    def __init__(self, path, ttls=None, default_ttl=24 * 3600):
+        self.path = path
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        # Counters are shared by the threads of fan_out
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connection() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries (endpoint TEXT, key TEXT, "
+                "value TEXT, stored_at REAL, PRIMARY KEY (endpoint, key))"
+            )
+
+    def _connection(self):
+        # SQLite connections can't be shared between threads
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30)
+            # Readers don't block the writer of another process
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db = db
+        return db
+
+    def get(self, endpoint, key):
+        """Cached value, None when missing or expired."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value, stored_at FROM entries WHERE endpoint = ? AND key = ?",
+                (endpoint, key),
+            )
+            .fetchone()
+        )
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        if row is None or (ttl is not None and time.time() - row[1] > ttl):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, endpoint, key, value):
+        with self._connection() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (endpoint, key, json.dumps(value, default=str), time.time()),
+            )
+
+    def fetch(self, endpoint, key, fetch, mode="use"):
+        """
+        Return the value of key, calling fetch() when it is not cached.
+
+        Parameters
+        ----------
+        mode: str (default "use"):
+            "use" the cached value when valid, "refresh" it with fetch() or
+            "bypass" the cache.
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode {mode!r}, use one of {CACHE_MODES}")
+        if mode == "use":
+            value = self.get(endpoint, key)
+            if value is not None:
+                return value
+        value = fetch()
+        if mode != "bypass":
+            self.set(endpoint, key, value)
+        return value
+
+    def clear(self, endpoint=None):
+        with self._connection() as db:
+            if endpoint is None:
+                db.execute("DELETE FROM entries")
+            else:
+                db.execute("DELETE FROM entries WHERE endpoint = ?", (endpoint,))
+
+    def stats(self):
+        entries = self._connection().execute("SELECT COUNT(*) FROM entries")
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        return {"hits": hits, "misses": misses, "entries": entries.fetchone()[0]}
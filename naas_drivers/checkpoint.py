@@ -0,0 +1,109 @@
+import json
+import os
+
+CHECKPOINT_PATH = "naas_checkpoints"
+CHECKPOINT_EVERY = 10
+
+
+class Checkpoint:
+    """
+    Progress of a long paginated extraction: the paginator position and the
+    records it yielded, saved every `every` pages and when the extraction
+    fails, to resume it instead of starting over.
+
+    Records are appended to `<key>.records.jsonl`, the position is written
+    to `<key>.state.json` once they are on disk.
+
+    Parameters
+    ----------
+    key: str:
+        Name of the extraction, ex: "hubspot-contacts".
+    path: str (default "naas_checkpoints"):
+        Directory storing the checkpoints.
+    every: int (default 10):
+        Pages between two saves.
+    """
+
+    def __init__(self, key, path=CHECKPOINT_PATH, every=CHECKPOINT_EVERY):
+        self.key = "".join(c if c.isalnum() or c in "-_." else "__" for c in key)
+        self.path = path
+        self.every = every
+        os.makedirs(path, exist_ok=True)
+
+    @property
+    def state_file(self):
+        return os.path.join(self.path, f"{self.key}.state.json")
+
+    @property
+    def records_file(self):
+        return os.path.join(self.path, f"{self.key}.records.jsonl")
+
+    def load(self):
+        """Return the saved state (None without checkpoint) and records."""
+        self.saved_records, self.saved_bytes = 0, 0
+        try:
+            with open(self.state_file, "r") as f:
+                state = json.load(f)
+            with open(self.records_file, "rb") as f:
+                # Lines written after the last state are not part of it
+                data = f.read(state["bytes"])
+        except (OSError, ValueError):
+            return None, []
+        self.saved_records, self.saved_bytes = state["records"], state["bytes"]
+        records = [json.loads(line) for line in data.splitlines()]
+        return state["paginator"], records
+
+    def save(self, state, records):
+        """Append records to the saved ones and store the position."""
+        data = "".join(json.dumps(r, default=str) + "\n" for r in records).encode()
+        with open(self.records_file, "ab") as f:
+            f.truncate(self.saved_bytes)
+            f.write(data)
+        self.saved_records += len(records)
+        self.saved_bytes += len(data)
+        tmp = f"{self.state_file}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(
+                {
+                    "paginator": state,
+                    "records": self.saved_records,
+                    "bytes": self.saved_bytes,
+                },
+                f,
+            )
+        os.replace(tmp, self.state_file)
+
+    def clear(self):
+        for file in (self.state_file, self.records_file):
+            if os.path.exists(file):
+                os.remove(file)
+
+    def iterate(self, paginator, resume=False):
+        """
+        Iterate over the pages of paginator, saving progress as they come.
+        With resume, the saved records come first as one page and the
+        paginator continues from the saved position.
+        Call clear() once the extraction is complete.
+        """
+        state, records = self.load() if resume else (None, [])
+        if state is None:
+            self.clear()
+            self.saved_records, self.saved_bytes = 0, 0
+        else:
+            paginator.restore(state)
+            if len(records) > 0:
+                yield records
+        pending = []
+        pages = 0
+        try:
+            for records in paginator:
+                pending.extend(records)
+                pages += 1
+                yield records
+                if pages % self.every == 0:
+                    self.save(paginator.state(), pending)
+                    pending = []
+        except BaseException:
+            # Failed or stopped: keep what was fetched for the next run
+            self.save(paginator.state(), pending)
+            raise
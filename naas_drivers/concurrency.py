@@ -0,0 +1,91 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+MAX_IN_FLIGHT = 10
+
+
+def fan_out(func, items, max_in_flight=MAX_IN_FLIGHT):
+    """
+    Call func on every item with at most `max_in_flight` calls running at once.
+    Results are returned in the order of items, the first exception raised by
+    func is raised again.
+
+    Parameters
+    ----------
+    func: callable:
+        Function called with one item.
+    items: iterable:
+        Items to process.
+    max_in_flight: int (default 10):
+        Maximum number of concurrent calls, 1 runs them one by one.
+    """
+    items = list(items)
+    if max_in_flight <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_in_flight, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def fan_out_iter(func, items, max_in_flight=MAX_IN_FLIGHT):
+    """
+    Lazy fan_out: yield the results in the order of items, keeping at most
+    `max_in_flight` calls running ahead of the consumer.
+
+    Parameters
+    ----------
+    func: callable:
+        Function called with one item.
+    items: iterable:
+        Items to process, consumed as results are yielded.
+    max_in_flight: int (default 10):
+        Maximum number of concurrent calls, 1 runs them one by one.
+    """
+    items = iter(items)
+    if max_in_flight <= 1:
+        for item in items:
+            yield func(item)
+        return
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        futures = deque(
+            executor.submit(func, item) for item in islice(items, max_in_flight)
+        )
+        try:
+            while len(futures) > 0:
+                result = futures.popleft().result()
+                for item in islice(items, 1):
+                    futures.append(executor.submit(func, item))
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+async def afan_out_iter(func, items, max_in_flight=MAX_IN_FLIGHT):
+    """
+    Async twin of fan_out_iter: await func(item) for every item as tasks of
+    the running event loop, yield the results in the order of items.
+
+    Parameters
+    ----------
+    func: coroutine function:
+        Function called with one item.
+    items: iterable:
+        Items to process, consumed as results are yielded.
+    max_in_flight: int (default 10):
+        Maximum number of concurrent calls, 1 runs them one by one.
+    """
+    items = iter(items)
+    tasks = deque(
+        asyncio.ensure_future(func(item)) for item in islice(items, max_in_flight)
+    )
+    try:
+        while len(tasks) > 0:
+            result = await tasks.popleft()
+            for item in islice(items, 1):
+                tasks.append(asyncio.ensure_future(func(item)))
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
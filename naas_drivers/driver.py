@@ -1,16 +1,303 @@
-import pandas as pd
+import asyncio
+import functools
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from naas_drivers.aio import AsyncTransport
+from naas_drivers.instrumentation import current_driver, instrumentation
+from naas_drivers.retry import MAX_RETRIES, Retry
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 basic_text = "Not defined, it should to allow user to connect"
 key_text = "Connect key missing"
 basic_error = "Not defined, it should return a Dataframe"
 connect_error = "You should connect first"
 
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 10
+
+
+class HTTPSession(requests.Session):
+    """
+    requests.Session keeping TCP/TLS connections alive between calls.
+
+    Parameters
+    ----------
+    pool_connections: int (default 10):
+        Number of hosts kept in the connection pool.
+    pool_maxsize: int (default 10):
+        Number of connections kept open per host.
+    timeout: float or tuple (default None):
+        Timeout applied to every request not setting its own.
+    headers: dict (default None):
+        Headers sent with every request.
+    middlewares: list (default None):
+        Callables wrapping every request, first one outermost.
+        Called as middleware(send, method, url, **kwargs) and returning the
+        response, usually by calling send(method, url, **kwargs).
+    name: str (default None):
+        Driver using the session, requests are counted under this name when
+        naas_drivers.instrumentation is enabled.
+    httpx_transport: httpx.AsyncBaseTransport (default None):
+        Transport of the async requests, ex: httpx.MockTransport.
+
+    The async twins of the request methods (arequest, aget, apost, ...) send
+    requests with httpx on the running event loop, through the same headers
+    and middlewares, with the pool size of the session. Middlewares need an
+    async twin: an `asend` method or a coroutine function.
+    """
+
+    def __init__(
+        self,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        timeout=None,
+        headers=None,
+        middlewares=None,
+        name=None,
+        httpx_transport=None,
+    ):
+        super().__init__()
+        self.timeout = timeout
+        self.name = name
+        self.middlewares = list(middlewares or [])
+        self.async_transport = AsyncTransport(
+            max_connections=pool_connections * pool_maxsize,
+            max_keepalive_connections=pool_connections * pool_maxsize,
+            transport=httpx_transport,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        if headers:
+            self.headers.update(headers)
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        send = super().request
+        token = None
+        if instrumentation.enabled:
+            if self.name is not None:
+                token = current_driver.set(self.name)
+            send = functools.partial(self._instrumented, send)
+        for middleware in reversed(self.middlewares):
+            send = functools.partial(middleware, send)
+        try:
+            return send(method, url, **kwargs)
+        finally:
+            # Later calls of the caller are not counted under this driver
+            if token is not None:
+                current_driver.reset(token)
+
+    @staticmethod
+    def _instrumented(send, method, url, **kwargs):
+        # Innermost: every attempt is counted
+        start = time.perf_counter()
+        res = None
+        try:
+            res = send(method, url, **kwargs)
+            return res
+        finally:
+            elapsed = time.perf_counter() - start
+            instrumentation.request(method, url, res, elapsed, kwargs.get("stream"))
+
+    async def arequest(self, method, url, **kwargs):
+        """Async twin of request, needs httpx (pip install naas-drivers[async])."""
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        send = self._asend
+        token = None
+        if instrumentation.enabled:
+            if self.name is not None:
+                token = current_driver.set(self.name)
+            send = functools.partial(self._ainstrumented, send)
+        for middleware in reversed(self.middlewares):
+            send = functools.partial(get_async_middleware(middleware), send)
+        try:
+            return await send(method, url, **kwargs)
+        finally:
+            if token is not None:
+                current_driver.reset(token)
+
+    async def _asend(
+        self,
+        method,
+        url,
+        params=None,
+        data=None,
+        headers=None,
+        cookies=None,
+        files=None,
+        auth=None,
+        timeout=None,
+        allow_redirects=True,
+        json=None,
+        stream=None,
+        **kwargs,
+    ):
+        unsupported = [name for name, value in kwargs.items() if value is not None]
+        if len(unsupported) > 0:
+            raise TypeError(f"{unsupported} are not supported by async requests")
+        # Same merge of the session headers, cookies and auth as request()
+        request = self.prepare_request(
+            requests.Request(
+                method=method.upper(),
+                url=url,
+                headers=headers,
+                files=files,
+                data=data or {},
+                json=json,
+                params=params or {},
+                auth=auth,
+                cookies=cookies,
+            )
+        )
+        return await self.async_transport.send(request, timeout, allow_redirects)
+
+    @staticmethod
+    async def _ainstrumented(send, method, url, **kwargs):
+        start = time.perf_counter()
+        res = None
+        try:
+            res = await send(method, url, **kwargs)
+            return res
+        finally:
+            elapsed = time.perf_counter() - start
+            instrumentation.request(method, url, res, elapsed, kwargs.get("stream"))
+
+    async def aget(self, url, **kwargs):
+        return await self.arequest("GET", url, **kwargs)
+
+    async def apost(self, url, **kwargs):
+        return await self.arequest("POST", url, **kwargs)
+
+    async def aput(self, url, **kwargs):
+        return await self.arequest("PUT", url, **kwargs)
+
+    async def apatch(self, url, **kwargs):
+        return await self.arequest("PATCH", url, **kwargs)
+
+    async def adelete(self, url, **kwargs):
+        return await self.arequest("DELETE", url, **kwargs)
+
+    async def aclose(self):
+        """Close the async connections opened from the running event loop."""
+        await self.async_transport.aclose()
+
+
+def get_async_middleware(middleware):
+    """Async twin of a session middleware."""
+    asend = getattr(middleware, "asend", None)
+    if asend is not None:
+        return asend
+    if asyncio.iscoroutinefunction(middleware):
+        return middleware
+    raise TypeError(f"Middleware {middleware!r} has no async twin (asend)")
+
 
 class ConnectDriver:
 
     connected = False
     key = None
     raise_error = False
+    pool_connections = POOL_CONNECTIONS
+    pool_maxsize = POOL_MAXSIZE
+    timeout = None
+    max_retries = MAX_RETRIES
+    _session = None
+    # Threads of fan_out reaching the session first must create only one
+    _session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = HTTPSession(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        timeout=self.timeout,
+                        middlewares=[Retry(max_retries=self.max_retries)],
+                        name=type(self).__name__,
+                    )
+        return self._session
+
+    async def aclose(self):
+        """Close the async connections of the session in the running loop."""
+        if self._session is not None:
+            await self._session.aclose()
+
+    @property
+    def retry(self):
+        """Retry middleware of the session, its stats() count the retries."""
+        for middleware in self.session.middlewares:
+            if isinstance(middleware, Retry):
+                return middleware
+        return None
+
+    def configure_session(
+        self,
+        pool_connections=None,
+        pool_maxsize=None,
+        timeout=None,
+        headers=None,
+        max_retries=None,
+    ):
+        """
+        Replace the driver session with a new pool, keeping its headers and
+        middlewares.
+        Sub-clients created by connect() must be re-created to use it.
+
+        Parameters
+        ----------
+        pool_connections: int (default None):
+            Number of hosts kept in the connection pool.
+        pool_maxsize: int (default None):
+            Number of connections kept open per host.
+        timeout: float or tuple (default None):
+            Timeout applied to every request not setting its own.
+        headers: dict (default None):
+            Headers sent with every request, added to the current ones.
+        max_retries: int (default None):
+            Retries of transient failures (429, 5xx, network errors), 0 to
+            disable them.
+        """
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        if timeout is not None:
+            self.timeout = timeout
+        middlewares = [Retry(max_retries=self.max_retries)]
+        httpx_transport = None
+        if self._session is not None:
+            middlewares = self._session.middlewares
+            headers = {**self._session.headers, **(headers or {})}
+            httpx_transport = self._session.async_transport.transport
+            self._session.close()
+        if max_retries is not None:
+            self.max_retries = max_retries
+            middlewares = [m for m in middlewares if not isinstance(m, Retry)]
+            middlewares.insert(0, Retry(max_retries=max_retries))
+        self._session = HTTPSession(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            timeout=self.timeout,
+            headers=headers,
+            middlewares=middlewares,
+            name=type(self).__name__,
+            httpx_transport=httpx_transport,
+        )
+        return self
 
     def open_or_read(self, data):
         read_data = data
@@ -46,7 +333,12 @@ class InDriver(ConnectDriver):
     def convert_data_to_df(self, *args, **kwargs):
         return basic_error
 
-    def get(self, *args, **kwargs) -> pd.DataFrame:
+    def get(self, *args, **kwargs) -> "pd.DataFrame":
+        self.check_connect()
+        self.print_error(basic_error)
+
+    async def aget(self, *args, **kwargs) -> "pd.DataFrame":
+        """Async twin of get, sending its requests with session.arequest."""
         self.check_connect()
         self.print_error(basic_error)
 
@@ -56,3 +348,9 @@ class OutDriver(ConnectDriver):
         self.check_connect()
         self.print_error(basic_error)
         return basic_error
+
+    async def asend(self, *args, **kwargs):
+        """Async twin of send, sending its requests with session.arequest."""
+        self.check_connect()
+        self.print_error(basic_error)
+        return basic_error
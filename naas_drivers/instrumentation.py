@@ -0,0 +1,153 @@
+import contextvars
+import os
+import re
+import threading
+from urllib.parse import urlparse
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, float("inf"))
+COLUMNS = [
+    "DRIVER",
+    "ENDPOINT",
+    "REQUESTS",
+    "ERRORS",
+    "BYTES",
+    "LATENCY",
+    "LATENCY_MEAN",
+    "LATENCY_MAX",
+    *[f"LATENCY_LE_{b}S".replace("inf", "INF") for b in LATENCY_BUCKETS],
+    "RETRIES",
+    "RETRY_WAIT",
+    "RATE_LIMIT_WAIT",
+    "FRAMES",
+    "FRAME_ROWS",
+    "FRAME_TIME",
+]
+
+# Driver sending requests in the current thread, set by HTTPSession
+current_driver = contextvars.ContextVar("current_driver", default=None)
+
+_ID = re.compile(r"^[^/]*\d[^/]*$")
+
+
+def get_endpoint(url, method=None):
+    """Endpoint of a request, path segments holding digits become {id}."""
+    parts = urlparse(url)
+    path = "/".join(
+        "{id}" if _ID.match(segment) else segment for segment in parts.path.split("/")
+    )
+    endpoint = f"{parts.netloc}{path}"
+    return endpoint if method is None else f"{method.upper()} {endpoint}"
+
+
+class _Counters:
+    def __init__(self):
+        self.values = dict.fromkeys(COLUMNS[2:], 0)
+
+    def add(self, **values):
+        for name, value in values.items():
+            self.values[name] += value
+
+
+class Instrumentation:
+    """
+    Counters of the driver calls, per driver and endpoint: requests, errors,
+    bytes received, latency histogram, retries, rate limit waits and
+    DataFrame builds. Disabled by default (or with NAAS_DRIVERS_STATS=1),
+    a disabled instance costs one attribute check per event.
+
+    Hooks are called with every event as a dict, ex: to export them.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.hooks = []
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+        return self
+
+    def disable(self):
+        self.enabled = False
+        return self
+
+    def reset(self):
+        with self._lock:
+            self._counters = {}
+
+    def add_hook(self, hook):
+        """Call hook(event) on every event, event is a dict."""
+        self.hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook):
+        self.hooks.remove(hook)
+
+    def record(self, event, endpoint, driver=None, **values):
+        driver = driver or current_driver.get() or "unknown"
+        with self._lock:
+            counters = self._counters.get((driver, endpoint))
+            if counters is None:
+                counters = self._counters[(driver, endpoint)] = _Counters()
+            counters.add(**values)
+            if "LATENCY" in values:
+                latency = values["LATENCY"]
+                bucket = next(b for b in LATENCY_BUCKETS if latency <= b)
+                name = f"LATENCY_LE_{bucket}S".replace("inf", "INF")
+                counters.values[name] += 1
+                counters.values["LATENCY_MAX"] = max(
+                    counters.values["LATENCY_MAX"], latency
+                )
+        for hook in self.hooks:
+            hook({"event": event, "driver": driver, "endpoint": endpoint, **values})
+
+    def request(self, method, url, res, elapsed, stream=False):
+        size = 0
+        if res is not None:
+            size = res.headers.get("Content-Length")
+            if size is None and not stream:
+                size = len(res.content)
+        self.record(
+            "request",
+            get_endpoint(url, method),
+            REQUESTS=1,
+            ERRORS=int(res is None or res.status_code >= 400),
+            BYTES=int(size or 0),
+            LATENCY=elapsed,
+        )
+
+    def retry(self, method, url, wait):
+        self.record("retry", get_endpoint(url, method), RETRIES=1, RETRY_WAIT=wait)
+
+    def rate_limit_wait(self, method, url, wait):
+        self.record("rate_limit_wait", get_endpoint(url, method), RATE_LIMIT_WAIT=wait)
+
+    def frame(self, rows, elapsed):
+        self.record("frame", "DataFrame", FRAMES=1, FRAME_ROWS=rows, FRAME_TIME=elapsed)
+
+    def to_df(self):
+        import pandas as pd
+
+        with self._lock:
+            rows = [
+                {"DRIVER": driver, "ENDPOINT": endpoint, **counters.values}
+                for (driver, endpoint), counters in self._counters.items()
+            ]
+        df = pd.DataFrame(rows, columns=COLUMNS)
+        df["LATENCY_MEAN"] = df["LATENCY"] / df["REQUESTS"].where(df["REQUESTS"] > 0)
+        return df.sort_values(["DRIVER", "ENDPOINT"]).reset_index(drop=True)
+
+
+instrumentation = Instrumentation(enabled=bool(os.environ.get("NAAS_DRIVERS_STATS")))
+enable = instrumentation.enable
+disable = instrumentation.disable
+reset = instrumentation.reset
+add_hook = instrumentation.add_hook
+remove_hook = instrumentation.remove_hook
+
+
+def stats():
+    """Counters of the driver calls since the start (or reset) as a DataFrame."""
+    return instrumentation.to_df()
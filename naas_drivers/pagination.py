@@ -0,0 +1,471 @@
+import asyncio
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from naas_drivers.accumulator import FrameAccumulator
+from naas_drivers.concurrency import afan_out_iter, fan_out_iter
+
+
+class Paginator:
+    """
+    Iterable over the record batches (one list per API page) of an endpoint.
+    Iteration stops on the first empty page or once `limit` records are yielded.
+    Also iterable with `async for` when given an async fetch function
+    (`afetch`), pages are then fetched on the running event loop.
+    Its position is advanced before a page is yielded: state() taken between
+    two pages resumes with the next one (see naas_drivers.checkpoint).
+
+    Parameters
+    ----------
+    limit: int (default -1, unlimited=-1):
+        Maximum number of records yielded.
+    wait: callable (default None):
+        Called before fetching every page but the first one (throttling).
+    """
+
+    # Attributes saved by state(), set by subclasses
+    position = ()
+
+    def __init__(self, limit=-1, wait=None):
+        self.limit = limit
+        self.wait = wait
+        self.yielded = 0
+        self.done = False
+
+    def pages(self):
+        raise NotImplementedError
+
+    def apages(self):
+        """Async twin of pages."""
+        raise NotImplementedError
+
+    def remaining(self, count):
+        if self.limit == -1:
+            return count
+        return max(min(count, self.limit - self.yielded), 0)
+
+    def state(self):
+        """Position after the last page yielded, JSON serializable."""
+        state = {"yielded": self.yielded, "done": self.done}
+        for name in self.position:
+            state[name] = getattr(self, name)
+        return state
+
+    def restore(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        return self
+
+    def __iter__(self):
+        for records in self.pages():
+            if records is None or len(records) == 0:
+                break
+            if self.limit != -1:
+                records = records[: self.limit - self.yielded]
+            self.yielded += len(records)
+            yield records
+            if self.limit != -1 and self.yielded >= self.limit:
+                break
+
+    async def __aiter__(self):
+        async for records in self.apages():
+            if records is None or len(records) == 0:
+                break
+            if self.limit != -1:
+                records = records[: self.limit - self.yielded]
+            self.yielded += len(records)
+            yield records
+            if self.limit != -1 and self.yielded >= self.limit:
+                break
+
+    def _wait(self, first):
+        if not first and self.wait is not None:
+            self.wait()
+
+    async def _await(self, first):
+        if not first and self.wait is not None:
+            if asyncio.iscoroutinefunction(self.wait):
+                await self.wait()
+            else:
+                self.wait()
+
+    def records(self):
+        for records in self:
+            yield from records
+
+    def to_df(self, columns=None, dtypes=None):
+        acc = FrameAccumulator(columns=columns, dtypes=dtypes)
+        for records in self:
+            acc.extend(records)
+        return acc.to_df()
+
+    async def ato_df(self, columns=None, dtypes=None):
+        acc = FrameAccumulator(columns=columns, dtypes=dtypes)
+        async for records in self:
+            acc.extend(records)
+        return acc.to_df()
+
+
+class CursorPaginator(Paginator):
+    """
+    Follow the opaque cursor (or page token) returned by each response.
+
+    Parameters
+    ----------
+    fetch: callable:
+        fetch(cursor) -> response data. cursor is None for the first page.
+    get_records: callable:
+        get_records(data) -> list of records.
+    get_cursor: callable:
+        get_cursor(data) -> next cursor, None when there is no next page.
+    cursor: str (default None):
+        Cursor to start from.
+    afetch: coroutine function (default None):
+        Async twin of fetch.
+    """
+
+    position = ("cursor",)
+
+    def __init__(
+        self, fetch, get_records, get_cursor, cursor=None, afetch=None, **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.fetch = fetch
+        self.get_records = get_records
+        self.get_cursor = get_cursor
+        self.cursor = cursor
+        self.afetch = afetch
+
+    def _next(self, data):
+        records = self.get_records(data)
+        # Iteration stops on empty pages, their cursor is not read
+        cursor = self.get_cursor(data) if records else None
+        if cursor is None:
+            self.done = True
+        else:
+            self.cursor = cursor
+        return records
+
+    def pages(self):
+        first = True
+        while not self.done:
+            self._wait(first)
+            first = False
+            yield self._next(self.fetch(self.cursor))
+
+    async def apages(self):
+        if self.afetch is None:
+            raise TypeError(f"{type(self).__name__} has no async fetch (afetch)")
+        first = True
+        while not self.done:
+            await self._await(first)
+            first = False
+            yield self._next(await self.afetch(self.cursor))
+
+
+# Page tokens (YouTube, Twitter, ...) are cursors under another name.
+TokenPaginator = CursorPaginator
+
+
+class OffsetPaginator(Paginator):
+    """
+    Walk an endpoint with start/count parameters.
+
+    Parameters
+    ----------
+    fetch: callable:
+        fetch(start, count) -> list of records.
+    start: int (default 0):
+        Offset of the first record.
+    count: int (default 100):
+        Number of records requested per page.
+    stop_short: bool (default False):
+        Stop when a page returns less than `count` records.
+    afetch: coroutine function (default None):
+        Async twin of fetch.
+    """
+
+    position = ("start",)
+
+    def __init__(
+        self, fetch, start=0, count=100, stop_short=False, afetch=None, **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.fetch = fetch
+        self.start = start
+        self.count = count
+        self.stop_short = stop_short
+        self.afetch = afetch
+
+    def pages(self):
+        first = True
+        while not self.done:
+            count = self.remaining(self.count)
+            if count == 0:
+                return
+            self._wait(first)
+            first = False
+            records = self.fetch(self.start, count)
+            self.start += count
+            if self.stop_short and len(records) < count:
+                self.done = True
+            yield records
+
+    async def apages(self):
+        if self.afetch is None:
+            raise TypeError(f"{type(self).__name__} has no async fetch (afetch)")
+        first = True
+        while not self.done:
+            count = self.remaining(self.count)
+            if count == 0:
+                return
+            await self._await(first)
+            first = False
+            records = await self.afetch(self.start, count)
+            self.start += count
+            if self.stop_short and len(records) < count:
+                self.done = True
+            yield records
+
+
+class PageNumberPaginator(Paginator):
+    """
+    Walk an endpoint page by page.
+
+    Parameters
+    ----------
+    fetch: callable:
+        fetch(page) -> response data.
+    get_records: callable (default identity):
+        get_records(data) -> list of records.
+    get_next_page: callable (default page + 1):
+        get_next_page(data, page) -> next page number, None on the last page.
+    page: int (default 1):
+        First page fetched.
+    get_total_pages: callable (default None):
+        get_total_pages(data) -> number of pages. When known, the pages after
+        the first one are fetched concurrently.
+    max_in_flight: int (default 1):
+        Maximum number of pages fetched at once when the total is known.
+    afetch: coroutine function (default None):
+        Async twin of fetch.
+    """
+
+    position = ("page",)
+
+    def __init__(
+        self,
+        fetch,
+        get_records=None,
+        get_next_page=None,
+        page=1,
+        get_total_pages=None,
+        max_in_flight=1,
+        afetch=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.fetch = fetch
+        self.afetch = afetch
+        self.get_records = get_records or (lambda data: data)
+        self.get_next_page = get_next_page or (lambda data, page: page + 1)
+        self.page = page
+        self.get_total_pages = get_total_pages
+        self.max_in_flight = max_in_flight
+
+    def _concurrent(self, first, data):
+        """Total number of pages if the next ones can be fetched at once."""
+        if (
+            first
+            and self.page is not None
+            and self.get_total_pages is not None
+            and self.max_in_flight > 1
+        ):
+            return self.get_total_pages(data) or 0
+        return None
+
+    def pages(self):
+        first = True
+        while self.page is not None:
+            self._wait(first)
+            data = self.fetch(self.page)
+            self.page = self.get_next_page(data, self.page)
+            yield self.get_records(data)
+            total_pages = self._concurrent(first, data)
+            if total_pages is not None:
+                yield from self.__concurrent_pages(total_pages)
+                return
+            first = False
+
+    def __concurrent_pages(self, total_pages):
+        def fetch(page):
+            self._wait(False)
+            return self.fetch(page)
+
+        pages = range(self.page, total_pages + 1)
+        for page, data in zip(pages, fan_out_iter(fetch, pages, self.max_in_flight)):
+            self.page = page + 1 if page < total_pages else None
+            yield self.get_records(data)
+        self.page = None
+
+    async def apages(self):
+        if self.afetch is None:
+            raise TypeError(f"{type(self).__name__} has no async fetch (afetch)")
+        first = True
+        while self.page is not None:
+            await self._await(first)
+            data = await self.afetch(self.page)
+            self.page = self.get_next_page(data, self.page)
+            yield self.get_records(data)
+            total_pages = self._concurrent(first, data)
+            if total_pages is not None:
+                async for records in self.__aconcurrent_pages(total_pages):
+                    yield records
+                return
+            first = False
+
+    async def __aconcurrent_pages(self, total_pages):
+        async def fetch(page):
+            await self._await(False)
+            return await self.afetch(page)
+
+        pages = range(self.page, total_pages + 1)
+        async for data in afan_out_iter(fetch, pages, self.max_in_flight):
+            self.page = self.page + 1 if self.page < total_pages else None
+            yield self.get_records(data)
+        self.page = None
+
+
+class LinkHeaderPaginator(Paginator):
+    """
+    Follow the rel="next" URL of the Link header (GitHub style).
+
+    Parameters
+    ----------
+    session: requests.Session:
+        Session used to send requests, an HTTPSession for `async for`.
+    url: str:
+        URL of the first page.
+    params: dict (default None):
+        Query parameters of the first page, next URLs already carry them.
+    headers: dict (default None):
+        Headers sent with every request.
+    get_records: callable (default res.json()):
+        get_records(res) -> list of records.
+    max_in_flight: int (default 1):
+        Maximum number of pages fetched at once. When the first response
+        links the last page, the following ones are fetched concurrently.
+    """
+
+    position = ("url", "params")
+
+    def __init__(
+        self,
+        session,
+        url,
+        params=None,
+        headers=None,
+        get_records=None,
+        max_in_flight=1,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.session = session
+        self.url = url
+        self.params = params
+        self.headers = headers
+        self.get_records = get_records or (lambda res: res.json())
+        self.max_in_flight = max_in_flight
+
+    def get(self, url, params=None):
+        res = self.session.get(url, params=params, headers=self.headers)
+        res.raise_for_status()
+        return res
+
+    async def aget(self, url, params=None):
+        res = await self.session.aget(url, params=params, headers=self.headers)
+        res.raise_for_status()
+        return res
+
+    def _next(self, res, first):
+        """Follow the Link header, return the URL of the last page if the
+        next ones can be fetched at once."""
+        self.params = None
+        self.url = res.links.get("next", {}).get("url")
+        last = res.links.get("last", {}).get("url")
+        if (
+            first
+            and self.max_in_flight > 1
+            and _page_number(self.url) is not None
+            and _page_number(last) is not None
+        ):
+            return last
+        return None
+
+    def pages(self):
+        first = True
+        while self.url is not None:
+            self._wait(first)
+            # Next URLs already carry the query parameters
+            res = self.get(self.url, params=self.params)
+            last = self._next(res, first)
+            yield self.get_records(res)
+            if last is not None:
+                yield from self.__concurrent_pages(self.url, last)
+                return
+            first = False
+
+    def __concurrent_pages(self, next_url, last_url):
+        def fetch(url):
+            self._wait(False)
+            return self.get(url)
+
+        urls = _page_urls(next_url, last_url)
+        for i, res in enumerate(fan_out_iter(fetch, urls, self.max_in_flight)):
+            self.url = urls[i + 1] if i + 1 < len(urls) else None
+            yield self.get_records(res)
+
+    async def apages(self):
+        first = True
+        while self.url is not None:
+            await self._await(first)
+            res = await self.aget(self.url, params=self.params)
+            last = self._next(res, first)
+            yield self.get_records(res)
+            if last is not None:
+                async for records in self.__aconcurrent_pages(self.url, last):
+                    yield records
+                return
+            first = False
+
+    async def __aconcurrent_pages(self, next_url, last_url):
+        async def fetch(url):
+            await self._await(False)
+            return await self.aget(url)
+
+        urls = _page_urls(next_url, last_url)
+        i = 0
+        async for res in afan_out_iter(fetch, urls, self.max_in_flight):
+            i += 1
+            self.url = urls[i] if i < len(urls) else None
+            yield self.get_records(res)
+
+
+def _page_urls(next_url, last_url):
+    # GitHub numbers its pages: build the remaining URLs from "next"
+    parts = urlparse(next_url)
+    query = parse_qs(parts.query)
+    urls = []
+    for page in range(_page_number(next_url), _page_number(last_url) + 1):
+        query["page"] = [str(page)]
+        urls.append(parts._replace(query=urlencode(query, doseq=True)).geturl())
+    return urls
+
+
+def _page_number(url):
+    # "page" query parameter of a URL, None when absent (per_page is not one)
+    if not url:
+        return None
+    page = parse_qs(urlparse(url).query).get("page")
+    if not page or not page[0].isdigit():
+        return None
+    return int(page[0])
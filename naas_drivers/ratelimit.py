@@ -0,0 +1,195 @@
+import asyncio
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+from naas_drivers.instrumentation import instrumentation
+
+THROTTLE_STATUSES = (429, 999)
+
+
+def parse_retry_after(value):
+    """Seconds of a Retry-After header, None if missing or given as a date."""
+    try:
+        return max(float(value), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket letting `rate` calls per second through, with bursts of up
+    to `burst` calls. The rate adapts to the upstream (AIMD): it grows by
+    `increase` after every accepted call up to `max_rate`, and is multiplied
+    by `decrease` every time the upstream throttles, down to `min_rate`.
+
+    Parameters
+    ----------
+    rate: float:
+        Calls per second at start.
+    burst: int (default 1):
+        Calls allowed back to back after an idle period.
+    max_rate: float (default rate):
+        Highest rate reached by the additive increase.
+    min_rate: float (default rate / 10):
+        Lowest rate reached by the multiplicative decrease.
+    increase: float (default 0):
+        Rate added after every accepted call.
+    decrease: float (default 0.5):
+        Factor applied to the rate when throttled.
+    jitter: float (default 0):
+        Waits are stretched by up to this fraction of an interval, at random.
+    """
+
+    def __init__(
+        self,
+        rate,
+        burst=1,
+        max_rate=None,
+        min_rate=None,
+        increase=0.0,
+        decrease=0.5,
+        jitter=0.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+        asleep=asyncio.sleep,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_rate = rate if max_rate is None else max_rate
+        self.min_rate = rate / 10 if min_rate is None else min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.jitter = jitter
+        self.clock = clock
+        self.sleep = sleep
+        self.asleep = asleep
+        self.tokens = burst
+        self.updated = clock()
+        self.blocked_until = 0
+        self.throttles = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = max(now - self.updated, 0)
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def _take(self):
+        """Take one token, return the seconds to wait before using it."""
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            # Tokens go negative: concurrent callers queue one interval apart
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate, self.blocked_until - now, 0)
+            if wait > 0 and self.jitter > 0:
+                wait += random.uniform(0, self.jitter / self.rate)
+            self.waited += wait
+        return wait
+
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        wait = self._take()
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    async def aacquire(self):
+        """Async twin of acquire."""
+        wait = self._take()
+        if wait > 0:
+            await self.asleep(wait)
+        return wait
+
+    def succeeded(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def throttled(self, retry_after=None):
+        """Slow down after a rejected call, and pause for `retry_after` seconds."""
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self.throttles += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.tokens = min(self.tokens, 0)
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+    def stats(self):
+        return {"rate": self.rate, "throttles": self.throttles, "waited": self.waited}
+
+
+class RateLimiter:
+    """
+    Session middleware pacing requests with token buckets, one per policy.
+
+    Policies are keyed by host ("www.linkedin.com") or host and path prefix
+    ("api.hubapi.com/crm/v3"), the longest matching key applies and other
+    requests are not paced. Responses with a status in `throttle_statuses`
+    slow the bucket down and pause it for their Retry-After.
+
+    Parameters
+    ----------
+    policies: dict:
+        Key -> TokenBucket, or dict of TokenBucket parameters.
+        The same bucket can be shared by several keys.
+    throttle_statuses: tuple (default (429, 999)):
+        Statuses meaning the upstream throttles the client.
+    """
+
+    def __init__(self, policies, throttle_statuses=THROTTLE_STATUSES):
+        self.buckets = {
+            key.rstrip("/"): (
+                bucket if isinstance(bucket, TokenBucket) else TokenBucket(**bucket)
+            )
+            for key, bucket in policies.items()
+        }
+        self.throttle_statuses = throttle_statuses
+
+    def get_bucket(self, url):
+        parts = urlparse(url)
+        target = f"{parts.netloc}{parts.path}"
+        matches = [
+            key
+            for key in self.buckets
+            if target == key or target.startswith(f"{key}/") or key == parts.netloc
+        ]
+        if len(matches) == 0:
+            return None
+        return self.buckets[max(matches, key=len)]
+
+    def stats(self):
+        return {key: bucket.stats() for key, bucket in self.buckets.items()}
+
+    def _update(self, bucket, res):
+        if res.status_code in self.throttle_statuses:
+            bucket.throttled(parse_retry_after(res.headers.get("Retry-After")))
+        else:
+            bucket.succeeded()
+
+    def __call__(self, send, method, url, **kwargs):
+        bucket = self.get_bucket(url)
+        if bucket is None:
+            return send(method, url, **kwargs)
+        wait = bucket.acquire()
+        if wait > 0 and instrumentation.enabled:
+            instrumentation.rate_limit_wait(method, url, wait)
+        res = send(method, url, **kwargs)
+        self._update(bucket, res)
+        return res
+
+    async def asend(self, send, method, url, **kwargs):
+        """Async twin of the middleware."""
+        bucket = self.get_bucket(url)
+        if bucket is None:
+            return await send(method, url, **kwargs)
+        wait = await bucket.aacquire()
+        if wait > 0 and instrumentation.enabled:
+            instrumentation.rate_limit_wait(method, url, wait)
+        res = await send(method, url, **kwargs)
+        self._update(bucket, res)
+        return res
@@ -0,0 +1,170 @@
+import asyncio
+import random
+import threading
+import time
+
+import requests
+
+from naas_drivers.instrumentation import instrumentation
+from naas_drivers.ratelimit import parse_retry_after
+
+MAX_RETRIES = 3
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+
+class Retry:
+    """
+    Session middleware retrying transient failures with exponential back-off
+    and full jitter, waiting at least the Retry-After of the response.
+
+    Idempotent methods are retried on RETRY_STATUSES and network errors.
+    Other methods (POST, PATCH) are only retried when the server cannot have
+    processed them (429, connection timeout), unless they carry an
+    Idempotency-Key header.
+
+    Parameters
+    ----------
+    max_retries: int (default 3):
+        Retries of one request.
+    backoff: float (default 0.5):
+        First back-off in seconds, doubled on every retry.
+    max_backoff: float (default 60):
+        Longest back-off, a longer Retry-After returns the response as is.
+    budget: int (default None):
+        Retries allowed over the life of the middleware, unlimited if None.
+    statuses: tuple (default RETRY_STATUSES):
+        Statuses retried.
+    """
+
+    def __init__(
+        self,
+        max_retries=MAX_RETRIES,
+        backoff=0.5,
+        max_backoff=60,
+        budget=None,
+        statuses=RETRY_STATUSES,
+        sleep=time.sleep,
+        asleep=asyncio.sleep,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.budget = budget
+        self.statuses = statuses
+        self.sleep = sleep
+        self.asleep = asleep
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reset the counters, ex: at the start of a run."""
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.retried = 0
+            self.exhausted = 0
+            self.waited = 0.0
+            self.by_reason = {}
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "retried_requests": self.retried,
+                "exhausted": self.exhausted,
+                "waited": self.waited,
+                "by_reason": dict(self.by_reason),
+            }
+
+    def is_retryable(self, method, headers, res=None, error=None):
+        idempotent = method.upper() in IDEMPOTENT_METHODS or (
+            "Idempotency-Key" in (headers or {})
+        )
+        if error is not None:
+            return idempotent or isinstance(error, requests.ConnectTimeout)
+        if res.status_code not in self.statuses:
+            return False
+        return idempotent or res.status_code == 429
+
+    def get_delay(self, attempt, res=None):
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+        retry_after = None if res is None else res.headers.get("Retry-After")
+        retry_after = parse_retry_after(retry_after)
+        if retry_after is not None:
+            if retry_after > self.max_backoff:
+                return None
+            delay = max(delay, retry_after)
+        return delay
+
+    def _take(self, reason, delay):
+        """Spend one retry of the budget, False once it is empty."""
+        with self._lock:
+            if self.budget is not None and self.retries >= self.budget:
+                self.exhausted += 1
+                return False
+            self.retries += 1
+            self.waited += delay
+            self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+            return True
+
+    def _next_delay(self, attempt, method, url, headers, res, error):
+        """Delay before retrying the attempt, None to return its outcome."""
+        if error is not None:
+            retryable = self.is_retryable(method, headers, error=error)
+            reason = type(error).__name__
+        else:
+            retryable = self.is_retryable(method, headers, res=res)
+            reason = res.status_code
+        delay = self.get_delay(attempt, res) if retryable else None
+        if (
+            delay is None
+            or attempt == self.max_retries
+            or not self._take(reason, delay)
+        ):
+            if retryable and attempt == self.max_retries:
+                with self._lock:
+                    self.exhausted += 1
+            return None
+        if attempt == 0:
+            with self._lock:
+                self.retried += 1
+        if instrumentation.enabled:
+            instrumentation.retry(method, url, delay)
+        return delay
+
+    def __call__(self, send, method, url, **kwargs):
+        with self._lock:
+            self.requests += 1
+        for attempt in range(self.max_retries + 1):
+            res, error = None, None
+            try:
+                res = send(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            headers = kwargs.get("headers")
+            delay = self._next_delay(attempt, method, url, headers, res, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return res
+            self.sleep(delay)
+
+    async def asend(self, send, method, url, **kwargs):
+        """Async twin of the middleware."""
+        with self._lock:
+            self.requests += 1
+        for attempt in range(self.max_retries + 1):
+            res, error = None, None
+            try:
+                res = await send(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            headers = kwargs.get("headers")
+            delay = self._next_delay(attempt, method, url, headers, res, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return res
+            await self.asleep(delay)
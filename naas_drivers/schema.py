@@ -0,0 +1,95 @@
+import importlib.util
+
+import pandas as pd
+
+# Arrow backed strings take a fraction of the memory of object columns,
+# they need pandas >= 1.3 and pyarrow (pip install naas-drivers[parquet])
+PANDAS_VERSION = tuple(int(n) for n in pd.__version__.split(".")[:2])
+STRING = (
+    "string[pyarrow]"
+    if PANDAS_VERSION >= (1, 3) and importlib.util.find_spec("pyarrow") is not None
+    else "string"
+)
+
+SCHEMAS = {}
+
+
+def astype(df, dtypes, fill=None):
+    """
+    Convert the columns of df to dtypes in one pass.
+    "datetime" parses ISO 8601 values to UTC timestamps, "string" becomes
+    STRING, other dtypes go through DataFrame.astype.
+
+    Parameters
+    ----------
+    df: pd.DataFrame:
+        Frame to convert, columns missing from it are ignored.
+    dtypes: dict:
+        Column -> dtype.
+    fill: object (default None):
+        Value replacing missing strings and categories, kept missing if None.
+    """
+    converted = {}
+    for column, dtype in dtypes.items():
+        if column not in df.columns:
+            continue
+        values = df[column]
+        if dtype == "datetime":
+            converted[column] = pd.to_datetime(values, utc=True, errors="coerce")
+            continue
+        if dtype in ("string", "category") and fill is not None:
+            values = values.astype(object).fillna(fill)
+        if dtype == "string":
+            dtype = STRING
+        if values.dtype != dtype:
+            values = values.astype(dtype)
+        converted[column] = values
+    if len(converted) == 0:
+        return df
+    return df.assign(**converted)
+
+
+class Schema:
+    """
+    Declared columns and dtypes of the DataFrame returned by a getter,
+    registered under its name. Frames built with it (FrameAccumulator) get
+    the columns in order and typed at once, instead of object columns
+    converted afterwards.
+
+    Dtypes: "int64" ("Int64" when missing values are possible), "float64",
+    "bool" ("boolean" when missing values are possible), "category",
+    "string", "datetime" or "object".
+
+    Declared for GitHub issues, pulls, projects and commits, Qonto
+    transactions and LinkedIn followers. Getters returning the raw API fields
+    (HubSpot and Notion properties, Thinkific records) or strings only
+    (LinkedIn connections) still return object columns.
+
+    Parameters
+    ----------
+    name: str:
+        Name of the getter, ex: "github.issues".
+    columns: dict:
+        Column -> dtype, in the order of the DataFrame columns.
+    fill: object (default None):
+        Value replacing missing strings and categories.
+    """
+
+    def __init__(self, name, columns, fill=None):
+        self.name = name
+        self.dtypes = dict(columns)
+        self.fill = fill
+        SCHEMAS[name] = self
+
+    @property
+    def columns(self):
+        return list(self.dtypes)
+
+    def apply(self, df):
+        """Return df with the declared columns, in order, and dtypes."""
+        return astype(df.reindex(columns=self.columns), self.dtypes, self.fill)
+
+
+def get_schema(name):
+    """Registered schema of a getter, ex: get_schema("github.issues")."""
+    return SCHEMAS[name]
@@ -0,0 +1,137 @@
+import contextlib
+import csv
+import os
+
+from naas_drivers.accumulator import FrameAccumulator
+
+
+class RecordStream:
+    """
+    Iterable over the record batches of a paginated endpoint, without the
+    records already seen: only their keys are kept in memory, so exports
+    of any size run in constant memory when written with to_parquet or
+    to_csv.
+
+    Parameters
+    ----------
+    pages: iterable:
+        Record batches, ex: a paginator.
+    key: str (default "PROFILE_ID"):
+        Field identifying a record, None keeps duplicates. Records without
+        it are kept.
+    limit: int (default -1, unlimited=-1):
+        Maximum number of records yielded, duplicates excluded. No page is
+        fetched once it is reached.
+    """
+
+    def __init__(self, pages, key="PROFILE_ID", limit=-1):
+        self.pages = pages
+        self.key = key
+        self.limit = limit
+
+    def __iter__(self):
+        seen = set()
+        yielded = 0
+        for records in self.pages:
+            if self.key is not None:
+                unique = []
+                for record in records:
+                    value = record.get(self.key)
+                    if value is not None:
+                        if value in seen:
+                            continue
+                        seen.add(value)
+                    unique.append(record)
+                records = unique
+            if self.limit != -1:
+                records = records[: self.limit - yielded]
+            if len(records) > 0:
+                yielded += len(records)
+                yield records
+            if self.limit != -1 and yielded >= self.limit:
+                return
+
+    def records(self):
+        for records in self:
+            yield from records
+
+    def to_df(self, columns=None, dtypes=None, schema=None):
+        acc = FrameAccumulator(columns=columns, dtypes=dtypes, schema=schema)
+        for records in self:
+            acc.extend(records)
+        return acc.to_df()
+
+    def to_csv(self, path):
+        """
+        Write the records to a CSV file as they come, return their number.
+        Columns are the fields of the first record.
+        """
+        count = 0
+        with _replace(path, "w", newline="") as f:
+            writer = None
+            for records in self:
+                if writer is None:
+                    writer = csv.DictWriter(f, list(records[0]), extrasaction="ignore")
+                    writer.writeheader()
+                writer.writerows(records)
+                count += len(records)
+        return count
+
+    def to_parquet(self, path):
+        """
+        Write the records to a Parquet file, one row group per batch, return
+        their number. Columns and types are the ones of the first batch,
+        columns empty in it are strings.
+        Needs pyarrow (pip install naas-drivers[parquet]).
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        count = 0
+        schema = None
+        with _replace(path, "wb") as f:
+            writer = None
+            for records in self:
+                names = schema.names if schema is not None else list(records[0])
+                data = {name: [r.get(name) for r in records] for name in names}
+                if schema is None:
+                    schema = pa.Table.from_pydict(data).schema
+                    schema = pa.schema(
+                        (
+                            pa.field(field.name, pa.string())
+                            if pa.types.is_null(field.type)
+                            else field
+                        )
+                        for field in schema
+                    )
+                    writer = pq.ParquetWriter(f, schema)
+                writer.write_table(pa.Table.from_pydict(data, schema=schema))
+                count += len(records)
+            if writer is None:
+                pq.write_table(pa.table({}), f)
+            else:
+                writer.close()
+        return count
+
+    def write(self, path):
+        """Write the records to a .parquet or .csv file, return their number."""
+        if path.endswith(".parquet"):
+            return self.to_parquet(path)
+        if path.endswith(".csv"):
+            return self.to_csv(path)
+        raise ValueError(f"Unknown format of {path}, use .parquet or .csv")
+
+
+@contextlib.contextmanager
+def _replace(path, mode, **kwargs):
+    # Write then rename, a failed export keeps the previous file
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, mode, **kwargs) as f:
+            yield f
+    except BaseException:
+        # open() may have failed before creating it
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, path)
@@ -0,0 +1,99 @@
+import json
+import os
+import threading
+
+import pandas as pd
+
+SYNC_PATH = "naas_sync"
+
+
+class SyncStore:
+    """
+    Local state of incremental extractions: one watermark (last value seen,
+    usually an updated_at timestamp) and one Parquet snapshot per key.
+    Writing snapshots needs pyarrow (pip install naas-drivers[parquet]).
+
+    Parameters
+    ----------
+    path: str (default "naas_sync"):
+        Directory storing watermarks.json and the snapshots.
+    """
+
+    def __init__(self, path=SYNC_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    @property
+    def watermarks_file(self):
+        return os.path.join(self.path, "watermarks.json")
+
+    def snapshot_file(self, key):
+        name = "".join(c if c.isalnum() or c in "-_." else "__" for c in key)
+        return os.path.join(self.path, f"{name}.parquet")
+
+    def __read_watermarks(self):
+        try:
+            with open(self.watermarks_file, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get_watermark(self, key):
+        with self._lock:
+            return self.__read_watermarks().get(key)
+
+    def set_watermark(self, key, value):
+        with self._lock:
+            watermarks = self.__read_watermarks()
+            watermarks[key] = value
+            self.__write(self.watermarks_file, lambda f: json.dump(watermarks, f))
+
+    def read_snapshot(self, key):
+        file = self.snapshot_file(key)
+        if not os.path.exists(file):
+            return None
+        return pd.read_parquet(file)
+
+    def merge_snapshot(self, key, df, on, sort_by=None, ascending=False):
+        """
+        Merge new or updated rows into the snapshot and persist it.
+        Rows of df replace the snapshot rows with the same `on` values.
+
+        Parameters
+        ----------
+        key: str:
+            Snapshot key, ex: "jupyter-naas/drivers/issues".
+        df: pd.DataFrame:
+            Changed rows.
+        on: str or list:
+            Columns identifying a row.
+        sort_by: str or list (default None):
+            Columns the merged snapshot is sorted by.
+        ascending: bool (default False):
+            Sort order.
+        """
+        snapshot = self.read_snapshot(key)
+        if snapshot is None and len(df.columns) == 0:
+            return df
+        if snapshot is not None and len(snapshot) > 0:
+            if len(df) > 0:
+                df = pd.concat([snapshot, df], axis=0, ignore_index=True)
+            else:
+                df = snapshot
+        df = df.drop_duplicates(subset=on, keep="last")
+        if sort_by is not None and len(df) > 0:
+            df = df.sort_values(by=sort_by, ascending=ascending, kind="stable")
+        df = df.reset_index(drop=True)
+        self.__write(
+            self.snapshot_file(key), lambda f: df.to_parquet(f, index=False), "wb"
+        )
+        return df
+
+    @staticmethod
+    def __write(file, write, mode="w"):
+        # Write then rename, a failed run keeps the previous state
+        tmp = f"{file}.tmp"
+        with open(tmp, mode) as f:
+            write(f)
+        os.replace(tmp, file)
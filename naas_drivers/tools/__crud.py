@@ -1,5 +1,4 @@
 from naas_drivers.driver import ConnectDriver
-import requests
 
 
 class CRUD(ConnectDriver):
@@ -21,7 +20,7 @@ class CRUD(ConnectDriver):
 
     def get(self, uid):
         self.check_connect()
-        req = requests.get(
+        req = self.session.get(
             url=f"{self.base_public_url}/{self.endpoint}/{uid}",
             headers=self.req_headers,
             auth=self.key,
@@ -33,7 +32,7 @@ class CRUD(ConnectDriver):
 
     def send(self, data):
         self.check_connect()
-        req = requests.post(
+        req = self.session.post(
             url=f"{self.base_public_url}/{self.endpoint}",
             auth=self.key,
             headers=self.req_headers,
@@ -47,7 +46,7 @@ class CRUD(ConnectDriver):
     def update(self, data):
         self.check_connect()
         _id = data.get("_id")
-        req = requests.put(
+        req = self.session.put(
             url=f"{self.base_public_url}/{self.endpoint}/{_id}",
             auth=self.key,
             headers=self.req_headers,
@@ -61,7 +60,7 @@ class CRUD(ConnectDriver):
     def delete(self, data):
         self.check_connect()
         _id = data.get("_id")
-        req = requests.delete(
+        req = self.session.delete(
             url=f"{self.base_public_url}/{self.endpoint}/{_id}",
             auth=self.key,
             headers=self.req_headers,
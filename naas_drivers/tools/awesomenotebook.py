@@ -1,8 +1,6 @@
 from naas_drivers.driver import InDriver
-import requests
 import urllib.parse
 import traceback
-from IPython.core.display import display, Markdown
 
 
 class AwesomeNotebooks(InDriver):
@@ -52,7 +50,7 @@ KIDx1c2UgaWQ9Im4iIHhsaW5rOmhyZWY9IiNzdHJpbmciLz4KPC9zdmc+Cg=="""
         url = self.__api_url.replace("{REPO}", self.__repo).replace("{BRANCH}", branch)
         files_list = []
         try:
-            r = requests.get(url)
+            r = self.session.get(url)
             data = r.json()
             for ff in data.get("tree"):
                 path = ff.get("path")
@@ -89,6 +87,8 @@ KIDx1c2UgaWQ9Im4iIHhsaW5rOmhyZWY9IiNzdHJpbmciLz4KPC9zdmc+Cg=="""
         return self
 
     def badge(self, url):
+        from IPython.core.display import display, Markdown
+
         badge_url = self.__badge_base + self.__badge_appearance + self.__badge_logo
         redirect_url = self.__badge_link.replace("{DLURL}", url)
         html_content = f"""<a href="{redirect_url}" target="_parent">\n<img src="{badge_url}"/>\n</a>"""
@@ -96,6 +96,8 @@ KIDx1c2UgaWQ9Im4iIHhsaW5rOmhyZWY9IiNzdHJpbmciLz4KPC9zdmc+Cg=="""
         return html_content
 
     def get(self, md=True, open_in_naas=True, branch="master"):
+        from IPython.core.display import display, Markdown
+
         self.check_connect()
         if not md:
             return self.__get_file_list(branch)
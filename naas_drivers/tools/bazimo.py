@@ -1,8 +1,8 @@
-import requests
+from naas_drivers.driver import ConnectDriver
 import pandas as pd
 
 
-class Bazimo:
+class Bazimo(ConnectDriver):
     def connect(self, email: str, password: str):
 
         # Connect to Bazimo
@@ -13,7 +13,7 @@ class Bazimo:
             "password": f"{password}",
             "authenticationType": "bearer",
         }
-        res = requests.post(url, json=json)
+        res = self.session.post(url, json=json)
         res.raise_for_status()
         res_json = res.json()
         token = res_json.get("token")
@@ -22,7 +22,7 @@ class Bazimo:
         self.token = token
 
         # Init end point
-        self.exports = Exports(self.token)
+        self.exports = Exports(self.token, self.session)
 
         # Set connexion to active
         self.connected = True
@@ -30,8 +30,9 @@ class Bazimo:
 
 
 class Exports(Bazimo):
-    def __init__(self, token):
+    def __init__(self, token, session):
         Bazimo.__init__(self)
+        self._session = session
         self.token = token
 
     def get(self, name):
@@ -61,7 +62,7 @@ class Exports(Bazimo):
             f"https://bazimo-api.azurewebsites.net/api/tenant/app/exports?scope={scope}"
         )
         headers = {"Authorization": f"bearer {self.token}"}
-        res = requests.get(url, headers=headers)
+        res = self.session.get(url, headers=headers)
         res.raise_for_status()
 
         # Read Excel
@@ -1,7 +1,6 @@
 from naas_drivers.driver import InDriver, OutDriver
 from requests.auth import HTTPBasicAuth
 from .__crud import CRUD
-import requests
 import json
 import re
 import os
@@ -21,7 +20,7 @@ class Me(CRUD):
 
     def get(self):
         self.check_connect()
-        req = requests.get(
+        req = self.session.get(
             url=f"{self.base_public_url}/{self.endpoint}",
             headers=req_headers,
             auth=self.key,
@@ -33,7 +32,7 @@ class Me(CRUD):
 
     def update(self, data):
         self.check_connect()
-        req = requests.put(
+        req = self.session.put(
             url=f"{self.base_public_url}/{self.endpoint}",
             headers=req_headers,
             auth=self.key,
@@ -56,7 +55,7 @@ class CRUDBOB(CRUD):
         if sort:
             params["sort"] = json.dumps(sort)
         self.check_connect()
-        req = requests.get(
+        req = self.session.get(
             url=f"{self.base_public_url}/{self.endpoint}",
             params=params,
             headers=req_headers,
@@ -80,7 +79,7 @@ class SmartTable(CRUDBOB):
 
     def allowed(self):
         self.check_connect()
-        req = requests.post(
+        req = self.session.post(
             url=f"{self.base_public_url}/{self.endpoint}/allowed",
             auth=self.auth,
             headers=req_headers,
@@ -93,7 +92,7 @@ class SmartTable(CRUDBOB):
 
     def delete_all(self):
         self.check_connect()
-        req = requests.delete(
+        req = self.session.delete(
             url=f"{self.base_public_url}/{self.endpoint}/all",
             auth=self.auth,
             headers=req_headers,
@@ -301,7 +300,7 @@ class Users(CRUDBOB):
 
             # Create user on service ftp
             headers = {"X-Api-Key": AUTH_TOKEN_FTP}
-            r = requests.post(URI_FTP, json=login, headers=headers)
+            r = self.session.post(URI_FTP, json=login, headers=headers)
             if self.raise_error:
                 r.raise_for_status()
 
@@ -312,7 +311,7 @@ class Users(CRUDBOB):
 
             # Create user on service jupyter
             headers = {"Authorization": AUTH_TOKEN_JUP}
-            r = requests.post(URI_JUP, data=login, headers=headers)
+            r = self.session.post(URI_JUP, data=login, headers=headers)
             if self.raise_error:
                 r.raise_for_status()
 
@@ -1,5 +1,4 @@
 from naas_drivers.driver import OutDriver
-import requests
 
 
 class Bubble(OutDriver):
@@ -14,7 +13,7 @@ class Bubble(OutDriver):
     def send(self, url, data=None):
         self.check_connect()
         headers = {"Authorization": f"Bearer {self._key}"}
-        r = requests.post(
+        r = self.session.post(
             headers=headers,
             url=url,
             json=data,
@@ -1,3 +1,4 @@
+from naas_drivers.driver import ConnectDriver
 import pandas as pd
 import requests
 from datetime import datetime
@@ -7,14 +8,14 @@ DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 NUMBER_FORMAT = "{:,.2f} €"
 
 
-class BudgetInsight:
+class BudgetInsight(ConnectDriver):
     def connect(self, domain, client_id, client_secret, uuid=None):
         # Init atributes
         self.api_url = f"https://{domain}/2.0"
 
         if uuid is not None:
             req_url = f"{self.api_url}/auth/renew"
-            res = requests.post(
+            res = self.session.post(
                 req_url,
                 data={
                     "client_id": client_id,
@@ -30,7 +31,7 @@ class BudgetInsight:
             token = res_json.get("access_token")
         else:
             req_url = f"{self.api_url}/auth/init"
-            res = requests.post(
+            res = self.session.post(
                 req_url, data={"client_id": client_id, "client_secret": client_secret}
             )
             try:
@@ -45,10 +46,10 @@ class BudgetInsight:
         self.headers = {"authorization": f"Bearer {token}"}
 
         # Init end point
-        self.connections = Connections(self.api_url, self.headers)
-        self.accounts = Accounts(self.api_url, self.headers)
-        self.transactions = Transactions(self.api_url, self.headers)
-        self.connectors = Connectors(self.api_url)
+        self.connections = Connections(self.api_url, self.headers, self.session)
+        self.accounts = Accounts(self.api_url, self.headers, self.session)
+        self.transactions = Transactions(self.api_url, self.headers, self.session)
+        self.connectors = Connectors(self.api_url, self.session)
 
         # Set connexion to active
         self.connected = True
@@ -56,13 +57,14 @@ class BudgetInsight:
 
 
 class Connectors(BudgetInsight):
-    def __init__(self, api_url):
+    def __init__(self, api_url, session):
         BudgetInsight.__init__(self)
+        self._session = session
         self.api_url = api_url
 
     def get(self):
         req_url = f"{self.api_url}/connectors/"
-        res = requests.get(req_url)
+        res = self.session.get(req_url)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -74,7 +76,7 @@ class Connectors(BudgetInsight):
 
     def get_fields(self, bq_id):
         req_url = f"{self.api_url}/connectors/{bq_id}/fields"
-        res = requests.get(req_url)
+        res = self.session.get(req_url)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -91,14 +93,15 @@ class Connectors(BudgetInsight):
 
 
 class Connections(BudgetInsight):
-    def __init__(self, api_url, headers):
+    def __init__(self, api_url, headers, session):
         BudgetInsight.__init__(self)
+        self._session = session
         self.api_url = api_url
         self.headers = headers
 
     def create(self, data):
         req_url = f"{self.api_url}/users/me/connections"
-        res = requests.post(req_url, data=data, headers=self.headers)
+        res = self.session.post(req_url, data=data, headers=self.headers)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -108,7 +111,7 @@ class Connections(BudgetInsight):
 
     def update(self, data, connection_id):
         req_url = f"{self.api_url}/users/me/connections/{connection_id}"
-        res = requests.post(req_url, data=data, headers=self.headers)
+        res = self.session.post(req_url, data=data, headers=self.headers)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -118,7 +121,7 @@ class Connections(BudgetInsight):
 
     def force(self, connection_id):
         req_url = f"{self.api_url}/users/me/connections/{connection_id}"
-        res = requests.put(req_url, headers=self.headers)
+        res = self.session.put(req_url, headers=self.headers)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -128,7 +131,7 @@ class Connections(BudgetInsight):
 
     def get(self):
         req_url = f"{self.api_url}/users/me/connections"
-        res = requests.get(req_url, headers=self.headers)
+        res = self.session.get(req_url, headers=self.headers)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -140,7 +143,7 @@ class Connections(BudgetInsight):
 
     def delete(self, connection_id):
         req_url = f"{self.api_url}/users/me/connections/{connection_id}"
-        res = requests.delete(req_url, headers=self.headers)
+        res = self.session.delete(req_url, headers=self.headers)
         try:
             res.raise_for_status()
         except ValueError:
@@ -171,8 +174,9 @@ class Connections(BudgetInsight):
 
 
 class Accounts(BudgetInsight):
-    def __init__(self, api_url, headers):
+    def __init__(self, api_url, headers, session):
         BudgetInsight.__init__(self)
+        self._session = session
         self.api_url = api_url
         self.headers = headers
 
@@ -181,7 +185,7 @@ class Accounts(BudgetInsight):
             req_url = f"{self.api_url}/users/me/accounts?all"
         else:
             req_url = f"{self.api_url}/users/me/accounts/{account_id}?all"
-        res = requests.get(req_url, headers=self.headers)
+        res = self.session.get(req_url, headers=self.headers)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -195,7 +199,7 @@ class Accounts(BudgetInsight):
 
     def update(self, account_id, data=None):
         req_url = f"{self.api_url}/users/me/accounts/{account_id}?all"
-        res = requests.put(req_url, data=data, headers=self.headers)
+        res = self.session.put(req_url, data=data, headers=self.headers)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -305,14 +309,15 @@ class Accounts(BudgetInsight):
 
 
 class Transactions(BudgetInsight):
-    def __init__(self, api_url, headers):
+    def __init__(self, api_url, headers, session):
         BudgetInsight.__init__(self)
+        self._session = session
         self.api_url = api_url
         self.headers = headers
 
     def get(self):
         req_url = f"{self.api_url}/users/me/transactions?all"
-        res = requests.get(req_url, headers=self.headers)
+        res = self.session.get(req_url, headers=self.headers)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -1,6 +1,5 @@
 from naas_drivers.driver import InDriver, OutDriver
 from .__crud import CRUD
-import requests
 import os
 
 
@@ -10,7 +9,7 @@ class Users(CRUD):
             "apiKey": self.auth,
             "email": email,
         }
-        req = requests.post(
+        req = self.session.post(
             url=f"{self.base_public_url}/{self.endpoint}/retrieve",
             headers=self.req_headers,
             json=data,
@@ -24,7 +23,7 @@ class Users(CRUD):
             "apiKey": self.auth,
             "id": uid,
         }
-        req = requests.post(
+        req = self.session.post(
             url=f"{self.base_public_url}/{self.endpoint}/retrieve",
             headers=self.req_headers,
             json=data,
@@ -40,7 +39,7 @@ class Users(CRUD):
         }
         if name:
             data["name"] = name
-        req = requests.post(
+        req = self.session.post(
             url=f"{self.base_public_url}/{self.endpoint}/find_or_create",
             headers=self.req_headers,
             json=data,
@@ -54,7 +53,7 @@ class Users(CRUD):
             "apiKey": self.auth,
             "id": uid,
         }
-        req = requests.post(
+        req = self.session.post(
             url=f"{self.base_public_url}/{self.endpoint}/delete",
             headers=self.req_headers,
             json=data,
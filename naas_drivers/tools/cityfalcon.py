@@ -1,5 +1,4 @@
 from naas_drivers.driver import InDriver
-import requests
 import pandas as pd
 import os
 
@@ -73,6 +72,6 @@ class Cityfalcon(InDriver):
         url = f"{self._url_base}?access_token={self.__key}"
         url = f"{url}&identifier_type={identifier_type}&paywall={paywall}&identifiers={action}_{country}&categories=mp%2Cop"
         url = f"{url}&min_cityfalcon_score={min_score}&order_by=latest&time_filter={time_filter}&all_languages=false&languages={languages}"
-        req = requests.get(url)
+        req = self.session.get(url)
         dict_news = req.json()
         return self.convert_data_to_df(dict_news, fields, limit)
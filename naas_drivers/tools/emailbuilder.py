@@ -1,10 +1,8 @@
 from naas_drivers.driver import InDriver
 import pandas as pd
-import requests
 import uuid
 import os
 import warnings
-from IPython.core import display
 from htmlBuilder import tags, attributes
 
 #  https://litmus.com/community/templates/31-accessible-product-announcement-email
@@ -665,9 +663,11 @@ class EmailBuilder(InDriver):
         return [tags.Main(items)]
 
     def __display(self, content, mode):
-        uid = uuid.uuid4().hex
         if mode is None:
             return
+        from IPython.core import display
+
+        uid = uuid.uuid4().hex
         if mode == "shadow":
             shadow = f"""
             <script type="text/javascript">
@@ -722,7 +722,7 @@ class EmailBuilder(InDriver):
             error_text = f"extension {filename.split('.')[1]} not suported for now"
             self.print_error(error_text)
         json["output"] = output
-        req = requests.post(
+        req = self.session.post(
             url=f"{os.environ.get('SCREENSHOT_API', 'http://naas-screenshot:9000')}/api/render",  # Sensitive
             json=json,
         )
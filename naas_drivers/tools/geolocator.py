@@ -1,6 +1,12 @@
 from naas_drivers.driver import InDriver
+from naas_drivers.ratelimit import TokenBucket
 import pandas as pd
-from geopy.extra.rate_limiter import RateLimiter
+from geopy.exc import GeocoderServiceError
+
+GEOCODE_RETRIES = 2
+# Fraction of the max rate regained after every geocoded address, the rate
+# is back to it about 10 calls after each throttle
+GEOCODE_RECOVERY = 0.1
 
 
 class Geolocator(InDriver):
@@ -16,6 +22,7 @@ class Geolocator(InDriver):
 
     def __init__(self):
         self.client = None
+        self.bucket = None
 
     def connect(
         self,
@@ -33,19 +40,20 @@ class Geolocator(InDriver):
             from geopy.geocoders import GoogleV3
 
             client = GoogleV3(api_key=api_key, domain=domain, **kwargs)
-            self.client = RateLimiter(
-                client.geocode, min_delay_seconds=min_delay_seconds
-            )
+            self.client = client.geocode
         elif mode == "som":
             from geopy.geocoders import Nominatim
 
             client = Nominatim(user_agent=api_key, **kwargs)
-            self.client = RateLimiter(
-                client.geocode, min_delay_seconds=min_delay_seconds
-            )
+            self.client = client.geocode
         else:
             error_text = "mode should be osm or google"
             self.print_error(error_text)
+        # Never faster than min_delay_seconds, slower while throttled
+        rate = 1 / min_delay_seconds
+        self.bucket = TokenBucket(
+            rate=rate, max_rate=rate, increase=rate * GEOCODE_RECOVERY
+        )
         self.connected = True
         return self
 
@@ -54,12 +62,26 @@ class Geolocator(InDriver):
             error_text = "Please set the map service using connect method"
             self.print_error(error_text)
 
+    def geocode(self, address):
+        """Locate one address, None if the service keeps failing."""
+        for _ in range(GEOCODE_RETRIES + 1):
+            self.bucket.acquire()
+            try:
+                location = self.client(address)
+            except GeocoderServiceError as e:
+                # GeocoderRateLimited gives the pause asked by the service
+                self.bucket.throttled(getattr(e, "retry_after", None))
+                continue
+            self.bucket.succeeded()
+            return location
+        return None
+
     def get(self, df: pd.DataFrame, column: str, limit=50) -> pd.DataFrame:
         self.check_connect()
         if df.shape[0] > limit:
             error_text = f"Dataset number of rows is more than the set limit of {limit}"
             self.print_error(error_text)
-        df["_location"] = df[column].apply(self.client)
+        df["_location"] = df[column].apply(self.geocode)
         df["LATITUDE"] = df["_location"].apply(
             lambda loc: loc.latitude if loc else None
         )
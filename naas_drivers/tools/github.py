@@ -1,35 +1,631 @@
+from naas_drivers.accumulator import FrameAccumulator
+from naas_drivers.cache import CACHE_MAX_BYTES, ConditionalCache
+from naas_drivers.concurrency import MAX_IN_FLIGHT, fan_out
+from naas_drivers.driver import ConnectDriver
+from naas_drivers.instrumentation import instrumentation
+from naas_drivers.pagination import CursorPaginator, LinkHeaderPaginator
+from naas_drivers.ratelimit import parse_retry_after
+from naas_drivers.retry import RETRY_STATUSES
+from naas_drivers.schema import Schema
+from naas_drivers.sync import SYNC_PATH, SyncStore
 import pandas as pd
 import requests
 import pydash as _pd
-from urllib.parse import urlencode
-from datetime import datetime
+import asyncio
+import threading
+import time
+from urllib.parse import urlencode, urlparse
+from datetime import datetime, timedelta
+
+GITHUB_API_HOST = "api.github.com"
+GITHUB_GRAPHQL_URL = f"https://{GITHUB_API_HOST}/graphql"
+
+DATE_FORMAT = "%Y-%m-%d"
+WATERMARK_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# Days before the watermark fetched again by sync_commits: rebased and
+# cherry-picked commits keep the date of the original commit
+COMMITS_OVERLAP_DAYS = 7
+
+ISSUES_SCHEMA = Schema(
+    "github.issues",
+    {
+        "link_to_the_issue": "string",
+        "issue_number": "int64",
+        "issue_title": "string",
+        "issue_state": "category",
+        "issue_id": "int64",
+        "issue_labels": "string",
+        "issue_assignees": "string",
+        "comments_till_date": "int64",
+        "last_created_date": "string",
+        "last_created_time": "string",
+        "last_updated_date": "string",
+        "last_updated_time": "string",
+        "comments": "string",
+        "linked_pr_state": "category",
+        "PR_activity": "string",
+    },
+)
+ISSUES_COLUMNS = ISSUES_SCHEMA.columns
+PROJECT_ISSUES_SCHEMA = Schema(
+    "github.project_issues",
+    {
+        "issue_status": "category",
+        "issue_state": "category",
+        "link_to_the_issue": "string",
+        "issue_number": "int64",
+        "issue_title": "string",
+        "issue_labels": "string",
+        "issue_assignees": "string",
+        "comments_till_date": "int64",
+        "last_created_date": "string",
+        "last_created_time": "string",
+        "last_updated_date": "string",
+        "last_updated_time": "string",
+        "stale_issue": "string",
+        "comments": "string",
+        "linked_pr_state": "category",
+        "PR_activity": "string",
+        "project_id": "int64",
+        "project_name": "string",
+    },
+)
+PROJECT_ISSUES_COLUMNS = PROJECT_ISSUES_SCHEMA.columns
+PULLS_SCHEMA = Schema(
+    "github.pulls",
+    {
+        "id": "int64",
+        "issue_url": "string",
+        "PR_number": "int64",
+        "PR_state": "category",
+        "Title": "string",
+        "first_created_date": "string",
+        "first_created_time": "string",
+        "last_updated_date": "string",
+        "last_updated_time": "string",
+        "commits_url": "string",
+        "review_comments_url": "string",
+        "issue_comments_url": "string",
+        "assignees": "string",
+        "requested_reviewers": "string",
+        "PR_activity": "string",
+    },
+)
+PULLS_COLUMNS = PULLS_SCHEMA.columns
+PROFILE_FIELDS = {
+    "NAME": "name",
+    "EMAIL": "email",
+    "LOCATION": "location",
+    "ORGANIZATION": "company",
+    "BIO": "bio",
+    "LOGIN_NAME": "login",
+    "TWITTER": "twitter_username",
+    "CREATED_AT": "created_at",
+    "UPDATED_AT": "updated_at",
+}
+PROJECTS_SCHEMA = Schema(
+    "github.projects",
+    {
+        "project_name": "string",
+        "project_description": "string",
+        "project_id": "int64",
+        "project_created_by": "string",
+        "project_created_date": "string",
+        "project_created_time": "string",
+        "project_updated_date": "string",
+        "project_updated_time": "string",
+        "project_columns_url": "string",
+    },
+)
+PROJECTS_COLUMNS = PROJECTS_SCHEMA.columns
+COMMITS_SCHEMA = Schema(
+    "github.commits",
+    {
+        "ID": "string",
+        "MESSAGE": "string",
+        "AUTHOR_DATE": "datetime",
+        "AUTHOR_NAME": "string",
+        "AUTHOR_EMAIL": "string",
+        "COMMITTER_DATE": "datetime",
+        "COMMITTER_NAME": "string",
+        "COMMITTER_EMAIL": "string",
+        "COMMENTS_COUNT": "int64",
+        "VERIFICATION_REASON": "category",
+        "VERIFICATION_STATUS": "bool",
+    },
+)
+
+
+def _split_datetime(value):
+    date, _, time = value.strip("Z").partition("T")
+    return date, time or date
+
+
+def _join(items, key, empty="None"):
+    values = [item.get(key) for item in items]
+    if len(values) == 0:
+        return empty
+    return ", ".join(values)
+
+
+def _activity(date):
+    delta = datetime.now() - datetime.strptime(date, DATE_FORMAT)
+    return f"No activity since {delta.days} days"
+
+
+def _issue_row(issue, empty_labels="None"):
+    created_date, created_time = _split_datetime(issue.get("created_at"))
+    updated_date, updated_time = _split_datetime(issue.get("updated_at"))
+    return {
+        "link_to_the_issue": issue["html_url"],
+        "issue_number": issue["number"],
+        "issue_title": issue["title"],
+        "issue_state": issue["state"],
+        "issue_id": issue["id"],
+        "issue_labels": _join(issue["labels"], "name", empty=empty_labels),
+        "issue_assignees": _join(issue["assignees"], "login"),
+        "comments_till_date": issue["comments"],
+        "last_created_date": created_date,
+        "last_created_time": created_time,
+        "last_updated_date": updated_date,
+        "last_updated_time": updated_time,
+    }
+
+
+def _pull_row(pull):
+    created_date, created_time = _split_datetime(pull.get("created_at"))
+    updated_date, updated_time = _split_datetime(pull.get("updated_at"))
+    return {
+        "id": pull.get("id"),
+        "issue_url": pull.get("issue_url"),
+        "PR_number": pull.get("number"),
+        "PR_state": pull.get("state"),
+        "Title": pull.get("title"),
+        "first_created_date": created_date,
+        "first_created_time": created_time,
+        "last_updated_date": updated_date,
+        "last_updated_time": updated_time,
+        "commits_url": pull.get("commits_url"),
+        "review_comments_url": pull.get("review_comments_url"),
+        "issue_comments_url": pull.get("comments_url"),
+        "assignees": _join(pull.get("assignees"), "login"),
+        "requested_reviewers": _join(pull.get("requested_reviewers"), "login"),
+        "PR_activity": _activity(updated_date),
+    }
+
+
+def _project_row(project):
+    created_date, created_time = _split_datetime(project.get("created_at"))
+    updated_date, updated_time = _split_datetime(project.get("updated_at"))
+    return {
+        "project_name": project.get("name"),
+        "project_description": project.get("body"),
+        "project_id": project.get("number"),
+        "project_created_by": project.get("creator")["login"],
+        "project_created_date": created_date,
+        "project_created_time": created_time,
+        "project_updated_date": updated_date,
+        "project_updated_time": updated_time,
+        "project_columns_url": project.get("columns_url"),
+    }
+
+
+GRAPHQL_STATES = {"OPEN": "open", "CLOSED": "closed", "MERGED": "closed"}
+GRAPHQL_ISSUE_FIELDS = """
+fragment issueFields on Issue {
+  __typename databaseId number url title state createdAt updatedAt
+  labels(first: 100) { nodes { name } }
+  assignees(first: 100) { nodes { login } }
+  comments(first: 100) { totalCount nodes { body } }
+}
+fragment pullFields on PullRequest {
+  __typename databaseId number url title state createdAt updatedAt
+  labels(first: 100) { nodes { name } }
+  assignees(first: 100) { nodes { login } }
+  comments(first: 100) { totalCount nodes { body } }
+  reviewRequests(first: 100) {
+    nodes { requestedReviewer { ... on User { login } } }
+  }
+}
+"""
+GRAPHQL_ISSUES = """
+query Issues($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor, states: OPEN,
+           orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...issueFields }
+    }
+  }
+}
+""" + GRAPHQL_ISSUE_FIELDS
+GRAPHQL_PULLS = """
+query PullRequests($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 100, after: $cursor, states: OPEN,
+                 orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { ...pullFields }
+    }
+  }
+}
+""" + GRAPHQL_ISSUE_FIELDS
+GRAPHQL_PROJECTS = """
+query Projects($login: String!, $cursor: String) {
+  organization(login: $login) {
+    projects(first: 100, after: $cursor, states: OPEN) {
+      pageInfo { hasNextPage endCursor }
+      nodes { number name columns(first: 100) { nodes { id name } } }
+    }
+  }
+}
+"""
+GRAPHQL_COLUMN_CARDS = """
+query ColumnCards($id: ID!, $cursor: String) {
+  node(id: $id) {
+    ... on ProjectColumn {
+      cards(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { content { ...issueFields ...pullFields } }
+      }
+    }
+  }
+}
+""" + GRAPHQL_ISSUE_FIELDS
+
+
+def _rest_issue(node):
+    """Convert an Issue or PullRequest GraphQL node to its REST shape."""
+    return {
+        "id": node["databaseId"],
+        "number": node["number"],
+        "html_url": node["url"],
+        "title": node["title"],
+        "state": GRAPHQL_STATES[node["state"]],
+        "labels": node["labels"]["nodes"],
+        "assignees": node["assignees"]["nodes"],
+        "comments": node["comments"]["totalCount"],
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+    }
+
+
+def _rest_pull(node, repository):
+    api = f"https://{GITHUB_API_HOST}/repos/{repository}"
+    number = node["number"]
+    return {
+        **_rest_issue(node),
+        "issue_url": f"{api}/issues/{number}",
+        "commits_url": f"{api}/pulls/{number}/commits",
+        "review_comments_url": f"{api}/pulls/{number}/comments",
+        "comments_url": f"{api}/issues/{number}/comments",
+        "requested_reviewers": [
+            r["requestedReviewer"]
+            for r in node["reviewRequests"]["nodes"]
+            if (r.get("requestedReviewer") or {}).get("login")
+        ],
+    }
+
+
+def _comment_bodies(node):
+    bodies = [comment["body"] for comment in node["comments"]["nodes"]]
+    return bodies if len(bodies) > 0 else "No comments"
+
+
+def _linked_issue_row(issue, comments, pr_state=None):
+    row = _issue_row(issue)
+    row["comments"] = str(comments)
+    if pr_state is not None:
+        row["linked_pr_state"] = pr_state
+        row["PR_activity"] = _activity(row["last_updated_date"])
+    else:
+        row["linked_pr_state"] = "None"
+        row["PR_activity"] = "None"
+    return row
+
+
+def _card_row(issue, issue_status, comments, pr=None):
+    row = _issue_row(issue, empty_labels="")
+    row["issue_status"] = issue_status
+    if issue_status != "Backlog":
+        row["stale_issue"] = _activity(row["last_updated_date"])
+    else:
+        row["stale_issue"] = "None"
+    row["comments"] = str(comments)
+    if pr is not None and pr.get("updated_at") is not None:
+        row["linked_pr_state"] = pr.get("state")
+        row["PR_activity"] = _activity(pr.get("updated_at").split("T")[0])
+    else:
+        row["linked_pr_state"] = "None"
+        row["PR_activity"] = "None"
+    return row
+
+
+class _Quota:
+    def __init__(self):
+        self.limit = None
+        self.remaining = None
+        self.reset = 0
+        self.next_at = 0
+
+
+class RateLimitScheduler:
+    """
+    Session middleware spending the GitHub rate limit of one or several tokens.
+
+    Quotas are read from the X-RateLimit-* headers, per token and resource
+    (core, search, graphql). Each request uses the token with the most quota
+    left. Once less than `pace_below` of a quota is left, requests are spread
+    evenly until its reset. Requests rejected by a rate limit (403/429) are
+    retried after Retry-After or the reset, up to `max_retries` times.
+
+    Parameters
+    ----------
+    tokens: list:
+        Github personal access tokens.
+    pace_below: float (default 0.2):
+        Fraction of the quota under which requests are paced, 1 to always pace.
+    max_retries: int (default 3):
+        Retries of a rate limited request.
+    """
+
+    def __init__(
+        self,
+        tokens,
+        pace_below=0.2,
+        max_retries=3,
+        clock=time.time,
+        sleep=time.sleep,
+        asleep=asyncio.sleep,
+    ):
+        self.tokens = list(tokens)
+        self.pace_below = pace_below
+        self.max_retries = max_retries
+        self.clock = clock
+        self.sleep = sleep
+        self.asleep = asleep
+        self.quotas = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_resource(url):
+        path = urlparse(url).path
+        if path.startswith("/graphql"):
+            return "graphql"
+        if path.startswith("/search"):
+            return "search"
+        return "core"
+
+    def quota(self, token, resource):
+        return self.quotas.setdefault((token, resource), _Quota())
+
+    def _reserve(self, resource):
+        """Pick a token for the next request, return it with the wait of its slot."""
+        with self._lock:
+            now = self.clock()
+            quotas = []
+            for token in self.tokens:
+                quota = self.quota(token, resource)
+                if quota.reset <= now and quota.limit is not None:
+                    quota.remaining = quota.limit
+                quotas.append((token, quota))
+
+            def available(item):
+                quota = item[1]
+                if quota.remaining is not None and quota.remaining <= 0:
+                    return (0, -quota.reset)
+                ready = quota.next_at <= now
+                remaining = quota.remaining
+                return (1 + ready, float("inf") if remaining is None else remaining)
+
+            token, quota = max(quotas, key=available)
+            slot = max(now, quota.next_at)
+            if quota.remaining is not None:
+                if quota.remaining <= 0:
+                    slot = max(slot, quota.reset)
+                elif quota.remaining < (quota.limit or 0) * self.pace_below:
+                    interval = max(quota.reset - now, 0) / quota.remaining
+                    quota.next_at = slot + interval
+                quota.remaining -= 1
+        return token, slot - now
+
+    def acquire(self, resource, method=None, url=None):
+        """Pick a token for the next request and wait for its slot."""
+        token, wait = self._reserve(resource)
+        if wait > 0:
+            if instrumentation.enabled and url is not None:
+                instrumentation.rate_limit_wait(method, url, wait)
+            self.sleep(wait)
+        return token
+
+    async def aacquire(self, resource, method=None, url=None):
+        """Async twin of acquire."""
+        token, wait = self._reserve(resource)
+        if wait > 0:
+            if instrumentation.enabled and url is not None:
+                instrumentation.rate_limit_wait(method, url, wait)
+            await self.asleep(wait)
+        return token
+
+    def update(self, token, resource, res):
+        """Read the quota headers, return True if the request was rate limited."""
+        headers = res.headers
+        resource = headers.get("X-RateLimit-Resource", resource)
+        with self._lock:
+            quota = self.quota(token, resource)
+            if "X-RateLimit-Remaining" in headers:
+                quota.limit = int(headers.get("X-RateLimit-Limit", 0)) or None
+                quota.remaining = int(headers["X-RateLimit-Remaining"])
+                quota.reset = int(headers.get("X-RateLimit-Reset", 0))
+            elif res.status_code == 304 and quota.remaining is not None:
+                # Conditional requests answered 304 are not counted by GitHub
+                quota.remaining = min(quota.remaining + 1, quota.limit or float("inf"))
+            if res.status_code not in (403, 429):
+                return False
+            # HTTP-date values are ignored, the reset is used instead
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                quota.next_at = max(quota.next_at, self.clock() + retry_after)
+                return True
+            return quota.remaining == 0
+
+    def __call__(self, send, method, url, **kwargs):
+        if urlparse(url).netloc != GITHUB_API_HOST:
+            return send(method, url, **kwargs)
+        resource = self.get_resource(url)
+        for attempt in range(self.max_retries + 1):
+            token = self.acquire(resource, method, url)
+            headers = {**(kwargs.get("headers") or {})}
+            headers["Authorization"] = f"token {token}"
+            res = send(method, url, **{**kwargs, "headers": headers})
+            if not self.update(token, resource, res) or attempt == self.max_retries:
+                break
+        return res
+
+    async def asend(self, send, method, url, **kwargs):
+        """Async twin of the middleware."""
+        if urlparse(url).netloc != GITHUB_API_HOST:
+            return await send(method, url, **kwargs)
+        resource = self.get_resource(url)
+        for attempt in range(self.max_retries + 1):
+            token = await self.aacquire(resource, method, url)
+            headers = {**(kwargs.get("headers") or {})}
+            headers["Authorization"] = f"token {token}"
+            res = await send(method, url, **{**kwargs, "headers": headers})
+            if not self.update(token, resource, res) or attempt == self.max_retries:
+                break
+        return res
+
+
+class Github(ConnectDriver):
+    max_in_flight = MAX_IN_FLIGHT
+    graphql_url = GITHUB_GRAPHQL_URL
 
-class Github:
     @staticmethod
     def get_repository_url(url):
         return url.split("https://github.com/")[-1]
     
-    def connect(self, token: str):
+    def connect(
+        self,
+        token: str,
+        max_in_flight=None,
+        pace_below=0.2,
+        cache_dir=None,
+        cache_max_bytes=CACHE_MAX_BYTES,
+    ):
+        """
+        Parameters
+        ----------
+        token: str or list:
+            Github personal access token, or a list of tokens to rotate across.
+        max_in_flight: int (default 10):
+            Maximum number of concurrent requests sent for secondary lookups
+            (issue comments, linked PR, team members), 1 to disable.
+        pace_below: float (default 0.2):
+            Fraction of the rate limit under which requests are spread evenly
+            until its reset, 1 to always pace, 0 to never pace.
+        cache_dir: str (default None):
+            Directory of the ETag cache, unchanged pages are then answered with
+            304 (free of rate limit) and read from disk. Disabled when None.
+        cache_max_bytes: int (default 100MB):
+            Size of the ETag cache, least recently used pages are evicted first.
+        """
         # Init connect
-        self.token = token
+        tokens = [token] if isinstance(token, str) else list(token)
+        self.token = tokens[0]
+        if max_in_flight is not None:
+            self.max_in_flight = max_in_flight
+            if max_in_flight > self.pool_maxsize:
+                self.configure_session(pool_maxsize=max_in_flight)
+
+        # Init rate limit scheduler and cache, shared by all end points
+        # through the session
+        self.scheduler = RateLimitScheduler(tokens, pace_below=pace_below)
+        self.cache = None
+        if cache_dir is not None:
+            self.cache = ConditionalCache(
+                cache_dir, max_bytes=cache_max_bytes, hosts=[GITHUB_API_HOST]
+            )
+        self.session.middlewares = [
+            m
+            for m in self.session.middlewares
+            if not isinstance(m, (ConditionalCache, RateLimitScheduler))
+        ] + [m for m in (self.cache, self.scheduler) if m is not None]
+        if self.retry is not None:
+            # Rate limited requests are retried by the scheduler
+            self.retry.statuses = tuple(s for s in RETRY_STATUSES if s != 429)
 
         # Init headers
         self.headers = {"Authorization": f"token {self.token}"}
 
         # Init end point
-        self.repos = Repositories(self.headers)
-        self.users = Users(self.headers)
-        self.teams = Teams(self.headers)
-        self.projects = Projects(self.headers)
+        self.repos = Repositories(self.headers, self.session, self.max_in_flight)
+        self.users = Users(self.headers, self.session, self.max_in_flight)
+        self.teams = Teams(self.headers, self.session, self.max_in_flight)
+        self.projects = Projects(self.headers, self.session, self.max_in_flight)
 
         # Set connexion to active
         self.connected = True
         return self
 
+    def graphql(self, query, variables=None):
+        """
+        Send a GraphQL query and return its data.
+
+        Parameters
+        ----------
+        query: str:
+            GraphQL query.
+        variables: dict (default None):
+            Variables of the query.
+        """
+        res = self.session.post(
+            self.graphql_url,
+            json={"query": query, "variables": variables or {}},
+            headers=self.headers,
+        )
+        res.raise_for_status()
+        res_json = res.json()
+        if res_json.get("errors"):
+            messages = [error.get("message") for error in res_json["errors"]]
+            raise ValueError(f"GraphQL error: {'; '.join(messages)}")
+        return res_json["data"]
+
+    def iter_graphql(self, query, variables, path):
+        """
+        Return a lazy iterable over the nodes of a GraphQL connection,
+        one list per page. The query takes a $cursor variable.
+
+        Parameters
+        ----------
+        query: str:
+            GraphQL query.
+        variables: dict:
+            Variables of the query, without cursor.
+        path: str:
+            Path of the connection in the data, ex: "repository.issues".
+        """
+
+        def fetch(cursor):
+            return _pd.get(self.graphql(query, {**variables, "cursor": cursor}), path)
+
+        return CursorPaginator(
+            fetch,
+            get_records=lambda connection: connection["nodes"],
+            get_cursor=lambda connection: (
+                connection["pageInfo"]["endCursor"]
+                if connection["pageInfo"]["hasNextPage"]
+                else None
+            ),
+        )
+
+
 class Users(Github):
-    def __init__(self, headers):
+    def __init__(self, headers, session, max_in_flight=MAX_IN_FLIGHT):
         Github.__init__(self)
         self.headers = headers
+        self._session = session
+        self.max_in_flight = max_in_flight
     
     def get_profile(self, html_url, url=None):
         """
@@ -65,7 +661,7 @@ class Users(Github):
             user = html_url.split("github.com/")[-1].split("/")[0]
             url = f"https://api.github.com/users/{user}"
         
-        res = requests.get(url, headers=self.headers)
+        res = self.session.get(url, headers=self.headers)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -82,9 +678,11 @@ class Users(Github):
         return df
 
 class Teams(Github):
-    def __init__(self, headers):
+    def __init__(self, headers, session, max_in_flight=MAX_IN_FLIGHT):
         Github.__init__(self)
-        self.headers = headers    
+        self.headers = headers
+        self._session = session
+        self.max_in_flight = max_in_flight
 
     def get_profiles(self, url):
         """
@@ -124,7 +722,7 @@ class Teams(Github):
                 "page": page,
             }
             url = f"https://api.github.com/orgs/{org}/teams?{urlencode(params, safe='(),')}"
-            res = requests.get(url, headers=self.headers)
+            res = self.session.get(url, headers=self.headers)
             try:
                 res.raise_for_status()
             except requests.HTTPError as e:
@@ -149,7 +747,7 @@ class Teams(Github):
                     }
 
                     url = f"{info[3]}?{urlencode(members_params, safe='(),')}"
-                    members = requests.get(url, headers=self.headers, params=members_params)
+                    members = self.session.get(url, headers=self.headers, params=members_params)
 
                     try:
                         members.raise_for_status()
@@ -173,31 +771,38 @@ class Teams(Github):
         data['TEAM'], data['SLUG'], data['TEAM_DESCRIPTION'], data['member_profile'] = teams, slugs, team_descriptions, member_profiles     
         data['GITHUB'] = org
 
-        for idx, profile in enumerate(data['member_profile']):
-            details = requests.get(profile, headers=self.headers, params= params).json()
-            data.loc[idx,'NAME'], data.loc[idx,'EMAIL'], data.loc[idx,'LOCATION'] = details['name'], details['email'], details['location']
-            data.loc[idx,'ORGANIZATION'], data.loc[idx,'BIO'], data.loc[idx,'LOGIN_NAME'] = details['company'], details['bio'], details['login']
-            data.loc[idx,'TWITTER'], data.loc[idx,'CREATED_AT'] = details['twitter_username'], details['created_at']  
-            data.loc[idx,'UPDATED_AT'] = details['updated_at']
+        def get_details(profile):
+            res = self.session.get(profile, headers=self.headers)
+            res.raise_for_status()
+            return res.json()
+
+        profiles = fan_out(get_details, data["member_profile"], self.max_in_flight)
+        details = pd.DataFrame.from_records(
+            profiles, columns=list(PROFILE_FIELDS.values())
+        )
+        for col, field in PROFILE_FIELDS.items():
+            data[col] = details[field].values
         return data
     
 class Projects(Github):
-    def __init__(self, headers):
+    def __init__(self, headers, session, max_in_flight=MAX_IN_FLIGHT):
         Github.__init__(self)
         self.headers = headers
+        self._session = session
+        self.max_in_flight = max_in_flight
     
     def get(self, url):
         """
         Return an dataframe object with 9 columns:
-        - PROJECT_NAME            object
-        - PROJECT_DESCRIPTION     object
+        - PROJECT_NAME            string
+        - PROJECT_DESCRIPTION     string
         - PROJECT_ID              int64
-        - PROJECT_CREATED_BY      object
-        - PROJECT_CREATED_DATE    object
-        - PROJECT_CREATED_TIME    object
-        - PROJECT_UPDATED_DATE    object
-        - PROJECT_UPDATED_TIME    object
-        - PROJECT_COLUMNS_URL     object
+        - PROJECT_CREATED_BY      string
+        - PROJECT_CREATED_DATE    string
+        - PROJECT_CREATED_TIME    string
+        - PROJECT_UPDATED_DATE    string
+        - PROJECT_UPDATED_TIME    string
+        - PROJECT_COLUMNS_URL     string
         
         Parameters
         ----------
@@ -205,40 +810,19 @@ class Projects(Github):
             Projects url from Github.
             Example : "https://github.com/orgs/jupyter-naas/projects"
         """
-        projects_df = pd.DataFrame() 
+        acc = FrameAccumulator(schema=PROJECTS_SCHEMA)
         url = "api.github.com".join(url.split("github.com"))
-        page=1
+        page = 1
         while True:
-            params = {
-                "per_page": 100,
-                'page': page
-            }
-            url_link = url + f"?{urlencode(params, safe='(),')}"
-            res = requests.get(url_link, headers=self.headers, params=params)
-
-            try:
-                res.raise_for_status()
-            except requests.HTTPError as e:
-                raise(e)
-            if len(res.json()) == 0:
-                break
+            params = {"per_page": 100, "page": page}
+            res = self.session.get(url, headers=self.headers, params=params)
+            res.raise_for_status()
             res_json = res.json()
-
-            for idx, project in enumerate(res_json):
-                projects_df.loc[idx, 'project_name'] = project.get('name')
-                projects_df.loc[idx, 'project_description'] = project.get('body')
-                projects_df.loc[idx, 'project_id'] = project.get('number')
-                projects_df.loc[idx, 'project_created_by'] = project.get('creator')['login']
-                projects_df.loc[idx, 'project_created_date'] = project.get('created_at').strip('Z').split('T')[0]
-                projects_df.loc[idx, 'project_created_time'] = project.get('created_at').strip('Z').split('T')[-1]
-                projects_df.loc[idx, 'project_updated_date'] = project.get('updated_at').strip('Z').split('T')[0]
-                projects_df.loc[idx, 'project_updated_time'] = project.get('updated_at').strip('Z').split('T')[-1]
-                projects_df.loc[idx, 'project_columns_url'] = project.get('columns_url')
-
-            page+=1
-
-        projects_df['project_id'] = projects_df.project_id.astype('int')
-        return projects_df
+            if len(res_json) == 0:
+                break
+            acc.extend(_project_row(project) for project in res_json)
+            page += 1
+        return acc.to_df()
     
     def get_comments_from_issues(self, url):
         """
@@ -254,7 +838,7 @@ class Projects(Github):
         if url.find("api.github.com")==-1:
             url = "api.github.com/repos".join(url.split("github.com"))
 
-        comments = requests.get(url, headers=self.headers)
+        comments = self.session.get(url, headers=self.headers)
         try:
             comments.raise_for_status()
         except requests.HTTPError as e:
@@ -266,128 +850,124 @@ class Projects(Github):
                 issue_comments.append(comment['body'])
         return issue_comments
     
-    def get_issues(self, projects_url):
+    def get_issues(self, projects_url, engine="rest"):
         """
         Return an dataframe object with 18 columns:
-        - ISSUE_STATUS          object
-        - ISSUE_STATE           object
-        - LINK_TO_THE_ISSUE     object
+        - ISSUE_STATUS          category
+        - ISSUE_STATE           category
+        - LINK_TO_THE_ISSUE     string
         - ISSUE_NUMBER          int64
-        - ISSUE_TITLE           object
-        - ISSUE_LABELS          object
-        - ISSUE_ASSIGNEES       object
+        - ISSUE_TITLE           string
+        - ISSUE_LABELS          string
+        - ISSUE_ASSIGNEES       string
         - COMMENTS_TILL_DATE    int64
-        - LAST_CREATED__DATE    object
-        - LAST_CREATED__TIME    object
-        - LAST_UPDATED_DATE     object
-        - LAST_UPDATED_TIME     object
-        - STALE_ISSUE           object
-        - COMMENTS              object
-        - LINKED_PR_STATE       object
-        - PR_ACTIVITY           object
+        - LAST_CREATED__DATE    string
+        - LAST_CREATED__TIME    string
+        - LAST_UPDATED_DATE     string
+        - LAST_UPDATED_TIME     string
+        - STALE_ISSUE           string
+        - COMMENTS              string
+        - LINKED_PR_STATE       category
+        - PR_ACTIVITY           string
         - PROJECT_ID            int64
-        - PROJECT_NAME          object
+        - PROJECT_NAME          string
         
         Parameters
         ----------
         projects_url: str:
             Projects url from Github.
             Example : "https://github.com/orgs/jupyter-naas/projects"
+        engine: str (default "rest"):
+            "rest" or "graphql". GraphQL gets issues, comments and linked PR
+            in pages of 100 cards instead of 3 REST calls per issue.
         """
+        acc = FrameAccumulator(schema=PROJECT_ISSUES_SCHEMA)
+        if engine == "graphql":
+            acc.extend(self.__get_issues_graphql(projects_url))
+            return acc.to_df()
         df_projects = self.get(projects_url)
-        df_issues = pd.DataFrame(columns=['issue_status', 'issue_state'])
 
         # Gets info from columns present in our roadmap for all active projects
         for _, project in df_projects.iterrows():
-
-            columns = requests.get(project['project_columns_url'], headers=self.headers).json()
-            issue_status, issue_urls=[],[]
+            columns = self.session.get(
+                project["project_columns_url"], headers=self.headers
+            ).json()
+            cards = []
             for column in columns:
-                page=1
+                page = 1
                 while True:
-                    params = {
-                        'per_page':100,
-                        'page':page
-                    }
-                    card_url = column['cards_url']+ f"?{urlencode(params, safe='(),')}"
-                    issues = requests.get(card_url, headers=self.headers)
-                    try:
-                        issues.raise_for_status()
-                    except requests.HTTPError as e:
-                        raise(e)
-                    if len(issues.json()) == 0:
+                    params = {"per_page": 100, "page": page}
+                    issues = self.session.get(
+                        column["cards_url"], headers=self.headers, params=params
+                    )
+                    issues.raise_for_status()
+                    issues_json = issues.json()
+                    if len(issues_json) == 0:
                         break
-                    for issue in issues.json():
-                        if issue.get('content_url') is not None:                        
-                            issue_urls.append(issue.get('content_url'))
-                            issue_status.append(column['name'])
-                    page+=1
-
-            df_issues['issue_status'] = issue_status
-
-            for idx, url in enumerate(issue_urls):
-                issue = requests.get(url, headers=self.headers)
-                try:
-                    issue.raise_for_status()
-                except requests.HTTPError as e:
-                    raise(e)
-                issue = issue.json()
-                # information to be extracted are below
-                df_issues.loc[idx, 'link_to_the_issue'], df_issues.loc[idx, 'issue_number'] = issue['html_url'], issue['number']
-                df_issues.loc[idx, 'issue_title'], df_issues.loc[idx, 'issue_state'] = issue['title'], issue['state']
-
-                labels= []
-                for label in issue['labels']:
-                    labels.append(label.get('name'))
-                df_issues.loc[idx, 'issue_labels'] = ", ".join(labels)
-
-                assigned=[]
-                for assignee in issue['assignees']:
-                    assigned.append(assignee.get('login'))
-                if assigned==[]:
-                    df_issues.loc[idx, 'issue_assignees'] = 'None'
-                else:
-                    df_issues.loc[idx, 'issue_assignees'] = ", ".join(assigned)
-
-                df_issues.loc[idx, 'comments_till_date'] = issue['comments']
-
-                df_issues.loc[idx, 'last_created_date'] = issue.get('created_at').strip('Z').split('T')[0]
-                df_issues.loc[idx, 'last_created_time'] = issue.get('created_at').strip('Z').split('T')[-1]
-                df_issues.loc[idx, 'last_updated_date'] = issue.get('updated_at').strip('Z').split('T')[0]
-                df_issues.loc[idx, 'last_updated_time'] = issue.get('updated_at').strip('Z').split('T')[-1]
-
-                if df_issues.loc[idx, 'issue_status']!='Backlog':
-                    date_format = "%Y-%m-%d"
-                    delta = datetime.now() - datetime.strptime(df_issues.loc[idx, 'last_updated_date'], date_format)
-                    df_issues.loc[idx, 'stale_issue'] = f'No activity since {delta.days} days'
-                else:
-                    df_issues.loc[idx, 'stale_issue'] = 'None'
-
-                df_issues.loc[idx, 'comments'] = str(self.get_comments_from_issues(issue['comments_url']))
-
-                try:
-                    pr = requests.get(issue.get('pull_request')['url'], headers= self.headers).json()
-                    df_issues.loc[idx, 'linked_pr_state'] = pr.get('state')
-
-                    date_format = "%Y-%m-%d"
-                    delta = datetime.now() - datetime.strptime(pr.get('updated_at').split('T')[0], date_format)
-                    df_issues.loc[idx, 'PR_activity'] = f'No activity since {delta.days} days'
-
-                except Exception:
-                    df_issues.loc[idx, 'linked_pr_state'] = 'None'
-                    df_issues.loc[idx, 'PR_activity'] = 'None'
-
-            df_issues['project_id'] = [df_projects.project_id.values[0]]*df_issues.shape[0]
-            df_issues['project_name'] = [df_projects.project_name.values[0]]*df_issues.shape[0]
-            df_issues['issue_number'] = df_issues['issue_number'].apply(lambda x: int(x))
-            df_issues['comments_till_date'] = df_issues['comments_till_date'].apply(lambda x: int(x))
-
-        return df_issues
+                    for issue in issues_json:
+                        if issue.get("content_url") is not None:
+                            cards.append((column["name"], issue.get("content_url")))
+                    page += 1
+
+            rows = fan_out(self.__get_card_issue, cards, self.max_in_flight)
+            for row in rows:
+                row["project_id"] = project["project_id"]
+                row["project_name"] = project["project_name"]
+            acc.extend(rows)
+        return acc.to_df()
+
+    def __get_card_issue(self, card):
+        issue_status, url = card
+        issue = self.session.get(url, headers=self.headers)
+        issue.raise_for_status()
+        issue = issue.json()
+        comments = self.get_comments_from_issues(issue["comments_url"])
+        try:
+            pr = self.session.get(
+                issue.get("pull_request")["url"], headers=self.headers
+            ).json()
+        except Exception:
+            pr = None
+        return _card_row(issue, issue_status, comments, pr)
+
+    def __get_issues_graphql(self, projects_url):
+        login = projects_url.split("/orgs/")[-1].split("/")[0]
+        rows = []
+        for projects in self.iter_graphql(
+            GRAPHQL_PROJECTS, {"login": login}, "organization.projects"
+        ):
+            for project in projects:
+                columns = project["columns"]["nodes"]
+                cards = fan_out(self.__get_column_cards, columns, self.max_in_flight)
+                for column, nodes in zip(columns, cards):
+                    for node in nodes:
+                        pr = None
+                        if node["__typename"] == "PullRequest":
+                            pr = {
+                                "state": GRAPHQL_STATES[node["state"]],
+                                "updated_at": node["updatedAt"],
+                            }
+                        row = _card_row(
+                            _rest_issue(node), column["name"], _comment_bodies(node), pr
+                        )
+                        row["project_id"] = project["number"]
+                        row["project_name"] = project["name"]
+                        rows.append(row)
+        return rows
+
+    def __get_column_cards(self, column):
+        pages = self.iter_graphql(
+            GRAPHQL_COLUMN_CARDS, {"id": column["id"]}, "node.cards"
+        )
+        # Notes have no content
+        return [c["content"] for cards in pages for c in cards if c.get("content")]
 
 class Repositories(Github):
-    def __init__(self, headers):
+    def __init__(self, headers, session, max_in_flight=MAX_IN_FLIGHT):
         Github.__init__(self)
         self.headers = headers
+        self._session = session
+        self.max_in_flight = max_in_flight
 
     def get_commits(self, url, author=None, since=None, until=None, per_page=100, page=1):
         """
@@ -412,17 +992,17 @@ class Repositories(Github):
         Default: 1
         
         Return an dataframe object with 11 columns:
-        - ID                   object
-        - MESSAGE              object
-        - AUTHOR_DATE          date
-        - AUTHOR_NAME          object
-        - AUTHOR_EMAIL         object
-        - COMMITTER_DATE       date
-        - COMMITTER_NAME       object
-        - COMMITTER_EMAIL      object
-        - COMMENTS_COUNT       int
-        - VERIFICATION_REASON  object
-        - VERIFICATION_STATUS  object
+        - ID                   string
+        - MESSAGE              string
+        - AUTHOR_DATE          datetime64
+        - AUTHOR_NAME          string
+        - AUTHOR_EMAIL         string
+        - COMMITTER_DATE       datetime64
+        - COMMITTER_NAME       string
+        - COMMITTER_EMAIL      string
+        - COMMENTS_COUNT       int64
+        - VERIFICATION_REASON  category
+        - VERIFICATION_STATUS  bool
 
         Parameters
         ----------
@@ -430,33 +1010,84 @@ class Repositories(Github):
             Repository url from Github.
             Example : "https://github.com/jupyter-naas/awesome-notebooks"
         """
-        # Get organisation and repository from url
-        repository = Github.get_repository_url(url)
+        acc = FrameAccumulator(schema=COMMITS_SCHEMA)
+        for commits in self.iter_commits(url, author, since, until, per_page, page):
+            acc.extend(commits)
+        return acc.to_df()
+
+    def sync_commits(
+        self, url, author=None, path=SYNC_PATH, overlap_days=COMMITS_OVERLAP_DAYS
+    ):
+        """
+        Incremental get_commits: only commits since the previous sync, minus
+        `overlap_days`, are fetched, then merged into the snapshot stored in
+        `path`. Return the same dataframe as get_commits.
+        Commits pushed with a committer date older than the overlap (ex: a
+        rebase keeping old dates) are missed, use get_commits to catch them.
 
-        # Get commits
-        commits = []
-        while True:
-            params = {
-                "state": "open",
-                "per_page": per_page,
-                "page": page,
-            }
-            if author:
-                params["author"] = author
-            if since:
-                params["since"] = since
-            if until:
-                params["until"] = until
-            url = f"https://api.github.com/repos/{repository}/commits?{urlencode(params, safe='(),')}"
-            res = requests.get(url, headers=self.headers)
-            try:
-                res.raise_for_status()
-            except requests.HTTPError as e:
-                raise (e)
-            res_json = res.json()
+        Parameters
+        ----------
+        url: str:
+            Repository url from Github.
+            Example : "https://github.com/jupyter-naas/awesome-notebooks"
+        author: str (default None):
+            GitHub login or email address by which to filter by commit author.
+        path: str (default "naas_sync"):
+            Directory of the watermarks and Parquet snapshots.
+        overlap_days: int (default 7):
+            Days before the previous sync fetched again.
+        """
+        store = SyncStore(path)
+        key = f"{Github.get_repository_url(url)}/commits"
+        if author:
+            key = f"{key}/{author}"
+        since = store.get_watermark(key)
+        start = since
+        if since is not None:
+            start = datetime.strptime(since, WATERMARK_FORMAT)
+            start = (start - timedelta(days=overlap_days)).strftime(WATERMARK_FORMAT)
+        acc = FrameAccumulator(schema=COMMITS_SCHEMA)
+        dates = []
+        for commits in self.iter_commits(url, author, since=start):
+            acc.extend(commits)
+            dates.extend(commit["COMMITTER_DATE"] for commit in commits)
+        df = store.merge_snapshot(key, acc.to_df(), on="ID", sort_by="COMMITTER_DATE")
+        df = COMMITS_SCHEMA.apply(df)
+        # From the raw "YYYY-MM-DD HH:MM:SS" UTC dates, parsed ones may be NaT
+        if len(dates) > 0:
+            watermark = max(dates).replace(" ", "T") + "Z"
+            store.set_watermark(key, max(watermark, since or watermark))
+        return df
 
-            if len(res_json) == 0:
-                break
+    def iter_commits(
+        self, url, author=None, since=None, until=None, per_page=100, page=1
+    ):
+        """
+        Yield commits page by page, as lists of get_commits rows.
+        Parameters are the same as get_commits.
+        """
+        # Get organisation and repository from url
+        repository = Github.get_repository_url(url)
+        params = {
+            "state": "open",
+            "per_page": per_page,
+            "page": page,
+        }
+        if author:
+            params["author"] = author
+        if since:
+            params["since"] = since
+        if until:
+            params["until"] = until
+        pages = LinkHeaderPaginator(
+            self.session,
+            f"https://api.github.com/repos/{repository}/commits",
+            params=params,
+            headers=self.headers,
+            max_in_flight=self.max_in_flight,
+        )
+        for res_json in pages:
+            commits = []
             for r in res_json:
                 commit = {
                     "ID": _pd.get(r, "sha"),
@@ -476,12 +1107,7 @@ class Repositories(Github):
                     "VERIFICATION_STATUS": _pd.get(r, "commit.verification.verified"),
                 }
                 commits.append(commit)
-            page += 1
-        # Return dataframe
-        df = pd.DataFrame(commits)
-        df["AUTHOR_DATE"] = pd.to_datetime(df["AUTHOR_DATE"])
-        df["COMMITTER_DATE"] = pd.to_datetime(df["COMMITTER_DATE"])
-        return df
+            yield commits
     
     def get_stargazers(self, url):
         """
@@ -499,46 +1125,46 @@ class Repositories(Github):
             Repository url from Github.
             Example : "https://github.com/jupyter-naas/awesome-notebooks"
         """
-        # Get organisation and repository from url
-        repository = Github.get_repository_url(url)
-        
-        # Custom headers
-        headers = self.headers
-        headers['Accept'] = 'application/vnd.github.v3.star+json'
-        
-        df = pd.DataFrame()
-        page = 1
-        while True:
-            params = {
-                "per_page": "100",
-                "page": page,
-            }
-            url = f"https://api.github.com/repos/{repository}/stargazers?{urlencode(params, safe='(),')}"
-            res = requests.get(url, headers=headers)
-            try:
-                res.raise_for_status()
-            except requests.HTTPError as e:
-                raise(e)
-            res_json = res.json()
+        acc = FrameAccumulator()
+        for users in self.iter_stargazers(url):
+            acc.extend(users)
+        df = acc.to_df()
 
-            if len(res_json) == 0:
-                break
-            for json in res_json:
-                starred_at = json.get("starred_at")
-                user = json.get("user")
-                tmp = pd.DataFrame([user])
-                tmp["starred_at"] = starred_at
-                df = pd.concat([df, tmp], axis=0)
-            page += 1
-    
         # Cleaning
+        df = df.drop(
+            [c for c in df.columns if c.endswith("_url") or c.endswith("_id")], axis=1
+        )
         for col in df.columns:
-            if col.endswith("_url") or col.endswith("_id"):
-                df = df.drop(col, axis=1)
             if col.endswith("_at"):
                 df[col] = df[col].str.replace("T", " ").str.replace("Z", " ")
         df.columns = df.columns.str.upper()
         return df
+
+    def iter_stargazers(self, url):
+        """
+        Yield stargazers page by page, as lists of user dicts with "starred_at".
+
+        Parameters
+        ----------
+        repository: str:
+            Repository url from Github.
+            Example : "https://github.com/jupyter-naas/awesome-notebooks"
+        """
+        # Get organisation and repository from url
+        repository = Github.get_repository_url(url)
+
+        # Custom headers
+        headers = {**self.headers, "Accept": "application/vnd.github.v3.star+json"}
+
+        pages = LinkHeaderPaginator(
+            self.session,
+            f"https://api.github.com/repos/{repository}/stargazers",
+            params={"per_page": "100", "page": 1},
+            headers=headers,
+            max_in_flight=self.max_in_flight,
+        )
+        for res_json in pages:
+            yield [{**r.get("user"), "starred_at": r.get("starred_at")} for r in res_json]
     
     def get_comments_from_issues(self, url):
         """
@@ -554,7 +1180,7 @@ class Repositories(Github):
         if url.find("api.github.com")==-1:
             url = "api.github.com".join(url.split("github.com"))
 
-        comments = requests.get(url, headers=self.headers)
+        comments = self.session.get(url, headers=self.headers)
         try:
             comments.raise_for_status()
         except requests.HTTPError as e:
@@ -566,120 +1192,187 @@ class Repositories(Github):
                 issue_comments.append(comment['body'])
         return issue_comments
 
-    def get_issues(self, url):
+    def get_issues(self, url, engine="rest"):
         """
         Return an dataframe object with 15 columns:
-        - LINK_TO_THE_ISSUE      object
+        - LINK_TO_THE_ISSUE      string
         - ISSUE_NUMBER           int64
-        - ISSUE_TITLE            object
-        - ISSUE_STATE            object
+        - ISSUE_TITLE            string
+        - ISSUE_STATE            category
         - ISSUE_ID               int64
-        - ISSUE_LABELS           object
-        - ISSUE_ASSIGNEES        object
+        - ISSUE_LABELS           string
+        - ISSUE_ASSIGNEES        string
         - COMMENTS_TILL_DATE     int64
-        - LAST_CREATED_DATE      object
-        - LAST_CREATED_TIME      object
-        - LAST_UPDATED_DATE      object
-        - LAST_UPDATED_TIME      object
-        - COMMENTS               object
-        - LINKED_PR_STATE        object
-        - PR_ACTIVITY            object
+        - LAST_CREATED_DATE      string
+        - LAST_CREATED_TIME      string
+        - LAST_UPDATED_DATE      string
+        - LAST_UPDATED_TIME      string
+        - COMMENTS               string
+        - LINKED_PR_STATE        category
+        - PR_ACTIVITY            string
+
+        Parameters
+        ----------
+        repository: str:
+            Repository url from Github.
+            Example : "https://github.com/jupyter-naas/awesome-notebooks"
+        engine: str (default "rest"):
+            "rest" or "graphql". GraphQL gets issues, comments and linked PR
+            in pages of 100 instead of 1 + 2N REST calls.
+        """
+        acc = FrameAccumulator(schema=ISSUES_SCHEMA)
+        if engine == "graphql":
+            acc.extend(self.__get_issues_graphql(url))
+            return acc.to_df()
+        issues = [issue for res_json in self.iter_issues(url) for issue in res_json]
+        acc.extend(fan_out(self.__get_issue_row, issues, self.max_in_flight))
+        return acc.to_df()
+
+    def sync_issues(self, url, path=SYNC_PATH):
+        """
+        Incremental get_issues: only issues updated since the previous sync
+        are fetched, then merged into the snapshot stored in `path`.
+        Return the same dataframe as get_issues.
+
+        Parameters
+        ----------
+        url: str:
+            Repository url from Github.
+            Example : "https://github.com/jupyter-naas/awesome-notebooks"
+        path: str (default "naas_sync"):
+            Directory of the watermarks and Parquet snapshots.
+        """
+        store = SyncStore(path)
+        key = f"{Github.get_repository_url(url)}/issues"
+        since = store.get_watermark(key)
+        if since is None:
+            pages = self.iter_issues(url)
+        else:
+            # Closed issues are fetched too, to update their state
+            pages = self.iter_issues(url, since=since, state="all")
+        issues = [issue for res_json in pages for issue in res_json]
+        acc = FrameAccumulator(schema=ISSUES_SCHEMA)
+        acc.extend(fan_out(self.__get_issue_row, issues, self.max_in_flight))
+        df = store.merge_snapshot(
+            key, acc.to_df(), on="issue_id", sort_by="issue_number"
+        )
+        df = ISSUES_SCHEMA.apply(df)
+        if len(issues) > 0:
+            watermark = max(issue["updated_at"] for issue in issues)
+            store.set_watermark(key, max(watermark, since or watermark))
+        df = df[df["issue_state"] == "open"]
+        return df.reset_index(drop=True)
+
+    def __get_issue_row(self, issue):
+        comments = self.get_comments_from_issues(issue["comments_url"])
+        try:
+            pr = self.session.get(
+                issue.get("pull_request")["url"], headers=self.headers
+            ).json()
+            pr_state = pr.get("state")
+        except Exception:
+            pr_state = None
+        return _linked_issue_row(issue, comments, pr_state)
+
+    def __get_issues_graphql(self, url):
+        owner, name = Github.get_repository_url(url).split("/")[:2]
+        variables = {"owner": owner, "name": name}
+        # The REST issues endpoint lists pull requests too, newest first
+        nodes = [
+            node
+            for query, path in (
+                (GRAPHQL_ISSUES, "repository.issues"),
+                (GRAPHQL_PULLS, "repository.pullRequests"),
+            )
+            for page in self.iter_graphql(query, variables, path)
+            for node in page
+        ]
+        nodes.sort(key=lambda node: node["createdAt"], reverse=True)
+        rows = []
+        for node in nodes:
+            pr_state = None
+            if node["__typename"] == "PullRequest":
+                pr_state = GRAPHQL_STATES[node["state"]]
+            rows.append(
+                _linked_issue_row(_rest_issue(node), _comment_bodies(node), pr_state)
+            )
+        return rows
+
+    def iter_issues(self, url, since=None, state="open"):
+        """
+        Yield raw issue objects from the GitHub API, page by page.
 
         Parameters
         ----------
         repository: str:
             Repository url from Github.
             Example : "https://github.com/jupyter-naas/awesome-notebooks"
+        since: str (default None):
+            Only issues updated at or after this time, format "YYYY-MM-DDTHH:MM:SSZ".
+        state: str (default "open"):
+            "open", "closed" or "all".
         """
         # Get organisation and repository from url
         repository = Github.get_repository_url(url)
-        
-        df = pd.DataFrame()
-        page, idx = 1, 0
-        while True:
-            params = {
-                "per_page": "100",
-                "page": page,
-            }
-            url = f"https://api.github.com/repos/{repository}/issues?{urlencode(params, safe='(),')}"
-            res = requests.get(url, headers=self.headers)
-            try:
-                res.raise_for_status()
-            except requests.HTTPError as e:
-                raise(e)
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            
-            for issue in res_json:
-                df.loc[idx, 'link_to_the_issue'], df.loc[idx, 'issue_number'] = issue['html_url'], issue['number']
-                df.loc[idx, 'issue_title'], df.loc[idx, 'issue_state'] = issue['title'], issue['state']
-                df.loc[idx, 'issue_id'] = issue['id']
-                labels= []
-                for label in issue['labels']:
-                    labels.append(label.get('name'))
-                if labels==[]:
-                    df.loc[idx, 'issue_labels'] = 'None'
-                else:
-                    df.loc[idx, 'issue_labels'] = ", ".join(labels)
-
-                assigned=[]
-                for assignee in issue['assignees']:
-                    assigned.append(assignee.get('login'))
-                if assigned==[]:
-                    df.loc[idx, 'issue_assignees'] = 'None'
-                else:
-                    df.loc[idx, 'issue_assignees'] = ", ".join(assigned)
-
-                df.loc[idx, 'comments_till_date'] = issue['comments']
-
-                df.loc[idx, 'last_created_date'] = issue.get('created_at').strip('Z').split('T')[0]
-                df.loc[idx, 'last_created_time'] = issue.get('created_at').strip('Z').split('T')[-1]
-                df.loc[idx, 'last_updated_date'] = issue.get('updated_at').strip('Z').split('T')[0]
-                df.loc[idx, 'last_updated_time'] = issue.get('updated_at').strip('Z').split('T')[-1]
-
-                df.loc[idx, 'comments'] = str(self.get_comments_from_issues(issue['comments_url']))
-
-                try:
-                    pr = requests.get(issue.get('pull_request')['url'], headers= self.headers).json()
-                    df.loc[idx, 'linked_pr_state'] = pr.get('state')
-
-                    date_format = "%Y-%m-%d"
-                    delta = datetime.now() - datetime.strptime(df.loc[idx, 'last_updated_date'], date_format)
-                    df.loc[idx, 'PR_activity'] = f'No activity since {delta.days} days'
-
-                except Exception:
-                    df.loc[idx, 'linked_pr_state'] = 'None'
-                    df.loc[idx, 'PR_activity'] = 'None'
-                
-                idx+=1
-                
-            page+=1
-
-        df['issue_id'] = df.issue_id.astype('int')
-        df['comments_till_date'] = df.comments_till_date.astype('int')
-        df['issue_number'] = df.issue_number.astype('int')
-
-        return df
+        params = {"per_page": "100", "page": 1}
+        if state != "open":
+            params["state"] = state
+        if since is not None:
+            params["since"] = since
+        return LinkHeaderPaginator(
+            self.session,
+            f"https://api.github.com/repos/{repository}/issues",
+            params=params,
+            headers=self.headers,
+            max_in_flight=self.max_in_flight,
+        )
     
-    def get_pulls(self, url):
+    def get_pulls(self, url, engine="rest"):
         """
         Return an dataframe object with 15 columns:
         - ID                      int64
-        - ISSUE_URL               object
+        - ISSUE_URL               string
         - PR_NUMBER               int64
-        - PR_STATE                object
-        - TITLE                   object
-        - FIRST_CREATED_DATE      object
-        - FIRST_CREATED_TIME      object
-        - LAST_UPDATED_DATE       object
-        - LAST_UPDATED_TIME       object
-        - COMMITS_URL             object
-        - REVIEW_COMMENTS_URL     object
-        - ISSUE_COMMENTS_URL      object
-        - ASSIGNEES               object
-        - REQUESTED_REVIEWERS     object
-        - PR_ACTIVITY             object
+        - PR_STATE                category
+        - TITLE                   string
+        - FIRST_CREATED_DATE      string
+        - FIRST_CREATED_TIME      string
+        - LAST_UPDATED_DATE       string
+        - LAST_UPDATED_TIME       string
+        - COMMITS_URL             string
+        - REVIEW_COMMENTS_URL     string
+        - ISSUE_COMMENTS_URL      string
+        - ASSIGNEES               string
+        - REQUESTED_REVIEWERS     string
+        - PR_ACTIVITY             string
+
+        Parameters
+        ----------
+        repository: str:
+            Repository url from Github.
+            Example : "https://github.com/jupyter-naas/awesome-notebooks"
+        engine: str (default "rest"):
+            "rest" or "graphql".
+        """
+        acc = FrameAccumulator(schema=PULLS_SCHEMA)
+        if engine == "graphql":
+            repository = Github.get_repository_url(url)
+            owner, name = repository.split("/")[:2]
+            pages = self.iter_graphql(
+                GRAPHQL_PULLS,
+                {"owner": owner, "name": name},
+                "repository.pullRequests",
+            )
+            for nodes in pages:
+                acc.extend(_pull_row(_rest_pull(node, repository)) for node in nodes)
+            return acc.to_df()
+        for res_json in self.iter_pulls(url):
+            acc.extend(_pull_row(r) for r in res_json if r.get("state") == "open")
+        return acc.to_df()
+
+    def iter_pulls(self, url):
+        """
+        Yield raw pull request objects from the GitHub API, page by page.
 
         Parameters
         ----------
@@ -689,64 +1382,10 @@ class Repositories(Github):
         """
         # Get organisation and repository from url
         repository = Github.get_repository_url(url)
-        
-        df = pd.DataFrame()
-        page = 1
-        while True:
-            params = {
-                "per_page": "100",
-                "page": page,
-            }
-            url = f"https://api.github.com/repos/{repository}/pulls?{urlencode(params, safe='(),')}"
-            res = requests.get(url, headers=self.headers)
-            try:
-                res.raise_for_status()
-            except requests.HTTPError as e:
-                raise(e)
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-
-            for idx, r in enumerate(res_json):
-                if r.get('state') == 'open':
-                    df.loc[idx, 'id'] = r.get('id')
-                    df.loc[idx, 'issue_url'] = r.get('issue_url')
-                    df.loc[idx, 'PR_number'] = r.get('number')
-                    df.loc[idx, 'PR_state'] = 'open'
-                    df.loc[idx, 'Title'] = r.get('title')
-
-                    df.loc[idx, 'first_created_date'] = r.get('created_at').strip('Z').split('T')[0]
-                    df.loc[idx, 'first_created_time'] = r.get('created_at').strip('Z').split('T')[-1]
-                    df.loc[idx, 'last_updated_date'] = r.get('updated_at').strip('Z').split('T')[0]
-                    df.loc[idx, 'last_updated_time'] = r.get('updated_at').strip('Z').split('T')[-1]
-
-                    df.loc[idx, 'commits_url'] = r.get('commits_url')
-                    df.loc[idx, 'review_comments_url'] = r.get('review_comments_url')
-                    df.loc[idx, 'issue_comments_url'] = r.get('comments_url')
-
-                    assignees_lst, reviewers_lst=[],[]
-                    for assignee in r.get('assignees'):
-                        assignees_lst.append(assignee.get('login'))
-                    for reviewer in r.get('requested_reviewers'):
-                        reviewers_lst.append(reviewer.get('login'))
-
-                    if assignees_lst==[]:
-                        df.loc[idx, 'assignees'] = 'None'
-                    elif assignees_lst:
-                        df.loc[idx, 'assignees'] = ", ".join(assignees_lst)
-
-                    if reviewers_lst==[]:
-                        df.loc[idx, 'requested_reviewers'] = 'None'
-                    elif reviewers_lst:
-                        df.loc[idx, 'requested_reviewers'] = ", ".join(reviewers_lst)
-
-                    date_format = "%Y-%m-%d"
-                    delta = datetime.now() - datetime.strptime(df.loc[idx, 'last_updated_date'], date_format)
-                    df.loc[idx, 'PR_activity'] = f'No activity since {delta.days} days'
-
-                df['PR_number'] = df.PR_number.astype('int')
-                df.id = df.id.astype('int')
-
-            page+=1
-
-        return df
+        return LinkHeaderPaginator(
+            self.session,
+            f"https://api.github.com/repos/{repository}/pulls",
+            params={"per_page": "100", "page": 1},
+            headers=self.headers,
+            max_in_flight=self.max_in_flight,
+        )
@@ -1,7 +1,6 @@
 from naas_drivers.driver import InDriver, OutDriver
 from urllib.parse import urljoin
 import pandas as pd
-import requests
 import os
 
 
@@ -32,7 +31,7 @@ class Gsheet(InDriver, OutDriver):
         rows: list = [],
     ):
         self.check_connect()
-        resp = requests.delete(
+        resp = self.session.delete(
             urljoin(self.sheets_api, f"{self.spreadsheet_id}/{sheet_name}"), json=rows
         )
         data = resp.json()
@@ -46,12 +45,26 @@ class Gsheet(InDriver, OutDriver):
         items_per_page: int = BIG_NUM_TO_GETALL,
     ) -> pd.DataFrame:
         self.check_connect()
-        resp = requests.get(
+        resp = self.session.get(
             urljoin(self.sheets_api, f"{self.spreadsheet_id}/{sheet_name}"),
             params={"perPage": items_per_page},
         )
-        data = resp.json()
+        return self.__to_df(resp.json())
 
+    async def aget(
+        self,
+        sheet_name: str,
+        items_per_page: int = BIG_NUM_TO_GETALL,
+    ) -> pd.DataFrame:
+        self.check_connect()
+        resp = await self.session.aget(
+            urljoin(self.sheets_api, f"{self.spreadsheet_id}/{sheet_name}"),
+            params={"perPage": items_per_page},
+        )
+        return self.__to_df(resp.json())
+
+    @staticmethod
+    def __to_df(data):
         # If cell empty then return empty dataframe
         if data.get("status") == 500:
             return pd.DataFrame()
@@ -69,7 +82,7 @@ class Gsheet(InDriver, OutDriver):
 
         if not append:
             try:
-                resp = requests.get(
+                resp = self.session.get(
                     urljoin(self.sheets_api, f"{self.spreadsheet_id}/{sheet_name}"),
                     params={"perPage": BIG_NUM_TO_GETALL},
                 )
@@ -79,13 +92,13 @@ class Gsheet(InDriver, OutDriver):
                     row_count = data.get("data")[0].get("rowNumber")
                     df = pd.DataFrame(data=data["data"], columns=data["columns"])
                     row_count = len(df)
-                    requests.delete(
+                    self.session.delete(
                         urljoin(self.sheets_api, f"{self.spreadsheet_id}/{sheet_name}"),
                         json=list(range(1, row_count + 2)),
                     )
             except Exception:
                 pass
-        resp = requests.post(
+        resp = self.session.post(
             urljoin(self.sheets_api, f"{self.spreadsheet_id}/{sheet_name}"),
             json=data_formated,
         )
@@ -93,3 +106,27 @@ class Gsheet(InDriver, OutDriver):
         if data.get("error"):
             self.print_error(data.get("error"))
         return data
+
+    async def asend(self, data, sheet_name: str, append: bool = True) -> str:
+        self.check_connect()
+        url = urljoin(self.sheets_api, f"{self.spreadsheet_id}/{sheet_name}")
+        data_formated = data
+        if isinstance(data, pd.DataFrame):
+            data_formated = data.astype(str).to_dict(orient="records")
+
+        if not append:
+            try:
+                resp = await self.session.aget(
+                    url, params={"perPage": BIG_NUM_TO_GETALL}
+                )
+                resp.raise_for_status()
+                rows = resp.json().get("data")
+                if rows:
+                    await self.session.adelete(url, json=list(range(1, len(rows) + 2)))
+            except Exception:
+                pass
+        resp = await self.session.apost(url, json=data_formated)
+        data = resp.json()
+        if data.get("error"):
+            self.print_error(data.get("error"))
+        return data
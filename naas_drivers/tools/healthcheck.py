@@ -23,7 +23,7 @@ class Healthcheck(OutDriver):
                 if mode != ""
                 else f"{self.healthUrl}{self.healthkey}"
             )
-            requests.get(url)
+            self.session.get(url)
             return f'{mode if mode != "" else "done"} ==> send to {self.healthUrl}{self.healthkey}, {date.today()}'
         except requests.exceptions.RequestException:
             return f"Error ==> cannot get health server {self.healthUrl}{self.healthkey}, {date.today()}"
@@ -33,7 +33,7 @@ class Healthcheck(OutDriver):
         self.check_connect()
         self.send("start")
         try:
-            r = requests.get(url, auth=auth, verify=verify)
+            r = self.session.get(url, auth=auth, verify=verify)
             if r.status_code == 200:
                 self.send()
                 return f"{url} is heathy send to {self.healthUrl}{self.healthkey} {date.today()}"
@@ -1,7 +1,10 @@
+from naas_drivers.checkpoint import CHECKPOINT_PATH, Checkpoint
 from naas_drivers.driver import InDriver, OutDriver
+from naas_drivers.pagination import CursorPaginator
 import pandas as pd
 import requests
 from datetime import datetime
+import hashlib
 import os
 import string
 import json
@@ -12,9 +15,10 @@ DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 class HSCRUD:
     # class HSCRUD(CRUD):
-    def __init__(self, base_url, req_headers, params):
+    def __init__(self, base_url, req_headers, params, session):
         self.req_headers = req_headers
         self.params = params
+        self.session = session
         self.base_url = base_url
         self.model_name = self.base_url.split("/")[-1]
 
@@ -63,7 +67,7 @@ class HSCRUD:
         return data
 
     def __get_by_page(self, params):
-        res = requests.get(
+        res = self.session.get(
             url=f"{self.base_url}/",
             headers=self.req_headers,
             params=params,
@@ -72,30 +76,91 @@ class HSCRUD:
         res.raise_for_status()
         return res.json()
 
-    def get_all(self, hs_properties=None):
-        items = []
-        params = self.params
+    async def __aget_by_page(self, params):
+        res = await self.session.aget(
+            url=f"{self.base_url}/",
+            headers=self.req_headers,
+            params=params,
+            allow_redirects=False,
+        )
+        res.raise_for_status()
+        return res.json()
+
+    def get_all(self, hs_properties=None, resume=False, checkpoint_path=None):
+        """
+        Return all objects properties in a dataframe.
+
+        Parameters
+        ----------
+        hs_properties: list (default None):
+            Properties to fetch, HubSpot defaults if None.
+        resume: bool (default False):
+            Continue the last extraction of the same hs_properties that failed,
+            from its checkpoint.
+        checkpoint_path: str (default None):
+            Directory where progress is saved, "naas_checkpoints" when resuming.
+        """
+        checkpoint = None
+        if resume or checkpoint_path is not None:
+            # Extractions of other properties do not resume from this one
+            query = {**self.params, "properties": hs_properties}
+            digest = hashlib.sha1(json.dumps(query, sort_keys=True).encode())
+            checkpoint = Checkpoint(
+                f"hubspot-{self.model_name}-{digest.hexdigest()[:16]}",
+                checkpoint_path or CHECKPOINT_PATH,
+            )
+        pages = self.iter_all(hs_properties, checkpoint=checkpoint, resume=resume)
+        items = [item for items in pages for item in items]
+        if checkpoint is not None:
+            checkpoint.clear()
+        return pd.DataFrame(items).reset_index(drop=True)
+
+    def iter_all(self, hs_properties=None, checkpoint=None, resume=False):
+        """
+        Return a lazy iterable over the objects properties, one list per page.
+
+        Parameters
+        ----------
+        hs_properties: list (default None):
+            Properties to fetch, HubSpot defaults if None.
+        checkpoint: Checkpoint (default None):
+            Saves the progress of the extraction.
+        resume: bool (default False):
+            Continue from the checkpoint.
+        """
+        params = dict(self.params)
         if hs_properties is not None:
             params["properties"] = hs_properties
-        more_page = True
-        while more_page:
-            data = self.__get_by_page(params)
-            for row in data.get("results"):
-                properties = row["properties"]
-                items.append(properties)
-            if "paging" in data:
-                params["after"] = data.get("paging").get("next").get("after")
-            else:
-                more_page = False
-        df = pd.DataFrame(items).reset_index(drop=True)
-        params.pop("after")
-        if hs_properties:
-            params.pop("properties")
-            self.params = params
-        return df
 
-    def get(self, uid, hs_properties=None, idproperty=None, hs_associations=None):
-        params = self.params
+        def fetch(after):
+            if after is None:
+                return self.__get_by_page(params)
+            return self.__get_by_page({**params, "after": after})
+
+        async def afetch(after):
+            if after is None:
+                return await self.__aget_by_page(params)
+            return await self.__aget_by_page({**params, "after": after})
+
+        pages = CursorPaginator(
+            fetch,
+            afetch=afetch,
+            get_records=lambda data: [row["properties"] for row in data.get("results")],
+            get_cursor=lambda data: data.get("paging", {}).get("next", {}).get("after"),
+        )
+        if checkpoint is not None:
+            return checkpoint.iterate(pages, resume=resume)
+        return pages
+
+    async def aget_all(self, hs_properties=None):
+        """Async twin of get_all, without checkpoints."""
+        pages = self.iter_all(hs_properties)
+        items = [item async for items in pages for item in items]
+        return pd.DataFrame(items).reset_index(drop=True)
+
+    def __get_params(self, hs_properties, idproperty, hs_associations):
+        # Copy: concurrent calls (aget) must not share the query
+        params = dict(self.params)
         # Get contact with property email
         if idproperty:
             params["idProperty"] = idproperty
@@ -103,23 +168,33 @@ class HSCRUD:
             params["properties"] = hs_properties
         if hs_associations:
             params["associations"] = hs_associations
-        res = requests.get(
+        return params
+
+    def get(self, uid, hs_properties=None, idproperty=None, hs_associations=None):
+        res = self.session.get(
             url=f"{self.base_url}/{uid}",
             headers=self.req_headers,
-            params=params,
+            params=self.__get_params(hs_properties, idproperty, hs_associations),
+            allow_redirects=False,
+        )
+        res.raise_for_status()
+        return res.json()
+
+    async def aget(
+        self, uid, hs_properties=None, idproperty=None, hs_associations=None
+    ):
+        res = await self.session.aget(
+            url=f"{self.base_url}/{uid}",
+            headers=self.req_headers,
+            params=self.__get_params(hs_properties, idproperty, hs_associations),
             allow_redirects=False,
         )
-        if hs_properties:
-            params.pop("properties")
-        if idproperty:
-            params.pop("idProperty")
-        self.params = params
         res.raise_for_status()
         return res.json()
 
     def patch(self, uid, data):
         data = self.__values_format(data)
-        res = requests.patch(
+        res = self.session.patch(
             url=f"{self.base_url}/{uid}",
             headers=self.req_headers,
             params=self.params,
@@ -131,26 +206,40 @@ class HSCRUD:
         print(f"✔️ {self.msg} (id={uid}) successfully updated.")
         return res.json()
 
+    def __created(self, res):
+        res.raise_for_status()
+        res_json = res.json()
+        uid = res_json.get("id")
+        # Message success
+        print(f"✔️ {self.msg} (id={uid}) successfully created.")
+        return uid
+
     def send(self, data):
         data = self.__values_format(data)
-        res = requests.post(
+        res = self.session.post(
             url=f"{self.base_url}/",
             headers=self.req_headers,
             params=self.params,
             json=data,
             allow_redirects=False,
         )
-        res.raise_for_status()
-        res_json = res.json()
-        uid = res_json.get("id")
-        # Message success
-        print(f"✔️ {self.msg} (id={uid}) successfully created.")
-        return uid
+        return self.__created(res)
+
+    async def asend(self, data):
+        data = self.__values_format(data)
+        res = await self.session.apost(
+            url=f"{self.base_url}/",
+            headers=self.req_headers,
+            params=self.params,
+            json=data,
+            allow_redirects=False,
+        )
+        return self.__created(res)
 
     def delete(self, uid):
         result = self.get(uid)
         if result is not None:
-            res = requests.delete(
+            res = self.session.delete(
                 url=f"{self.base_url}/{uid}",
                 headers=self.req_headers,
                 params=self.params,
@@ -272,14 +361,15 @@ class Deal(HSCRUD):
 
 
 class Pipeline:
-    def __init__(self, base_url, req_headers, params):
+    def __init__(self, base_url, req_headers, params, session):
         self.req_headers = req_headers
         self.params = params
+        self.session = session
         self.base_url = base_url
         self.model_name = self.base_url.split("/")[-1]
 
     def get_all(self, pipeline=None, pipeline_id=None):
-        res = requests.get(
+        res = self.session.get(
             url=f"{self.base_url}/",
             headers=self.req_headers,
             params=self.params,
@@ -321,9 +411,10 @@ class Pipeline:
 
 
 class Association:
-    def __init__(self, base_url, req_headers, params):
+    def __init__(self, base_url, req_headers, params, session):
         self.req_headers = req_headers
         self.params = params
+        self.session = session
         self.base_url = base_url
         self.model_name = self.base_url.split("/")[-1]
 
@@ -345,7 +436,7 @@ class Association:
                 f"Please chose one in following list: {associates}"
             )
         if object_check and associate_check:
-            res = requests.get(
+            res = self.session.get(
                 url=f"{self.base_url}/{object_name}/{object_id}/"
                 f"associations/{associate}",
                 headers=self.req_headers,
@@ -377,7 +468,7 @@ class Association:
                 f"Please chose one in following list: {associates}"
             )
         if object_check and associate_check:
-            res = requests.put(
+            res = self.session.put(
                 url=f"{self.base_url}/{object_name}/{object_id}/associations/"
                 f"{associate}/{id_associate}/{object_name}_to_{associate}",
                 headers=self.req_headers,
@@ -393,9 +484,10 @@ class Association:
 
 
 class Note:
-    def __init__(self, base_url, req_headers, params):
+    def __init__(self, base_url, req_headers, params, session):
         self.req_headers = req_headers
         self.params = params
+        self.session = session
         self.base_url = base_url
 
     def create(
@@ -418,7 +510,7 @@ class Note:
                 "metadata": {"body": content},
             }
         )
-        res = requests.post(
+        res = self.session.post(
             self.base_url,
             data=payload,
             headers=self.req_headers,
@@ -449,21 +541,28 @@ class HubSpot(InDriver, OutDriver):
         self.obj_url = f"{self.base_url}/objects"
         self.pip_url = f"{self.base_url}/pipelines"
         self.contacts = Contact(
-            f"{self.obj_url}/contacts", self.req_headers, self.params
+            f"{self.obj_url}/contacts", self.req_headers, self.params, self.session
+        )
+        self.company = HSCRUD(
+            f"{self.obj_url}/company", self.req_headers, self.params, self.session
+        )
+        self.companies = HSCRUD(
+            f"{self.obj_url}/companies", self.req_headers, self.params, self.session
+        )
+        self.deals = Deal(
+            f"{self.obj_url}/deals", self.req_headers, self.params, self.session
         )
-        self.company = HSCRUD(f"{self.obj_url}/company", self.req_headers, self.params)
-        self.companies = HSCRUD(f"{self.obj_url}/companies", self.req_headers, self.params)
-        self.deals = Deal(f"{self.obj_url}/deals", self.req_headers, self.params)
         self.pipelines = Pipeline(
-            f"{self.pip_url}/deals", self.req_headers, self.params
+            f"{self.pip_url}/deals", self.req_headers, self.params, self.session
         )
         self.associations = Association(
-            f"{self.obj_url}", self.req_headers, self.params
+            f"{self.obj_url}", self.req_headers, self.params, self.session
         )
         self.notes = Note(
             "https://api.hubapi.com/engagements/v1/engagements",
             self.req_headers,
             self.params,
+            self.session,
         )
 
         # Set connexion to active
@@ -1,81 +1,27 @@
 # flake8: noqa
 
 from naas_drivers.driver import InDriver
-from typing import Optional, Union, Dict, Any
+from typing import TYPE_CHECKING, Optional, Union, Dict, Any
 
-from transformers import (
-    PretrainedConfig,
-    PreTrainedTokenizer,
-    AutoConfig,
-    AutoTokenizer,
-)
-
-from transformers.pipelines.question_answering import QuestionAnsweringPipeline
-from transformers.pipelines.text2text_generation import (
-    SummarizationPipeline,
-    Text2TextGenerationPipeline,
-    TranslationPipeline,
-)
-from transformers.pipelines.text_classification import TextClassificationPipeline
-from transformers.pipelines.text_generation import TextGenerationPipeline
-from transformers.pipelines.feature_extraction import FeatureExtractionPipeline
-from transformers.pipelines.token_classification import TokenClassificationPipeline
-from transformers.pipelines.fill_mask import FillMaskPipeline
-from transformers.pipelines.table_question_answering import (
-    TableQuestionAnsweringPipeline,
-)
-from transformers.pipelines.zero_shot_classification import (
-    ZeroShotClassificationPipeline,
-)
-from transformers.pipelines.conversational import ConversationalPipeline
-from transformers.pipelines.image_classification import ImageClassificationPipeline
-from transformers.pipelines.base import infer_framework_from_model, Pipeline
-from transformers.utils import logging
-from transformers.file_utils import is_torch_available, is_tf_available
-
-
-logger = logging.get_logger(__name__)
-
-if is_torch_available():
-    import torch
-    from transformers.models.auto.modeling_auto import (
-        AutoModelForSequenceClassification,
-        AutoModelForSeq2SeqLM,
-        AutoModelForCausalLM,
-        AutoModelForQuestionAnswering,
-        AutoModelForMaskedLM,
-        AutoModel,
-        AutoModelForTokenClassification,
-        AutoModelForTableQuestionAnswering,
-        AutoModelForImageClassification,
-    )
-
-if is_tf_available():
-    import tensorflow as tf
-    from transformers.models.auto.modeling_tf_auto import (
-        TFAutoModelForSequenceClassification,
-        TFAutoModelForSeq2SeqLM,
-        TFAutoModelForCausalLM,
-        TFAutoModelForQuestionAnswering,
-        TFAutoModelForMaskedLM,
-        TFAutoModel,
-        TFAutoModelForTokenClassification,
-    )
+if TYPE_CHECKING:
+    from transformers import Pipeline, PretrainedConfig, PreTrainedTokenizer
 
+# transformers, torch and tensorflow take seconds to import: the classes are
+# named here and only imported by Huggingface.get.
 
 TASKS = {
     "feature-extraction": {
-        "impl": FeatureExtractionPipeline,
-        "tf": TFAutoModel if is_tf_available() else None,
-        "pt": AutoModel if is_torch_available() else None,
+        "impl": "FeatureExtractionPipeline",
+        "tf": "TFAutoModel",
+        "pt": "AutoModel",
         "default": {
             "model": {"pt": "distilbert-base-cased", "tf": "distilbert-base-cased"}
         },
     },
     "text-classification": {
-        "impl": TextClassificationPipeline,
-        "tf": TFAutoModelForSequenceClassification if is_tf_available() else None,
-        "pt": AutoModelForSequenceClassification if is_torch_available() else None,
+        "impl": "TextClassificationPipeline",
+        "tf": "TFAutoModelForSequenceClassification",
+        "pt": "AutoModelForSequenceClassification",
         "default": {
             "model": {
                 "pt": "distilbert-base-uncased-finetuned-sst-2-english",
@@ -84,9 +30,9 @@ TASKS = {
         },
     },
     "token-classification": {
-        "impl": TokenClassificationPipeline,
-        "tf": TFAutoModelForTokenClassification if is_tf_available() else None,
-        "pt": AutoModelForTokenClassification if is_torch_available() else None,
+        "impl": "TokenClassificationPipeline",
+        "tf": "TFAutoModelForTokenClassification",
+        "pt": "AutoModelForTokenClassification",
         "default": {
             "model": {
                 "pt": "dbmdz/bert-large-cased-finetuned-conll03-english",
@@ -95,9 +41,9 @@ TASKS = {
         },
     },
     "question-answering": {
-        "impl": QuestionAnsweringPipeline,
-        "tf": TFAutoModelForQuestionAnswering if is_tf_available() else None,
-        "pt": AutoModelForQuestionAnswering if is_torch_available() else None,
+        "impl": "QuestionAnsweringPipeline",
+        "tf": "TFAutoModelForQuestionAnswering",
+        "pt": "AutoModelForQuestionAnswering",
         "default": {
             "model": {
                 "pt": "distilbert-base-cased-distilled-squad",
@@ -106,8 +52,8 @@ TASKS = {
         },
     },
     "table-question-answering": {
-        "impl": TableQuestionAnsweringPipeline,
-        "pt": AutoModelForTableQuestionAnswering if is_torch_available() else None,
+        "impl": "TableQuestionAnsweringPipeline",
+        "pt": "AutoModelForTableQuestionAnswering",
         "tf": None,
         "default": {
             "model": {
@@ -118,22 +64,22 @@ TASKS = {
         },
     },
     "fill-mask": {
-        "impl": FillMaskPipeline,
-        "tf": TFAutoModelForMaskedLM if is_tf_available() else None,
-        "pt": AutoModelForMaskedLM if is_torch_available() else None,
+        "impl": "FillMaskPipeline",
+        "tf": "TFAutoModelForMaskedLM",
+        "pt": "AutoModelForMaskedLM",
         "default": {"model": {"pt": "distilroberta-base", "tf": "distilroberta-base"}},
     },
     "summarization": {
-        "impl": SummarizationPipeline,
-        "tf": TFAutoModelForSeq2SeqLM if is_tf_available() else None,
-        "pt": AutoModelForSeq2SeqLM if is_torch_available() else None,
+        "impl": "SummarizationPipeline",
+        "tf": "TFAutoModelForSeq2SeqLM",
+        "pt": "AutoModelForSeq2SeqLM",
         "default": {"model": {"pt": "sshleifer/distilbart-cnn-12-6", "tf": "t5-small"}},
     },
     # This task is a special case as it's parametrized by SRC, TGT languages.
     "translation": {
-        "impl": TranslationPipeline,
-        "tf": TFAutoModelForSeq2SeqLM if is_tf_available() else None,
-        "pt": AutoModelForSeq2SeqLM if is_torch_available() else None,
+        "impl": "TranslationPipeline",
+        "tf": "TFAutoModelForSeq2SeqLM",
+        "pt": "AutoModelForSeq2SeqLM",
         "default": {
             ("en", "fr"): {"model": {"pt": "t5-base", "tf": "t5-base"}},
             ("en", "de"): {"model": {"pt": "t5-base", "tf": "t5-base"}},
@@ -141,21 +87,21 @@ TASKS = {
         },
     },
     "text2text-generation": {
-        "impl": Text2TextGenerationPipeline,
-        "tf": TFAutoModelForSeq2SeqLM if is_tf_available() else None,
-        "pt": AutoModelForSeq2SeqLM if is_torch_available() else None,
+        "impl": "Text2TextGenerationPipeline",
+        "tf": "TFAutoModelForSeq2SeqLM",
+        "pt": "AutoModelForSeq2SeqLM",
         "default": {"model": {"pt": "t5-base", "tf": "t5-base"}},
     },
     "text-generation": {
-        "impl": TextGenerationPipeline,
-        "tf": TFAutoModelForCausalLM if is_tf_available() else None,
-        "pt": AutoModelForCausalLM if is_torch_available() else None,
+        "impl": "TextGenerationPipeline",
+        "tf": "TFAutoModelForCausalLM",
+        "pt": "AutoModelForCausalLM",
         "default": {"model": {"pt": "gpt2", "tf": "gpt2"}},
     },
     "zero-shot-classification": {
-        "impl": ZeroShotClassificationPipeline,
-        "tf": TFAutoModelForSequenceClassification if is_tf_available() else None,
-        "pt": AutoModelForSequenceClassification if is_torch_available() else None,
+        "impl": "ZeroShotClassificationPipeline",
+        "tf": "TFAutoModelForSequenceClassification",
+        "pt": "AutoModelForSequenceClassification",
         "default": {
             "model": {"pt": "facebook/bart-large-mnli", "tf": "roberta-large-mnli"},
             "config": {"pt": "facebook/bart-large-mnli", "tf": "roberta-large-mnli"},
@@ -163,9 +109,9 @@ TASKS = {
         },
     },
     "conversational": {
-        "impl": ConversationalPipeline,
-        "tf": TFAutoModelForCausalLM if is_tf_available() else None,
-        "pt": AutoModelForCausalLM if is_torch_available() else None,
+        "impl": "ConversationalPipeline",
+        "tf": "TFAutoModelForCausalLM",
+        "pt": "AutoModelForCausalLM",
         "default": {
             "model": {
                 "pt": "microsoft/DialoGPT-medium",
@@ -174,9 +120,9 @@ TASKS = {
         },
     },
     "image-classification": {
-        "impl": ImageClassificationPipeline,
+        "impl": "ImageClassificationPipeline",
         "tf": None,
-        "pt": AutoModelForImageClassification if is_torch_available() else None,
+        "pt": "AutoModelForImageClassification",
         "default": {"model": {"pt": "google/vit-base-patch16-224"}},
     },
 }
@@ -192,13 +138,13 @@ class Huggingface(InDriver):
         self,
         task: str,
         model: Optional = None,
-        config: Optional[Union[str, PretrainedConfig]] = None,
-        tokenizer: Optional[Union[str, PreTrainedTokenizer]] = None,
+        config: Optional[Union[str, "PretrainedConfig"]] = None,
+        tokenizer: Optional[Union[str, "PreTrainedTokenizer"]] = None,
         framework: Optional[str] = None,
         revision: Optional[str] = None,
         model_kwargs: Dict[str, Any] = {},
         **kwargs,
-    ) -> Pipeline:
+    ) -> "Pipeline":
         """
         Args:
         task (:obj:`str`):
@@ -233,12 +179,15 @@ class Huggingface(InDriver):
         Returns:
             NLP Pipeline
         """
+        import transformers
+        from transformers.pipelines.base import infer_framework_from_model
+        from transformers.utils import logging
+
+        logger = logging.get_logger(__name__)
+
         if task in TASK_ALIASES:
             task = TASK_ALIASES[task]
 
-        targeted_task = TASKS[task]
-        task_class = targeted_task["impl"]
-
         if task not in TASKS:
             raise KeyError(
                 "Unknown task {}, available tasks are {}".format(
@@ -246,6 +195,18 @@ class Huggingface(InDriver):
                 )
             )
 
+        targeted_task = dict(TASKS[task])
+        targeted_task["impl"] = getattr(transformers, targeted_task["impl"])
+        for key, is_available in (
+            ("tf", transformers.is_tf_available),
+            ("pt", transformers.is_torch_available),
+        ):
+            name = targeted_task.get(key)
+            if name is not None and is_available():
+                targeted_task[key] = getattr(transformers, name)
+            else:
+                targeted_task[key] = None
+
         if framework is None:
             framework, model = infer_framework_from_model(
                 model, targeted_task, revision=revision, task=task
@@ -253,7 +214,7 @@ class Huggingface(InDriver):
 
         task_class, model_class = targeted_task["impl"], targeted_task[framework]
         if isinstance(config, str):
-            config = AutoConfig.from_pretrained(
+            config = transformers.AutoConfig.from_pretrained(
                 config, revision=revision, _from_pipeline=task, **model_kwargs
             )
 
@@ -270,7 +231,7 @@ class Huggingface(InDriver):
                     "class or a path/identifier to a pretrained tokenizer."
                 )
         if isinstance(tokenizer, (str, tuple)):
-            tokenizer = AutoTokenizer.from_pretrained(tokenizer)
+            tokenizer = transformers.AutoTokenizer.from_pretrained(tokenizer)
 
         if isinstance(model, str):
             # Handle transparent TF/PT model conversion
@@ -1,5 +1,4 @@
 from naas_drivers.driver import OutDriver
-import requests
 
 
 class Ifttt(OutDriver):
@@ -11,7 +10,7 @@ class Ifttt(OutDriver):
     def send(self, event, data=None):
         self.check_connect()
         url = f"https://maker.ifttt.com/trigger/{event}/with/key/{self._key}"
-        r = requests.post(
+        r = self.session.post(
             url=url,
             json=data,
         )
@@ -1,5 +1,4 @@
 from naas_drivers.driver import OutDriver
-import requests
 
 
 class Integromat(OutDriver):
@@ -10,7 +9,7 @@ class Integromat(OutDriver):
 
     def send(self, data=None):
         self.check_connect()
-        r = requests.post(
+        r = self.session.post(
             url=self._key,
             json=data,
         )
@@ -1,7 +1,6 @@
 from naas_drivers.driver import InDriver, OutDriver
 from dateutil.parser import parse
 import pandas as pd
-import requests
 import os
 
 current_token = os.environ.get("JUPYTERHUB_API_TOKEN", None)
@@ -27,7 +26,7 @@ class Jupyter(InDriver, OutDriver):
             "password": password,
         }
         headers = {"Authorization": f"token {self.token}"}
-        r = requests.post(signup_url, data=login, headers=headers)
+        r = self.session.post(signup_url, data=login, headers=headers)
         r.raise_for_status()
         return r.json()
 
@@ -37,7 +36,7 @@ class Jupyter(InDriver, OutDriver):
             "Authorization": f"token {self.token}",
             "Content-type": "application/json",
         }
-        r = requests.get(signup_url, headers=headers)
+        r = self.session.get(signup_url, headers=headers)
         r.raise_for_status()
         return r.json()
 
@@ -45,7 +44,7 @@ class Jupyter(InDriver, OutDriver):
         signup_url = f"{self.base_url}/hub/authorize/{username}"
         headers = {"Authorization": f"token {self.token}"}
         data = {"is_authorized": is_authorized}
-        r = requests.post(signup_url, data=data, headers=headers)
+        r = self.session.post(signup_url, data=data, headers=headers)
         r.raise_for_status()
         return r.json()
 
@@ -56,14 +55,14 @@ class Jupyter(InDriver, OutDriver):
             "password": password,
         }
         headers = {"Authorization": f"token {self.token}"}
-        r = requests.put(signup_url, data=login, headers=headers)
+        r = self.session.put(signup_url, data=login, headers=headers)
         r.raise_for_status()
         return r.json()
 
     def list_users(self):
         signup_url = f"{self.base_url}/hub/signup"
         headers = {"Authorization": f"token {self.token}"}
-        r = requests.get(signup_url, headers=headers)
+        r = self.session.get(signup_url, headers=headers)
         r.raise_for_status()
         df = pd.DataFrame.from_records(r.json().get("data"))
         return df
@@ -74,7 +73,7 @@ class Jupyter(InDriver, OutDriver):
             "username": username,
         }
         headers = {"Authorization": f"token {self.token}"}
-        r = requests.delete(signup_url, data=login, headers=headers)
+        r = self.session.delete(signup_url, data=login, headers=headers)
         r.raise_for_status()
         return r.json()
 
@@ -94,7 +93,7 @@ class Jupyter(InDriver, OutDriver):
 
     def get_users(self):
         self.check_connect()
-        r = requests.get(
+        r = self.session.get(
             f"{self.api_url}/users",
             headers={
                 "Authorization": f"token {self.token}",
@@ -106,7 +105,7 @@ class Jupyter(InDriver, OutDriver):
 
     def get_user(self, username):
         self.check_connect()
-        r = requests.get(
+        r = self.session.get(
             f"{self.api_url}/users/{username}",
             headers={
                 "Authorization": f"token {self.token}",
@@ -118,7 +117,7 @@ class Jupyter(InDriver, OutDriver):
 
     def delete_user_terminal(self, username, termId):
         self.check_connect()
-        r = requests.delete(
+        r = self.session.delete(
             f"{self.base_url}/user/{username}/api/terminals/{termId}",
             headers={
                 "Authorization": f"token {self.token}",
@@ -130,7 +129,7 @@ class Jupyter(InDriver, OutDriver):
 
     def get_user_terminal(self, username):
         self.check_connect()
-        r = requests.get(
+        r = self.session.get(
             f"{self.base_url}/user/{username}/api/terminals",
             headers={
                 "Authorization": f"token {self.token}",
@@ -142,7 +141,7 @@ class Jupyter(InDriver, OutDriver):
 
     def delete_user_session(self, username, sessionId):
         self.check_connect()
-        r = requests.delete(
+        r = self.session.delete(
             f"{self.base_url}/user/{username}/api/sessions/{sessionId}",
             headers={
                 "Authorization": f"token {self.token}",
@@ -154,7 +153,7 @@ class Jupyter(InDriver, OutDriver):
 
     def get_user_session(self, username):
         self.check_connect()
-        r = requests.get(
+        r = self.session.get(
             f"{self.base_url}/user/{username}/api/sessions",
             headers={
                 "Authorization": f"token {self.token}",
@@ -193,7 +192,7 @@ class Jupyter(InDriver, OutDriver):
 
     def stop_user(self, username):
         self.check_connect()
-        r = requests.delete(
+        r = self.session.delete(
             f"{self.api_url}/users/{username}/server",
             headers={
                 "Authorization": f"token {self.token}",
@@ -204,7 +203,7 @@ class Jupyter(InDriver, OutDriver):
 
     def start_user(self, username, user_options={}):
         self.check_connect()
-        r = requests.post(
+        r = self.session.post(
             f"{self.api_url}/users/{username}/server",
             headers={
                 "Authorization": f"token {self.token}",
@@ -227,7 +226,7 @@ class Jupyter(InDriver, OutDriver):
         try:
             headers = {"Authorization": f"token {self.token}"}
             url = f'https://app.naas.ai/user/{username}/proxy/5000/job'
-            res = requests.get(url, headers=headers)
+            res = self.session.get(url, headers=headers)
             return res.json()
         except ValueError:
             return []
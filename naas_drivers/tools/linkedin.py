@@ -1,17 +1,22 @@
+from naas_drivers.accumulator import FrameAccumulator
+from naas_drivers.cache import CACHE_MODES, TTLCache
+from naas_drivers.checkpoint import CHECKPOINT_PATH, Checkpoint
+from naas_drivers.concurrency import MAX_IN_FLIGHT, fan_out
+from naas_drivers.driver import ConnectDriver
+from naas_drivers.pagination import CursorPaginator, OffsetPaginator
+from naas_drivers.ratelimit import RateLimiter, TokenBucket
+from naas_drivers.schema import Schema
+from naas_drivers.stream import RecordStream
+from naas_drivers.sync import SYNC_PATH, SyncStore
 import pandas as pd
 import requests
-import time
 import urllib
 from datetime import datetime
-import secrets
 import pydash as _pd
+import hashlib
 # import naas
-from naas_drivers.tools.emailbuilder import EmailBuilder
-from naas_drivers.tools.naas_auth import NaasAuth
 import json
-
-emailbuilder = EmailBuilder()
-naasauth = NaasAuth()
+import threading
 
 LINKEDIN_API = "https://3hz1hdpnlf.execute-api.eu-west-1.amazonaws.com/prod"
 RELEASE_MESSAGE = (
@@ -21,23 +26,144 @@ RELEASE_MESSAGE = (
 )
 DATE_FORMAT = "%Y-%m-%d"
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
-TIME_SLEEP = secrets.randbelow(5) + 5
 HEADERS = {"Content-Type": "application/json"}
+# Both hosts reach the same LinkedIn account, they share one rate limit
+LINKEDIN_HOSTS = ("www.linkedin.com", urllib.parse.urlparse(LINKEDIN_API).netloc)
+# Calls to LinkedIn start at one every 5s, speed up to one every 2s while
+# accepted and halve their rate on 429/999
+RATE_LIMIT = {
+    "rate": 0.2,
+    "burst": 3,
+    "max_rate": 0.5,
+    "min_rate": 0.02,
+    "increase": 0.01,
+    "jitter": 0.5,
+}
+# RateLimiter of the LinkedIn hosts per rate_limit, shared by all the drivers
+# reaching LinkedIn (LinkedIn, LinkedInSalesNavigator)
+RATE_LIMITERS = {}
+RATE_LIMITERS_LOCK = threading.Lock()
+# Days profiles and companies stay in the cache (connect cache_path)
+DAY = 24 * 3600
+CACHE_TTL = {
+    "profile.identity": 30 * DAY,
+    "profile.network": DAY,
+    "profile.contact": 30 * DAY,
+    "company.info": 7 * DAY,
+}
+# Columns of Profile.enrich per field
+ENRICH_COLUMNS = {
+    "identity": [
+        "PROFILE_ID",
+        "PROFILE_URL",
+        "FIRSTNAME",
+        "LASTNAME",
+        "SUMMARY",
+        "OCCUPATION",
+        "INDUSTRY_NAME",
+        "ADDRESS",
+        "REGION",
+        "COUNTRY",
+        "LOCATION",
+        "BIRTHDATE",
+        "BACKGROUND_PICTURE",
+        "PROFILE_PICTURE",
+    ],
+    "network": [
+        "PROFILE_ID",
+        "PROFILE_URL",
+        "DISTANCE",
+        "FOLLOWING",
+        "FOLLOWABLE",
+        "FOLLOWERS_COUNT",
+    ],
+    "contact": [
+        "PROFILE_ID",
+        "PROFILE_URL",
+        "EMAIL",
+        "CONNECTED_AT",
+        "BIRTHDATE",
+        "ADDRESS",
+        "TWITTER",
+        "PHONENUMBER",
+        "WEBSITES",
+    ],
+}
+ENRICH_FIELDS = tuple(ENRICH_COLUMNS)
+# Dataframes returned by Post.get_engagement
+ENGAGEMENT_KINDS = ("stats", "comments", "likes", "views")
+FOLLOWERS_SCHEMA = Schema(
+    "linkedin.network.followers",
+    {
+        "PROFILE_ID": "string",
+        "PROFILE_URL": "string",
+        "PUBLIC_ID": "string",
+        "FIRSTNAME": "string",
+        "LASTNAME": "string",
+        "FULLNAME": "string",
+        "OCCUPATION": "string",
+        "PROFILE_PICTURE": "string",
+        "BACKGROUND_PICTURE": "string",
+        "FOLLOWER_COUNT": "Int64",
+        "FOLLOWING": "boolean",
+        "INFLUENCER": "boolean",
+        "DATE_EXTRACT": "string",
+    },
+)
 EMAIL_COOKIES = "⚠️ Naas.ai - Update your Linkedin cookies"
 
 
-class LinkedIn:
+def get_rate_limiter(rate_limit=None):
+    """
+    RateLimiter of the LinkedIn hosts, one per rate_limit: drivers connected
+    with the same one share its bucket, as they reach the same account.
+
+    Parameters
+    ----------
+    rate_limit: dict (default RATE_LIMIT):
+        TokenBucket parameters, ex: {"rate": 0.5, "burst": 5}.
+    """
+    rate_limit = rate_limit or RATE_LIMIT
+    key = json.dumps(rate_limit, sort_keys=True)
+    with RATE_LIMITERS_LOCK:
+        limiter = RATE_LIMITERS.get(key)
+        if limiter is None:
+            bucket = TokenBucket(**rate_limit)
+            limiter = RateLimiter({host: bucket for host in LINKEDIN_HOSTS})
+            RATE_LIMITERS[key] = limiter
+    return limiter
+
+
+def set_rate_limit(session, rate_limit=None):
+    """
+    Replace the RateLimiter of session with the shared one of rate_limit,
+    see get_rate_limiter. Return it.
+    """
+    limiter = get_rate_limiter(rate_limit)
+    session.middlewares = [
+        m for m in session.middlewares if not isinstance(m, RateLimiter)
+    ] + [limiter]
+    return limiter
+
+
+class LinkedIn(ConnectDriver):
     deprecated = True
+    cache = None
 
     @staticmethod
     def get_user_email():
+        from naas_drivers.tools.naas_auth import NaasAuth
+
         email = None
-        user = naasauth.connect().user.me()
+        user = NaasAuth().connect().user.me()
         email = user.get("username")
         return email
 
     @staticmethod
     def email_linkedin_limit(email):
+        from naas_drivers.tools.emailbuilder import EmailBuilder
+
+        emailbuilder = EmailBuilder()
         content = {
             "header_naas": (
                 "<a href='https://www.naas.ai/'>"
@@ -94,7 +220,7 @@ class LinkedIn:
 
     def get_profile_urn(self, url):
         lk_id = LinkedIn.get_profile_id(url)
-        res = requests.get(
+        res = self.session.get(
             f"https://www.linkedin.com/voyager/api/identity/profiles/{lk_id}",
             cookies=self.cookies,
             headers=self.headers,
@@ -111,6 +237,19 @@ class LinkedIn:
         except requests.HTTPError as e:
             return e
 
+    def request_api(self, endpoint, params=None):
+        req_url = f"{LINKEDIN_API}/{endpoint}"
+        if params:
+            req_url = f"{req_url}?{urllib.parse.urlencode(params, safe='(),')}"
+        res = self.session.post(req_url, json=self.cookies, headers=HEADERS)
+        res.raise_for_status()
+
+        # Manage LinkedIn API errors
+        LinkedIn.manage_api_error(res)
+
+        # Get json result
+        return res.json()
+
     def get_birthdate(self, bd):
         if bd is None:
             return "No birthdate"
@@ -124,10 +263,89 @@ class LinkedIn:
             occupation = occupation.strip().replace("\n", " ")
         return occupation
 
+    def set_rate_limit(self, rate_limit=None):
+        """
+        Pace the session calls to LinkedIn, shared by the sub-clients.
+
+        Parameters
+        ----------
+        rate_limit: dict (default RATE_LIMIT):
+            TokenBucket parameters, ex: {"rate": 0.5, "burst": 5}.
+        """
+        self.rate_limiter = set_rate_limit(self.session, rate_limit)
+
+    def get_cached(self, endpoint, key, fetch, cache="use"):
+        """
+        Return fetch() through the profile and company cache, when connected
+        with a cache_path.
+
+        Parameters
+        ----------
+        endpoint: str:
+            Cached endpoint, its time to live is CACHE_TTL[endpoint].
+        key: str:
+            Public identifier of the profile or company.
+        fetch: callable:
+            Request the value, it must be JSON serializable.
+        cache: str (default "use"):
+            "use" the cached value, "refresh" it or "bypass" the cache.
+        """
+        if cache not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode {cache!r}, use one of {CACHE_MODES}")
+        if self.cache is None:
+            return fetch()
+        return self.cache.fetch(endpoint, key, fetch, mode=cache)
+
+    def sync_posts(self, key, pages, refresh=10, path=SYNC_PATH, complete=None):
+        """
+        Upsert the new posts of a feed into its snapshot and return it.
+        Paging stops at the first page of posts already in the snapshot,
+        once the `refresh` most recent posts are fetched: their stats are
+        updated, the other known posts are kept as they are.
+
+        Parameters
+        ----------
+        key: str:
+            Snapshot key, ex: "linkedin/companies/naas-ai/posts".
+        pages: iterable:
+            Pages of posts, most recent first (iter_posts_feed).
+        refresh: int (default 10):
+            Most recent posts whose stats are refreshed.
+        path: str (default "naas_sync"):
+            Directory of the Parquet snapshots.
+        complete: callable (default None):
+            complete(df) -> df, adds columns to the fetched posts.
+        """
+        store = SyncStore(path)
+        snapshot = store.read_snapshot(key)
+        known = set()
+        if snapshot is not None and "ACTIVITY_ID" in snapshot.columns:
+            known = set(snapshot["ACTIVITY_ID"].astype(str))
+        posts = []
+        for page in pages:
+            posts.extend(page)
+            if len(posts) >= refresh and all(
+                str(post.get("ACTIVITY_ID")) in known for post in page
+            ):
+                break
+        posts = [
+            post
+            for i, post in enumerate(posts)
+            if i < refresh or str(post.get("ACTIVITY_ID")) not in known
+        ]
+        df = pd.DataFrame(posts)
+        if complete is not None and len(df) > 0:
+            df = complete(df)
+        # Activity ids grow with time: most recent posts first
+        return store.merge_snapshot(key, df, on="ACTIVITY_ID", sort_by="ACTIVITY_ID")
+
     def connect(
         self,
         li_at: str = None,
         jessionid: str = None,
+        rate_limit: dict = None,
+        cache_path: str = None,
+        cache_ttl: dict = None,
     ):
         # Init lk attribute
         self.li_at = li_at
@@ -145,15 +363,21 @@ class LinkedIn:
             "X-Requested-With": "XMLHttpRequest",
             "X-Restli-Protocol-Version": "2.0.0",
         }
+        self.set_rate_limit(rate_limit)
+
+        # Profiles and companies cached on disk, shared by processes
+        self.cache = None
+        if cache_path is not None:
+            self.cache = TTLCache(cache_path, ttls={**CACHE_TTL, **(cache_ttl or {})})
 
         # Init end point
-        self.profile = Profile(self.cookies, self.headers)
-        self.network = Network(self.cookies, self.headers)
-        self.invitation = Invitation(self.cookies, self.headers)
-        self.message = Message(self.cookies, self.headers)
-        self.post = Post(self.cookies, self.headers)
-        self.event = Event(self.cookies, self.headers)
-        self.company = Company(self.cookies, self.headers)
+        self.profile = Profile(self.cookies, self.headers, self.session, self.cache)
+        self.network = Network(self.cookies, self.headers, self.session)
+        self.invitation = Invitation(self.cookies, self.headers, self.session)
+        self.message = Message(self.cookies, self.headers, self.session)
+        self.post = Post(self.cookies, self.headers, self.session)
+        self.event = Event(self.cookies, self.headers, self.session)
+        self.company = Company(self.cookies, self.headers, self.session, self.cache)
 
         # Set connexion to active
         self.connected = True
@@ -161,12 +385,14 @@ class LinkedIn:
 
 
 class Profile(LinkedIn):
-    def __init__(self, cookies, headers):
+    def __init__(self, cookies, headers, session, cache=None):
         LinkedIn.__init__(self)
         self.cookies = cookies
         self.headers = headers
+        self._session = session
+        self.cache = cache
 
-    def get_identity(self, profile_url=None, sleep=True):
+    def get_identity(self, profile_url=None, sleep=True, cache="use"):
         """
         Return an dataframe object with 15 columns:
         - FIRSTNAME
@@ -190,17 +416,27 @@ class Profile(LinkedIn):
         profile_url: str:
             Profile URL from LinkedIn.
             Example : "https://www.linkedin.com/in/florent-ravenel/"
+        cache: str (default "use"):
+            "use" the cached profile, "refresh" it or "bypass" the cache.
         """
         res_json = {}
         if profile_url is None:
             print("❌ No profile URL. Please enter a profile URL from LinkedIn")
             return res_json
-        result = {}
         lk_public_id = LinkedIn.get_profile_id(profile_url)
+        row = self.get_cached(
+            "profile.identity",
+            lk_public_id,
+            lambda: self.__identity_row(lk_public_id),
+            cache,
+        )
+        return pd.DataFrame([row])
+
+    def __identity_row(self, lk_public_id):
         req_url = (
             f"https://www.linkedin.com/voyager/api/identity/profiles/{lk_public_id}"
         )
-        res = requests.get(req_url, cookies=self.cookies, headers=self.headers)
+        res = self.session.get(req_url, cookies=self.cookies, headers=self.headers)
         # Raise error
         res.raise_for_status()
         # Parse json
@@ -241,7 +477,7 @@ class Profile(LinkedIn):
                 if profile_root and profile_url_end:
                     profile_pic_url = f"{profile_root}{profile_url_end}"
         lk_id = data.get("entityUrn", "").replace("urn:li:fs_profile:", "")
-        result = {
+        return {
             "PROFILE_ID": lk_id,
             "PROFILE_URL": f"https://www.linkedin.com/in/{lk_id}",
             "PUBLIC_ID": data.get("publicIdentifier"),
@@ -258,11 +494,8 @@ class Profile(LinkedIn):
             "BACKGROUND_PICTURE": bg_pic_url,
             "PROFILE_PICTURE": profile_pic_url,
         }
-        if sleep:
-            time.sleep(TIME_SLEEP)
-        return pd.DataFrame([result])
 
-    def get_network(self, profile_url=None, sleep=True):
+    def get_network(self, profile_url=None, sleep=True, cache="use"):
         """
         Return an dataframe object with 7 columns:
         - PROFILE_ID
@@ -277,15 +510,22 @@ class Profile(LinkedIn):
         profile_url: str:
             Profile URL from LinkedIn.
             Example : "https://www.linkedin.com/in/florent-ravenel/"
+        cache: str (default "use"):
+            "use" the cached profile, "refresh" it or "bypass" the cache.
         """
         res_json = {}
         if profile_url is None:
             print("❌ No profile URL. Please enter a profile URL from LinkedIn")
             return res_json
-        result = {}
         lk_id = LinkedIn.get_profile_id(profile_url)
+        row = self.get_cached(
+            "profile.network", lk_id, lambda: self.__network_row(lk_id), cache
+        )
+        return pd.DataFrame([row])
+
+    def __network_row(self, lk_id):
         req_url = f"https://www.linkedin.com/voyager/api/identity/profiles/{lk_id}/networkinfo"
-        res = requests.get(req_url, cookies=self.cookies, headers=self.headers)
+        res = self.session.get(req_url, cookies=self.cookies, headers=self.headers)
         # Raise error
         res.raise_for_status()
         # Parse json
@@ -294,7 +534,7 @@ class Profile(LinkedIn):
         profile_id = data.get("entityUrn", "").replace(
             "urn:li:fs_profileNetworkInfo:", ""
         )
-        result = {
+        return {
             "PROFILE_ID": profile_id,
             "PROFILE_URL": f"https://www.linkedin.com/in/{profile_id}",
             "DISTANCE": data.get("distance", {}).get("value"),
@@ -302,11 +542,8 @@ class Profile(LinkedIn):
             "FOLLOWABLE": data.get("followable"),
             "FOLLOWERS_COUNT": data.get("followersCount"),
         }
-        if sleep:
-            time.sleep(TIME_SLEEP)
-        return pd.DataFrame([result])
 
-    def get_contact(self, profile_url=None, sleep=True):
+    def get_contact(self, profile_url=None, sleep=True, cache="use"):
         """
         Return an dataframe object with 11 columns:
         - PROFILE_ID
@@ -325,15 +562,22 @@ class Profile(LinkedIn):
         profile_url: str:
             Profile URL from LinkedIn.
             Example : "https://www.linkedin.com/in/florent-ravenel/"
+        cache: str (default "use"):
+            "use" the cached profile, "refresh" it or "bypass" the cache.
         """
         res_json = {}
         if profile_url is None:
             print("❌ No profile URL. Please enter a profile URL from LinkedIn")
             return res_json
-        result = {}
         lk_id = LinkedIn.get_profile_id(profile_url)
+        row = self.get_cached(
+            "profile.contact", lk_id, lambda: self.__contact_row(lk_id), cache
+        )
+        return pd.DataFrame([row])
+
+    def __contact_row(self, lk_id):
         req_url = f"https://www.linkedin.com/voyager/api/identity/profiles/{lk_id}/profileContactInfo"
-        res = requests.get(req_url, cookies=self.cookies, headers=self.headers)
+        res = self.session.get(req_url, cookies=self.cookies, headers=self.headers)
         res.raise_for_status()
         # Parse json
         res_json = res.json()
@@ -365,7 +609,7 @@ class Profile(LinkedIn):
                 lk_url = rows["url"]
                 lk_urls = f"{lk_urls}{lk_url}, "
         profile_id = data.get("entityUrn", "").replace("urn:li:fs_contactinfo:", "")
-        result = {
+        return {
             "PROFILE_ID": profile_id,
             "PROFILE_URL": f"https://www.linkedin.com/in/{profile_id}",
             "EMAIL": data.get("emailAddress"),
@@ -377,9 +621,6 @@ class Profile(LinkedIn):
             "WEBSITES": lk_urls,
             #             "INTERESTS": data.get("interests"),
         }
-        if sleep:
-            time.sleep(TIME_SLEEP)
-        return pd.DataFrame([result])
 
     def get_resume(self, profile_url=None, profile_urn=None):
         """
@@ -413,7 +654,7 @@ class Profile(LinkedIn):
             if profile_urn is None:
                 return "Please enter a valid profile_url or profile_urn"
         req_url = f"{LINKEDIN_API}/profile/getResume?profile_urn={profile_urn}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+        res = self.session.post(req_url, json=self.cookies, headers=HEADERS)
         res.raise_for_status()
 
         # Manage LinkedIn API errors
@@ -459,7 +700,7 @@ class Profile(LinkedIn):
         if profile_id is None:
             return "Please enter a valid profile_url. It must follow this pattern: 'https://*.linkedin.com/in/*' "
         req_url = f"{LINKEDIN_API}/profile/getTopCard?profile_id={profile_id}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+        res = self.session.post(req_url, json=self.cookies, headers=HEADERS)
         res.raise_for_status()
 
         # Manage LinkedIn API errors
@@ -470,6 +711,127 @@ class Profile(LinkedIn):
         df = pd.DataFrame(res_json)
         return df.reset_index(drop=True)
 
+    def enrich(
+        self,
+        profile_urls,
+        fields=ENRICH_FIELDS,
+        max_in_flight=MAX_IN_FLIGHT,
+        batch_size=50,
+        resume=False,
+        checkpoint_path=None,
+        cache="use",
+    ):
+        """
+        Enrich many profiles at once. Return a dataframe object with one row
+        per distinct public id: PUBLIC_ID, the columns of get_identity,
+        get_network and get_contact selected by fields, and ERROR.
+        The requests of all profiles are sent concurrently, paced by the
+        shared LinkedIn rate limit (see connect).
+
+        Parameters
+        ----------
+        profile_urls: list:
+            Profile URLs from LinkedIn, duplicates are enriched once.
+        fields: list (default ["identity", "network", "contact"]):
+            Parts of the profile to get.
+        max_in_flight: int (default 10):
+            Maximum number of requests sent at once.
+        batch_size: int (default 50):
+            Profiles enriched between two checkpoint saves.
+        resume: bool (default False):
+            Continue the last enrichment of these profiles that failed, from its checkpoint.
+        checkpoint_path: str (default None):
+            Directory where progress is saved, "naas_checkpoints" when resuming.
+        cache: str (default "use"):
+            "use" the cached profiles, "refresh" them or "bypass" the cache.
+        """
+        public_ids = list(dict.fromkeys(map(LinkedIn.get_profile_id, profile_urls)))
+        checkpoint = None
+        if resume or checkpoint_path is not None:
+            digest = hashlib.sha1("\n".join(public_ids + list(fields)).encode())
+            checkpoint = Checkpoint(
+                f"linkedin-enrich-{digest.hexdigest()[:16]}",
+                checkpoint_path or CHECKPOINT_PATH,
+                every=1,
+            )
+        columns = ["PUBLIC_ID"]
+        for field in fields:
+            columns.extend(c for c in ENRICH_COLUMNS.get(field, []) if c not in columns)
+        acc = FrameAccumulator(columns=columns + ["ERROR"])
+        for rows in self.iter_enrich(
+            public_ids,
+            fields,
+            max_in_flight,
+            batch_size,
+            checkpoint=checkpoint,
+            resume=resume,
+            cache=cache,
+        ):
+            acc.extend(rows)
+        if checkpoint is not None:
+            checkpoint.clear()
+        return acc.to_df()
+
+    def iter_enrich(
+        self,
+        profile_urls,
+        fields=ENRICH_FIELDS,
+        max_in_flight=MAX_IN_FLIGHT,
+        batch_size=50,
+        checkpoint=None,
+        resume=False,
+        cache="use",
+    ):
+        """
+        Yield enriched profiles batch by batch, as lists of enrich rows.
+        Parameters are the same as enrich, progress is saved to `checkpoint`
+        (naas_drivers.checkpoint.Checkpoint) when given.
+        Failed requests (404, ...) are reported in the ERROR column.
+        """
+        getters = {
+            "identity": self.__identity_row,
+            "network": self.__network_row,
+            "contact": self.__contact_row,
+        }
+        unknown = [field for field in fields if field not in getters]
+        if len(unknown) > 0:
+            raise ValueError(f"Unknown fields {unknown}, choose among {ENRICH_FIELDS}")
+        public_ids = list(dict.fromkeys(map(LinkedIn.get_profile_id, profile_urls)))
+
+        def get_part(request):
+            public_id, field = request
+            try:
+                get_row = getters[field]
+                return self.get_cached(
+                    f"profile.{field}", public_id, lambda: get_row(public_id), cache
+                )
+            except requests.HTTPError as e:
+                return {"ERROR": f"{field}: {e}"}
+
+        def fetch(start, count):
+            batch = public_ids[start:][:count]
+            calls = [(public_id, field) for public_id in batch for field in fields]
+            parts = iter(fan_out(get_part, calls, max_in_flight))
+            rows = []
+            for public_id in batch:
+                row, errors = {"PUBLIC_ID": public_id}, []
+                for _ in fields:
+                    part = next(parts)
+                    if "ERROR" in part:
+                        errors.append(part.pop("ERROR"))
+                    # The first part giving a value wins (BIRTHDATE, ADDRESS)
+                    for key, value in part.items():
+                        if row.get(key) is None:
+                            row[key] = value
+                row["ERROR"] = "; ".join(errors) if len(errors) > 0 else None
+                rows.append(row)
+            return rows
+
+        pages = OffsetPaginator(fetch, count=batch_size, stop_short=True)
+        if checkpoint is not None:
+            pages = checkpoint.iterate(pages, resume=resume)
+        return pages
+
     def get_posts_feed(
         self,
         profile_url,
@@ -479,6 +841,8 @@ class Profile(LinkedIn):
         until={},
         sleep=True,
         pagination_token=None,
+        resume=False,
+        checkpoint_path=None,
     ):
         """
         Return an dataframe object with 32 columns:
@@ -539,94 +903,157 @@ class Profile(LinkedIn):
             Example : "{"POST_URL": "https://www.linkedin.com/posts/naas-ai_opensource-data-activity-6890025972754710529-akfv"
 
         sleep: boolean (default True):
-            Sleeping time between function will be randomly between 3 to 5 seconds.
+            Ignored, kept for compatibility: calls are paced by the rate_limit
+            of connect().
 
         pagination_token: str (default None):
             Token related to post used to start function from this post.
             If None, function starts from the last post.
 
+        resume: bool (default False):
+            Continue the last extraction of this profile that failed, from its checkpoint.
+
+        checkpoint_path: str (default None):
+            Directory where progress is saved, "naas_checkpoints" when resuming.
+
         """
         # Get profile
         if profile_id is None:
             profile_id = LinkedIn.get_profile_urn(self, profile_url)
             if profile_id is None:
                 return "Please enter a valid profile_url or profile_urn"
-        # Until init
-        until_check = False
-        keys = []
-        if isinstance(until, dict) and len(until) > 0:
-            keys = [k for k, v in until.items()]
-        # Loop init
-        start = 0
-        df = pd.DataFrame()
+        checkpoint = None
+        if resume or checkpoint_path is not None:
+            checkpoint = Checkpoint(
+                f"linkedin-posts-{profile_id}", checkpoint_path or CHECKPOINT_PATH
+            )
+        posts = [
+            post
+            for posts in self.iter_posts_feed(
+                profile_url,
+                profile_id,
+                count,
+                limit,
+                until,
+                sleep,
+                pagination_token,
+                checkpoint=checkpoint,
+                resume=resume,
+            )
+            for post in posts
+        ]
+        if checkpoint is not None:
+            checkpoint.clear()
+        return pd.DataFrame(posts).reset_index(drop=True)
+
+    def iter_posts_feed(
+        self,
+        profile_url,
+        profile_id=None,
+        count=1,
+        limit=10,
+        until={},
+        sleep=True,
+        pagination_token=None,
+        checkpoint=None,
+        resume=False,
+    ):
+        """
+        Yield posts page by page, as lists of get_posts_feed rows.
+        Parameters are the same as get_posts_feed, progress is saved to
+        `checkpoint` (naas_drivers.checkpoint.Checkpoint) when given.
+        """
+        if profile_id is None:
+            profile_id = LinkedIn.get_profile_urn(self, profile_url)
         if limit != -1 and count > limit:
             limit = count
-        while True:
-            if pagination_token is not None:
-                req_url = f"{LINKEDIN_API}/profile/getPostsFeed?profile_id={profile_id}&count={count}&pagination_token={pagination_token}"
-            else:
-                req_url = f"{LINKEDIN_API}/profile/getPostsFeed?profile_id={profile_id}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            # Get response in dataframe
-            tmp_df = pd.DataFrame(res_json)
-
-            # Check until limit
-            for k in keys:
-                v = until.get(k)
-                if k in tmp_df.columns:
-                    values = tmp_df[k].astype(str).unique().tolist()
-                    if str(v) in values:
-                        until_check = True
-                        break
-            # Get pagination token + update start
-            pagination_token = tmp_df.loc[0, "PAGINATION_TOKEN"]
-
-            # Concat dataframe
-            df = pd.concat([df, tmp_df], axis=0)
 
+        def fetch(pagination_token):
+            params = {"profile_id": profile_id, "count": count}
+            if pagination_token is not None:
+                params["pagination_token"] = pagination_token
+            return self.request_api("profile/getPostsFeed", params)
+
+        pages = CursorPaginator(
+            fetch,
+            get_records=lambda res_json: res_json,
+            get_cursor=lambda res_json: res_json[0].get("PAGINATION_TOKEN"),
+            cursor=pagination_token,
+            limit=limit,
+        )
+        if checkpoint is not None:
+            pages = checkpoint.iterate(pages, resume=resume)
+        for posts in pages:
+            yield posts
             # Break if until condition is True
-            if until_check:
-                break
-            # Time sleep to avoid linkedin ban
-            if sleep:
-                time.sleep(TIME_SLEEP)
-            start += count
-            if limit != -1 and start >= limit:
+            if isinstance(until, dict) and any(
+                str(post.get(k)) == str(v)
+                for k, v in until.items()
+                for post in posts
+                if k in post
+            ):
                 break
-        return df.reset_index(drop=True)
+
+    def sync_posts_feed(
+        self, profile_url, profile_id=None, count=1, refresh=10, path=SYNC_PATH
+    ):
+        """
+        Incremental get_posts_feed: only posts published since the previous
+        sync and the `refresh` most recent ones are fetched, then merged into
+        the snapshot stored in `path`. Return the same dataframe as
+        get_posts_feed, with all the posts synced so far.
+
+        Parameters
+        ----------
+        profile_url: str:
+            Profile url from Linkedin.
+            Example : "https://www.linkedin.com/in/florent-ravenel/"
+        profile_id: str (default None):
+            Linkedin unique profile id identifier.
+        count: int (default 1, max 100):
+            Number of posts per request.
+        refresh: int (default 10):
+            Most recent posts whose stats are refreshed.
+        path: str (default "naas_sync"):
+            Directory of the Parquet snapshots.
+        """
+        if profile_id is None:
+            profile_id = LinkedIn.get_profile_urn(self, profile_url)
+        pages = self.iter_posts_feed(profile_url, profile_id, count, limit=-1)
+        key = f"linkedin/profiles/{profile_id}/posts"
+        return self.sync_posts(key, pages, refresh, path)
 
 
 class Network(LinkedIn):
-    def __init__(self, cookies, headers):
+    def __init__(self, cookies, headers, session):
         LinkedIn.__init__(self)
         self.cookies = cookies
         self.headers = headers
+        self._session = session
+
+    def __iter_pages(self, endpoint, start, count, api_limit, limit=-1):
+        def fetch(start, count):
+            params = {"start": start, "count": count, "limit": api_limit}
+            return self.request_api(endpoint, params)
+
+        return OffsetPaginator(fetch, start=start, count=count, limit=limit)
 
     def get_followers(self, start=0, count=100, limit=1000):
         """
         Return an dataframe object with 13 columns:
-        - PROFILE_ID                    object
-        - PROFILE_URL                   object
-        - PUBLIC_ID                     object
-        - FIRSTNAME                     object
-        - LASTNAME                      object
-        - FULLNAME                      object
-        - OCCUPATION                    object
-        - PROFILE_PICTURE               object
-        - BACKGROUND_PICTURE            object
-        - FOLLOWER_COUNT                int64
-        - FOLLOWING                     bool
-        - INFLUENCER                    bool
-        - DATE_EXTRACT                  object
+        - PROFILE_ID                    string
+        - PROFILE_URL                   string
+        - PUBLIC_ID                     string
+        - FIRSTNAME                     string
+        - LASTNAME                      string
+        - FULLNAME                      string
+        - OCCUPATION                    string
+        - PROFILE_PICTURE               string
+        - BACKGROUND_PICTURE            string
+        - FOLLOWER_COUNT                Int64
+        - FOLLOWING                     boolean
+        - INFLUENCER                    boolean
+        - DATE_EXTRACT                  string
 
         Parameters
         ----------
@@ -637,38 +1064,33 @@ class Network(LinkedIn):
             Number of requests sent to LinkedIn API.
 
         limit: int (default 1000, unlimited=-1):
-            Number of result return by function.
+            Number of followers returned from start, duplicates excluded.
 
         """
-        limit_init = limit
-        df_followers = pd.DataFrame()
-        if limit != -1 and limit < count:
-            count = limit
-        while True:
-            req_url = f"{LINKEDIN_API}/network/getFollowers?start={start}&count={count}&limit={limit}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
+        df_followers = self.stream_followers(start, count, limit).to_df(
+            schema=FOLLOWERS_SCHEMA
+        )
+        return df_followers.reset_index(drop=True)
 
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
+    def stream_followers(self, start=0, count=100, limit=1000):
+        """
+        Return a lazy iterable over the followers without duplicates, one list
+        of get_followers rows per page (naas_drivers.stream.RecordStream).
+        Export them in constant memory with .write("followers.parquet").
+        Parameters are the same as get_followers.
+        """
+        if limit != -1:
+            count = min(count, limit)
+        pages = self.__iter_pages("network/getFollowers", start, count, limit)
+        return RecordStream(pages, limit=limit)
 
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            df = pd.DataFrame(res_json)
-            df_followers = pd.concat([df_followers, df], axis=0)
-            start += count
-            if limit != -1 and start >= limit:
-                break
-            time.sleep(TIME_SLEEP)
-        if len(df_followers) > 0:
-            df_followers = df_followers.drop_duplicates("PROFILE_ID").reset_index(
-                drop=True
-            )
-            if limit != -1:
-                df_followers = df_followers[:limit_init]
-        return df_followers.reset_index(drop=True)
+    def iter_followers(self, start=0, count=100, limit=1000):
+        """
+        Return a lazy iterable over the followers, one list of get_followers
+        rows per page. Parameters are the same as get_followers.
+        limit counts the rows fetched, duplicates included.
+        """
+        return self.__iter_pages("network/getFollowers", start, count, limit, limit)
 
     def get_connections(self, start=0, count=100, limit=1000):
         """
@@ -692,43 +1114,42 @@ class Network(LinkedIn):
             Number of requests sent to LinkedIn API.
 
         limit: int (default 1000, unlimited=-1):
-            Number of result return by function.
+            Number of connections returned from start, duplicates excluded.
 
         """
-        df_connections = pd.DataFrame()
-        if limit != -1 and limit < count:
-            count = limit
-        while True:
-            req_url = f"{LINKEDIN_API}/network/getConnections?start={start}&count={count}&limit={limit}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
+        df_connections = self.stream_connections(start, count, limit).to_df()
+        df_connections = df_connections.sort_values(
+            by="CREATED_AT", ascending=False
+        ).astype(str)
+        return df_connections.reset_index(drop=True)
 
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
+    def stream_connections(self, start=0, count=100, limit=1000):
+        """
+        Return a lazy iterable over the connections without duplicates, one
+        list of get_connections rows per page (naas_drivers.stream.RecordStream).
+        Export them in constant memory with .write("connections.parquet").
+        Parameters are the same as get_connections.
+        """
+        if limit != -1:
+            count = min(count, limit)
+        pages = self.__iter_pages("network/getConnections", start, count, limit)
+        return RecordStream(pages, limit=limit)
 
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            df = pd.DataFrame(res_json)
-            df_connections = pd.concat([df_connections, df], axis=0)
-            start += count
-            if limit != -1 and start >= limit:
-                break
-            time.sleep(TIME_SLEEP)
-        df_connections = (
-            df_connections.drop_duplicates()
-            .sort_values(by="CREATED_AT", ascending=False)
-            .astype(str)
-        )
-        return df_connections.reset_index(drop=True)
+    def iter_connections(self, start=0, count=100, limit=1000):
+        """
+        Return a lazy iterable over the connections, one list of
+        get_connections rows per page. Parameters are the same as get_connections.
+        limit counts the rows fetched, duplicates included.
+        """
+        return self.__iter_pages("network/getConnections", start, count, limit, limit)
 
 
 class Invitation(LinkedIn):
-    def __init__(self, cookies, headers):
+    def __init__(self, cookies, headers, session):
         LinkedIn.__init__(self)
         self.cookies = cookies
         self.headers = headers
+        self._session = session
 
     def get_received(self, start=0, count=100, limit=-1):
         """
@@ -762,28 +1183,33 @@ class Invitation(LinkedIn):
             Number of result return by function.
 
         """
-        df = pd.DataFrame()
-        while True:
-            if limit != -1 and limit < count:
-                count = limit
-            req_url = f"{LINKEDIN_API}/invitation/get?start={start}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
+        df = self.iter_received(start, count, limit).to_df()
+        return df.reset_index(drop=True)
 
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
+    def stream_received(self, start=0, count=100, limit=-1):
+        """
+        Return a lazy iterable over the received invitations without
+        duplicates, one list of get_received rows per page
+        (naas_drivers.stream.RecordStream). Parameters are the same as
+        get_received.
+        """
+        return RecordStream(self.iter_received(start, count, limit))
 
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df], axis=0)
-            start += count
-            if limit != -1:
-                limit -= count
-            time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
+    def iter_received(self, start=0, count=100, limit=-1):
+        """
+        Return a lazy iterable over the received invitations, one list of
+        get_received rows per page. Parameters are the same as get_received.
+        """
+
+        def fetch(start, count):
+            return self.request_api("invitation/get", {"start": start, "count": count})
+
+        return OffsetPaginator(
+            fetch,
+            start=start,
+            count=count,
+            limit=limit,
+        )
 
     def get_sent(self, start=0, count=100, limit=-1):
         """
@@ -816,28 +1242,34 @@ class Invitation(LinkedIn):
             Number of result return by function.
 
         """
-        df = pd.DataFrame()
-        while True:
-            if limit != -1 and limit < count:
-                count = limit
-            req_url = f"{LINKEDIN_API}/invitation/getSent?start={start}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
+        df = self.iter_sent(start, count, limit).to_df()
+        return df.reset_index(drop=True)
 
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
+    def stream_sent(self, start=0, count=100, limit=-1):
+        """
+        Return a lazy iterable over the sent invitations without duplicates,
+        one list of get_sent rows per page (naas_drivers.stream.RecordStream).
+        Parameters are the same as get_sent.
+        """
+        return RecordStream(self.iter_sent(start, count, limit))
 
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df], axis=0)
-            start += count
-            if limit != -1:
-                limit -= count
-            time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
+    def iter_sent(self, start=0, count=100, limit=-1):
+        """
+        Return a lazy iterable over the sent invitations, one list of
+        get_sent rows per page. Parameters are the same as get_sent.
+        """
+
+        def fetch(start, count):
+            return self.request_api(
+                "invitation/getSent", {"start": start, "count": count}
+            )
+
+        return OffsetPaginator(
+            fetch,
+            start=start,
+            count=count,
+            limit=limit,
+        )
 
     def response(
         self,
@@ -871,7 +1303,7 @@ class Invitation(LinkedIn):
             "is_generic": is_generic,
         }
         req_url = f"{LINKEDIN_API}/invitation/response?{urllib.parse.urlencode(params, safe='(),')}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+        res = self.session.post(req_url, json=self.cookies, headers=HEADERS)
         res.raise_for_status()
         res_json = res.json()
         if action == "accept":
@@ -951,22 +1383,22 @@ class Invitation(LinkedIn):
                 )
         # Post request
         req_url = "https://www.linkedin.com/voyager/api/voyagerRelationshipsDashMemberRelationships?action=verifyQuotaAndCreate"
-        res = requests.post(
+        res = self.session.post(
             req_url,
             data=json.dumps(payload),
             cookies=self.cookies,
             headers=self.headers,
         )
         res.raise_for_status()
-        time.sleep(TIME_SLEEP)
         return "✉️ Invitation successfully sent !"
 
 
 class Message(LinkedIn):
-    def __init__(self, cookies, headers):
+    def __init__(self, cookies, headers, session):
         LinkedIn.__init__(self)
         self.cookies = cookies
         self.headers = headers
+        self._session = session
 
     def get_conversations(
         self,
@@ -979,11 +1411,11 @@ class Message(LinkedIn):
         This function sends a POST request to Naas LinkedIn's API endpoint to retrieve conversation data.
         It retrieves the data in batches (default batch size is 20) and concatenates the results into a pandas DataFrame.
         The function continues to fetch data until the specified limit is reached, or until there are no more conversations to fetch.
-        An optional sleep parameter can be used to introduce a delay between requests to avoid hitting API rate limits.
+        Requests are paced by the rate_limit of connect().
 
         Parameters:
         limit (int): The maximum number of conversations to fetch. If not specified, defaults to 20. The maximum allowed limit is 600.
-        sleep (bool): Whether to introduce a delay between requests. If not specified, defaults to True.
+        sleep (bool): Ignored, kept for compatibility.
 
         Returns:
         df (pandas.DataFrame): A DataFrame containing the conversation data. The DataFrame consists of the following columns:
@@ -1007,7 +1439,7 @@ class Message(LinkedIn):
         """
 
         # Init
-        df = pd.DataFrame()
+        acc = FrameAccumulator()
         count = 20
         limit_max = 600
 
@@ -1020,7 +1452,7 @@ class Message(LinkedIn):
         params = {"count": count}
         while True:
             req_url = f"{LINKEDIN_API}/message/getConversations?{urllib.parse.urlencode(params, safe='(),')}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res = self.session.post(req_url, json=self.cookies, headers=HEADERS)
             res.raise_for_status()
 
             # Manage LinkedIn API errors
@@ -1028,21 +1460,18 @@ class Message(LinkedIn):
 
             # Get json result
             res_json = res.json()
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df])
+            acc.extend(res_json)
 
             # Check if result is not empty else break
-            if len(tmp_df) == 0:
+            if len(res_json) == 0:
                 break
-            if len(df) >= limit:
+            if len(acc) >= limit:
                 break
             # Set created before params
-            last_message_sent_at = tmp_df["LAST_MESSAGE_SENT_AT"].iloc[-1]
+            last_message_sent_at = res_json[-1]["LAST_MESSAGE_SENT_AT"]
             created_before = int(datetime.strptime(last_message_sent_at, DATETIME_FORMAT).strftime("%s") + "000")
             params["created_before"] = created_before
-            if sleep:
-                time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
+        return acc.to_df().reset_index(drop=True)
 
     def get_messages(
         self,
@@ -1051,49 +1480,37 @@ class Message(LinkedIn):
         limit=20,
         sleep=False,
     ):
-        # Init
-        df = pd.DataFrame()
-        start = 0
-        count = 20
-        limit_max = 100
-
         # Get conversation ID
         conversation_id = conversation_url.split(
             "https://www.linkedin.com/messaging/thread/"
         )[-1].split("/")[0]
+        df = self.iter_messages(conversation_id, limit, sleep).to_df()
+        return df.reset_index(drop=True)
 
-        # Set count and limit
-        if limit < count:
-            count = limit
+    def iter_messages(self, conversation_id, limit=20, sleep=False):
+        """
+        Return a lazy iterable over the messages of a conversation, one list
+        per page of 20 (limit is capped to 100).
+        """
+        count = 20
+        limit_max = 100
         if limit > limit_max:
             limit = limit_max
-        while True:
+
+        def fetch(start, count):
             params = {
                 "conversation_id": conversation_id,
                 "start": start,
                 "count": count,
             }
-            req_url = f"{LINKEDIN_API}/message/getMessages?{urllib.parse.urlencode(params, safe='(),')}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
+            return self.request_api("message/getMessages", params)
 
-            # Get json result
-            res_json = res.json()
-            if len(res_json) > 0:
-                tmp_df = pd.DataFrame(res_json)
-                df = pd.concat([df, tmp_df])
-            # Check if result is not empty else break
-            if len(res_json) == 0 or len(res_json) < count:
-                break
-            if len(df) >= limit:
-                break
-            start += count
-            if sleep:
-                time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
+        return OffsetPaginator(
+            fetch,
+            count=count,
+            limit=limit,
+            stop_short=True,
+        )
 
     def send(self, content, recipients_url=None, recipients_urn=None):
         recipient_errors = []
@@ -1132,14 +1549,13 @@ class Message(LinkedIn):
             "keyVersion": "LEGACY_INBOX",
             "conversationCreate": message_event,
         }
-        res = requests.post(
+        res = self.session.post(
             "https://www.linkedin.com/voyager/api/messaging/conversations",
             params=params,
             json=payload,
             cookies=self.cookies,
             headers=self.headers,
         )
-        time.sleep(TIME_SLEEP)
         try:
             res.raise_for_status()
             return "💬 Message successfully sent !"
@@ -1148,10 +1564,11 @@ class Message(LinkedIn):
 
 
 class Post(LinkedIn):
-    def __init__(self, cookies, headers):
+    def __init__(self, cookies, headers, session):
         LinkedIn.__init__(self)
         self.cookies = cookies
         self.headers = headers
+        self._session = session
 
     def get_stats(self, post_url=None, activity_id=None):
         """
@@ -1204,15 +1621,88 @@ class Post(LinkedIn):
             activity_id = LinkedIn.get_activity_id(post_url)
             if activity_id is None:
                 return "Please enter a valid post_url or activity_id"
+        # Get json result
+        return pd.DataFrame(self.__stats(activity_id)).reset_index(drop=True)
+
+    def __stats(self, activity_id):
         req_url = f"{LINKEDIN_API}/post/getStats?activity_id={activity_id}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+        res = self.session.post(req_url, json=self.cookies, headers=HEADERS)
         res.raise_for_status()
 
         # Manage LinkedIn API errors
         LinkedIn.manage_api_error(res)
+        return res.json()
 
-        # Get json result
-        return pd.DataFrame(res.json()).reset_index(drop=True)
+    def get_engagement(
+        self,
+        activity_ids=None,
+        post_urls=None,
+        kinds=ENGAGEMENT_KINDS,
+        limit=-1,
+        max_in_flight=MAX_IN_FLIGHT,
+    ):
+        """
+        Collect the engagement of many posts at once. Return a dict of
+        dataframe objects by kind, with ACTIVITY_ID as first column:
+        - stats: one row per post, columns of get_stats
+        - comments: one row per comment, columns of get_comments
+        - likes: one row per like, columns of get_likes
+        - views: one row per post, VIEWS
+        Posts are fetched concurrently, paced by the shared LinkedIn rate
+        limit (see connect). A post failing for a kind gets a single row in
+        its dataframe with the error in the last column, ERROR, and the
+        other posts are still collected.
+
+        Parameters
+        ----------
+        activity_ids: list (default None):
+            Linkedin unique post id identifiers.
+        post_urls: list (default None):
+            Post urls from Linkedin, added to activity_ids.
+        kinds: list (default ["stats", "comments", "likes", "views"]):
+            Dataframes to collect.
+        limit: int (default -1, unlimited=-1):
+            Maximum number of comments and likes per post.
+        max_in_flight: int (default 10):
+            Maximum number of posts fetched at once.
+        """
+
+        def views(activity_id):
+            params = {"activity_id": activity_id}
+            res_json = self.request_api("company/getPostsViews", params)
+            return [{"VIEWS": res_json.get("VIEWS")}]
+
+        getters = {
+            "stats": lambda a: pd.DataFrame(self.__stats(a)).to_dict("records"),
+            "comments": lambda a: list(self.iter_comments(a, limit=limit).records()),
+            "likes": lambda a: list(self.iter_likes(a, limit=limit).records()),
+            "views": views,
+        }
+        unknown = [kind for kind in kinds if kind not in getters]
+        if len(unknown) > 0:
+            raise ValueError(f"Unknown kinds {unknown}, use one of {ENGAGEMENT_KINDS}")
+        activity_ids = list(activity_ids or [])
+        activity_ids += [LinkedIn.get_activity_id(url) for url in post_urls or []]
+        activity_ids = list(dict.fromkeys(activity_ids))
+
+        def get_records(call):
+            kind, activity_id = call
+            try:
+                return getters[kind](activity_id)
+            except requests.RequestException as e:
+                return [{"ERROR": f"{kind}: {e}"}]
+
+        calls = [(kind, a) for kind in kinds for a in activity_ids]
+        results = fan_out(get_records, calls, max_in_flight)
+        accs = {kind: FrameAccumulator() for kind in kinds}
+        for (kind, activity_id), records in zip(calls, results):
+            accs[kind].extend({"ACTIVITY_ID": activity_id, **r} for r in records)
+        dfs = {}
+        for kind, acc in accs.items():
+            df = acc.to_df()
+            columns = [column for column in df.columns if column != "ERROR"]
+            dfs[kind] = df.reindex(columns=columns + ["ERROR"])
+        return dfs
 
     def get_polls(self, post_url=None, activity_id=None):
         """
@@ -1250,7 +1740,7 @@ class Post(LinkedIn):
             if activity_id is None:
                 return "Please enter a valid post_url or activity_id"
         req_url = f"{LINKEDIN_API}/post/getPolls?activity_id={activity_id}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+        res = self.session.post(req_url, json=self.cookies, headers=HEADERS)
         res.raise_for_status()
 
         # Manage LinkedIn API errors
@@ -1306,7 +1796,8 @@ class Post(LinkedIn):
             Number of followers return by function. It will start with the most recent followers.
 
         sleep: boolean (default True):
-            Sleeping time between function will be randomly between 3 to 5 seconds.
+            Ignored, kept for compatibility: calls are paced by the rate_limit
+            of connect().
 
         """
         # Get profile
@@ -1314,29 +1805,25 @@ class Post(LinkedIn):
             activity_id = LinkedIn.get_activity_id(post_url)
             if activity_id is None:
                 return "Please enter a valid post_url or activity_id"
-        df = pd.DataFrame()
-        while True:
-            if limit != -1 and limit < count:
-                count = limit
-            req_url = f"{LINKEDIN_API}/post/getComments?activity_id={activity_id}&start={start}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
+        df = self.iter_comments(activity_id, start, count, limit, sleep).to_df()
+        return df.reset_index(drop=True)
 
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
+    def iter_comments(self, activity_id, start=0, count=100, limit=-1, sleep=True):
+        """
+        Return a lazy iterable over the post comments, one list of get_comments
+        rows per page. Parameters are the same as get_comments.
+        """
 
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df], axis=0)
-            start += count
-            if limit != -1:
-                limit -= count
-            if sleep:
-                time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
+        def fetch(start, count):
+            params = {"activity_id": activity_id, "start": start, "count": count}
+            return self.request_api("post/getComments", params)
+
+        return OffsetPaginator(
+            fetch,
+            start=start,
+            count=count,
+            limit=limit,
+        )
 
     def get_likes(
         self, post_url=None, activity_id=None, start=0, count=100, limit=-1, sleep=True
@@ -1380,7 +1867,8 @@ class Post(LinkedIn):
             Number of followers return by function. It will start with the most recent followers.
 
         sleep: boolean (default True):
-            Sleeping time between function will be randomly between 3 to 5 seconds.
+            Ignored, kept for compatibility: calls are paced by the rate_limit
+            of connect().
 
         """
         # Get profile
@@ -1388,36 +1876,33 @@ class Post(LinkedIn):
             activity_id = LinkedIn.get_activity_id(post_url)
             if activity_id is None:
                 return "Please enter a valid post_url or activity_id"
-        df = pd.DataFrame()
-        while True:
-            if limit != -1 and limit < count:
-                count = limit
-            req_url = f"{LINKEDIN_API}/post/getLikes?activity_id={activity_id}&start={start}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
+        df = self.iter_likes(activity_id, start, count, limit, sleep).to_df()
+        return df.reset_index(drop=True)
 
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
+    def iter_likes(self, activity_id, start=0, count=100, limit=-1, sleep=True):
+        """
+        Return a lazy iterable over the post likes, one list of get_likes
+        rows per page. Parameters are the same as get_likes.
+        """
 
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df], axis=0)
-            start += count
-            if limit != -1:
-                limit -= count
-            if sleep:
-                time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
+        def fetch(start, count):
+            params = {"activity_id": activity_id, "start": start, "count": count}
+            return self.request_api("post/getLikes", params)
+
+        return OffsetPaginator(
+            fetch,
+            start=start,
+            count=count,
+            limit=limit,
+        )
 
 
 class Event(LinkedIn):
-    def __init__(self, cookies, headers):
+    def __init__(self, cookies, headers, session):
         LinkedIn.__init__(self)
         self.cookies = cookies
         self.headers = headers
+        self._session = session
 
     def get_guests(
         self, event_url="https://www.linkedin.com/events/6762355783188525056/"
@@ -1441,18 +1926,22 @@ class Event(LinkedIn):
 
         """
         req_url = f"{LINKEDIN_API}/event/getGuests?event_link={event_url}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+        res = self.session.post(req_url, json=self.cookies, headers=HEADERS)
         res.raise_for_status()
         return pd.DataFrame(res.json()).reset_index(drop=True)
 
 
 class Company(LinkedIn):
-    def __init__(self, cookies, headers):
+    def __init__(self, cookies, headers, session, cache=None):
         LinkedIn.__init__(self)
         self.cookies = cookies
         self.headers = headers
+        self._session = session
+        self.cache = cache
 
-    def get_info(self, company_url="https://www.linkedin.com/company/naas-ai/"):
+    def get_info(
+        self, company_url="https://www.linkedin.com/company/naas-ai/", cache="use"
+    ):
         """
         Return an dataframe object with 18 columns:
         - COMPANY_ID                    object
@@ -1480,17 +1969,23 @@ class Company(LinkedIn):
             Company url from Linkedin.
             Example : "https://www.linkedin.com/company/naas-ai/"
 
+        cache: str (default "use"):
+            "use" the cached company, "refresh" it or "bypass" the cache.
+
         """
-        df = pd.DataFrame()
-        req_url = f"{LINKEDIN_API}/company/getInfo?company_url={company_url}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-        res.raise_for_status()
 
-        # Manage LinkedIn API errors
-        LinkedIn.manage_api_error(res)
+        def fetch():
+            req_url = f"{LINKEDIN_API}/company/getInfo?company_url={company_url}"
+            res = self.session.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+            return res.json()
 
         # Get json result
-        df = pd.DataFrame(res.json())
+        universal_name = company_url.split("/company/")[-1].split("/")[0]
+        df = pd.DataFrame(self.get_cached("company.info", universal_name, fetch, cache))
         return df.reset_index(drop=True)
 
     def get_followers(
@@ -1532,39 +2027,43 @@ class Company(LinkedIn):
             Number of followers return by function. It will start with the most recent followers.
 
         sleep: boolean (default True):
-            Sleeping time between function will be randomly between 3 to 5 seconds.
+            Ignored, kept for compatibility: calls are paced by the rate_limit
+            of connect().
 
         """
-        df = pd.DataFrame()
-        while True:
-            if limit != -1 and limit < count:
-                count = limit
-            req_url = f"{LINKEDIN_API}/company/getFollowers?company_url={company_url}&start={start}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df], axis=0)
-            start += count
-            if limit != -1:
-                limit -= count
-            if sleep:
-                time.sleep(TIME_SLEEP)
+        df = self.iter_followers(company_url, start, count, limit, sleep).to_df()
         if len(df) > 0:
             df = df.sort_values(by="FOLLOWED_AT", ascending=False)
         return df.reset_index(drop=True)
 
+    def iter_followers(
+        self,
+        company_url="https://www.linkedin.com/company/naas-ai/",
+        start=0,
+        count=1,
+        limit=10,
+        sleep=True,
+    ):
+        """
+        Return a lazy iterable over the company followers, one list of
+        get_followers rows per page. Parameters are the same as get_followers.
+        """
+
+        def fetch(start, count):
+            params = {"company_url": company_url, "start": start, "count": count}
+            return self.request_api("company/getFollowers", params)
+
+        return OffsetPaginator(
+            fetch,
+            start=start,
+            count=count,
+            limit=limit,
+        )
+
     def __get_posts_views(self, activity_id):
         views = 0
         req_url = f"{LINKEDIN_API}/company/getPostsViews?activity_id={activity_id}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+        res = self.session.post(req_url, json=self.cookies, headers=HEADERS)
         res.raise_for_status()
 
         # Manage LinkedIn API errors
@@ -1572,7 +2071,6 @@ class Company(LinkedIn):
 
         # Get result
         views = res.json().get("VIEWS")
-        time.sleep(3)
         return views
 
     def get_posts_feed(
@@ -1634,45 +2132,70 @@ class Company(LinkedIn):
             Number of posts return by function. It will start with the most recent post.
 
         sleep: boolean (default True):
-            Sleeping time between function will be randomly between 5 to 10 seconds.
+            Ignored, kept for compatibility: calls are paced by the rate_limit
+            of connect().
 
         """
-        # Loop init
-        df = pd.DataFrame()
-        if limit != -1 and count > limit:
-            count = limit
-        while True:
-            req_url = f"{LINKEDIN_API}/company/getPostsFeed?company_url={company_url}&start={start}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
+        df = self.iter_posts_feed(company_url, start, count, limit, sleep).to_df()
+        # Cleaning
+        if len(df) > 0:
+            df = self.__add_views(df)
+        return df.reset_index(drop=True)
 
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
+    def __add_views(self, df):
+        # Add views + engagement score
+        df["VIEWS"] = fan_out(self.__get_posts_views, df["ACTIVITY_ID"])
+        df["ENGAGEMENT_SCORE"] = 0.0
+        df.loc[df["VIEWS"] != 0, "ENGAGEMENT_SCORE"] = (
+            df["COMMENTS"] + df["LIKES"]
+        ) / df["VIEWS"]
+        return df
 
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            # Get response in dataframe
-            tmp_df = pd.DataFrame(res_json)
+    def sync_posts_feed(self, company_url, count=100, refresh=10, path=SYNC_PATH):
+        """
+        Incremental get_posts_feed: only posts published since the previous
+        sync and the `refresh` most recent ones are fetched (with their
+        views), then merged into the snapshot stored in `path`. Return the
+        same dataframe as get_posts_feed, with all the posts synced so far.
+
+        Parameters
+        ----------
+        company_url: str:
+            Company url from Linkedin.
+            Example : "https://www.linkedin.com/company/naas-ai/"
+        count: int (default 100, max 100):
+            Number of posts per request.
+        refresh: int (default 10):
+            Most recent posts whose stats are refreshed.
+        path: str (default "naas_sync"):
+            Directory of the Parquet snapshots.
+        """
+        universal_name = company_url.split("/company/")[-1].split("/")[0]
+        pages = self.iter_posts_feed(company_url, count=count, limit=-1)
+        key = f"linkedin/companies/{universal_name}/posts"
+        return self.sync_posts(key, pages, refresh, path, complete=self.__add_views)
+
+    def iter_posts_feed(
+        self,
+        company_url,
+        start=0,
+        count=100,
+        limit=-1,
+        sleep=True,
+    ):
+        """
+        Return a lazy iterable over the company posts (without VIEWS and
+        ENGAGEMENT_SCORE), one list per page. Parameters are the same as
+        get_posts_feed.
+        """
 
-            # Concat dataframe
-            df = pd.concat([df, tmp_df], axis=0)
+        def fetch(start, count):
+            params = {"company_url": company_url, "start": start, "count": count}
+            return self.request_api("company/getPostsFeed", params)
 
-            # Time sleep to avoid linkedin ban
-            if sleep:
-                time.sleep(TIME_SLEEP)
-            start += count
-            if limit != -1 and start >= limit:
-                break
-        # Cleaning
-        if len(df) > 0:
-            # Add views + engagement score
-            df["VIEWS"] = df.apply(
-                lambda row: self.__get_posts_views(row.ACTIVITY_ID), axis=1
-            )
-            df["ENGAGEMENT_SCORE"] = 0
-            df.loc[df["VIEWS"] != 0, "ENGAGEMENT_SCORE"] = (
-                df["COMMENTS"] + df["LIKES"]
-            ) / df["VIEWS"]
-        return df.reset_index(drop=True)
+        return OffsetPaginator(
+            fetch,
+            start=start,
+            count=count,
+            limit=limit,
+        )
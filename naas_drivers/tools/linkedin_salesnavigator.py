@@ -1,35 +1,34 @@
-import pandas as pd
+from naas_drivers.driver import ConnectDriver
+from naas_drivers.pagination import OffsetPaginator
+from naas_drivers.stream import RecordStream
 import requests
-import time
 import urllib
-import secrets
-import naas
-from naas_drivers.tools.emailbuilder import EmailBuilder
-from naas_drivers.tools.naas_auth import NaasAuth
-
-emailbuilder = EmailBuilder()
-naasauth = NaasAuth()
+from naas_drivers.tools.linkedin import set_rate_limit
 
 LINKEDIN_API = "https://3hz1hdpnlf.execute-api.eu-west-1.amazonaws.com/prod"
 DATE_FORMAT = "%Y-%m-%d"
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
-TIME_SLEEP = secrets.randbelow(5) + 5
 HEADERS = {"Content-Type": "application/json"}
 EMAIL_COOKIES = "⚠️ Naas.ai - Update your Linkedin cookies"
 
 
-class LinkedIn:
+class LinkedIn(ConnectDriver):
     deprecated = True
 
     @staticmethod
     def get_user_email():
+        from naas_drivers.tools.naas_auth import NaasAuth
+
         email = None
-        user = naasauth.connect().user.me()
+        user = NaasAuth().connect().user.me()
         email = user.get("username")
         return email
 
     @staticmethod
     def email_linkedin_limit(email):
+        from naas_drivers.tools.emailbuilder import EmailBuilder
+
+        emailbuilder = EmailBuilder()
         content = {
             "header_naas": (
                 "<a href='https://www.naas.ai/'>"
@@ -54,6 +53,8 @@ class LinkedIn:
 
     @staticmethod
     def send_email_renewed_cookies():
+        import naas
+
         email = LinkedIn.get_user_email()
         email_content = LinkedIn.email_linkedin_limit(email)
         naas.notification.send(
@@ -69,11 +70,23 @@ class LinkedIn:
             else:
                 raise BaseException(res.status_code, res.text)
 
+    def set_rate_limit(self, rate_limit=None):
+        """
+        Pace the session calls to LinkedIn, shared by the sub-clients.
+
+        Parameters
+        ----------
+        rate_limit: dict (default RATE_LIMIT):
+            TokenBucket parameters, ex: {"rate": 0.5, "burst": 5}.
+        """
+        self.rate_limiter = set_rate_limit(self.session, rate_limit)
+
     def connect(
         self,
         li_at: str = None,
         jessionid: str = None,
         li_a: str = None,
+        rate_limit: dict = None,
     ):
         # Init lk attribute
         self.li_at = li_at
@@ -89,9 +102,10 @@ class LinkedIn:
 
         # Init headers
         self.headers = {"Content-Type": "application/json"}
+        self.set_rate_limit(rate_limit)
 
         # Init end point
-        self.leads = Leads(self.cookies, self.headers)
+        self.leads = Leads(self.cookies, self.headers, self.session)
 
         # Set connexion to active
         self.connected = True
@@ -99,40 +113,50 @@ class LinkedIn:
 
 
 class Leads(LinkedIn):
-    def __init__(self, cookies, headers):
+    def __init__(self, cookies, headers, session):
         LinkedIn.__init__(self)
         self.cookies = cookies
         self.headers = headers
+        self._session = session
 
     def get_list(self, url, start=0, count=100, limit=1000):
-        # Init
-        df = pd.DataFrame()
-        if limit != -1 and limit < count:
-            count = limit
-        # Requests API
-        while True:
+        df = self.iter_list(url, start, count, limit).to_df()
+        return df.reset_index(drop=True)
+
+    def stream_list(self, url, start=0, count=100, limit=1000, key="PROFILE_ID"):
+        """
+        Return a lazy iterable over the leads of a Sales Navigator search
+        without duplicates, one list of records per page
+        (naas_drivers.stream.RecordStream). Export them in constant memory
+        with .write("leads.parquet").
+        """
+        return RecordStream(self.iter_list(url, start, count, limit), key=key)
+
+    def iter_list(self, url, start=0, count=100, limit=1000):
+        """
+        Return a lazy iterable over the leads of a Sales Navigator search,
+        one list of records per page.
+        """
+
+        def fetch(start, count):
             params = {
                 "url": url,
                 "start": start,
                 "count": count,
             }
             req_url = f"{LINKEDIN_API}/leads/getList?{urllib.parse.urlencode(params, safe='(),')}"
-            res = requests.post(req_url, json=self.cookies, headers=self.headers)
+            res = self.session.post(req_url, json=self.cookies, headers=self.headers)
             res.raise_for_status()
 
             # Manage LinkedIn API errors
             LinkedIn.manage_api_error(res)
 
             # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df], axis=0)
-            start += count
-            if limit != -1 and start >= limit:
-                break
-            elif limit != -1 and limit - start < count:
-                count = limit - start
-            time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
+            return res.json()
+
+        return OffsetPaginator(
+            fetch,
+            start=start,
+            count=count,
+            limit=limit,
+        )
@@ -1,5 +1,4 @@
 from naas_drivers.driver import InDriver
-from IPython.core.display import display, HTML
 import markdown2
 
 
@@ -15,5 +14,7 @@ class Markdown(InDriver):
             self.print_error(error_text)
 
     def display(self, data):
+        from IPython.core.display import display, HTML
+
         data_read = self.open_or_read(data)
         display(HTML(self.convert(data_read)))
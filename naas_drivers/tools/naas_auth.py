@@ -1,5 +1,4 @@
 from naas_drivers.driver import InDriver, OutDriver
-import requests as r
 import os
 
 AUTH_API_FQDN = "auth.naas.ai"
@@ -25,7 +24,7 @@ class NaasAuth(InDriver, OutDriver):
     def connect(self, token=None):
         if not token:
             token = os.environ.get("JUPYTERHUB_API_TOKEN")
-        res = r.get(
+        res = self.session.get(
             f"{AUTH_API_PROTOCOL}://{AUTH_API_FQDN}/bearer/jupyterhubtoken",
             params={"token": token},
         )
@@ -45,11 +44,15 @@ class NaasAuth(InDriver, OutDriver):
         def headers(self):
             return self.__parent.headers
 
+        @property
+        def session(self):
+            return self.__parent.session
+
     class Users(__InnerBase):
         """Users inner class"""
 
         def me(self):
-            res = r.get(
+            res = self.session.get(
                 f"{AUTH_API_PROTOCOL}://{AUTH_API_FQDN}/users/me/", headers=self.headers
             )
             res.raise_for_status()
@@ -60,7 +63,7 @@ class NaasAuth(InDriver, OutDriver):
         """Bearer inner class"""
 
         def validate(self):
-            res = r.get(
+            res = self.session.get(
                 f"{AUTH_API_PROTOCOL}://{AUTH_API_FQDN}/bearer/validate",
                 headers=self.headers,
             )
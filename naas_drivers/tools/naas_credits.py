@@ -1,12 +1,12 @@
+from naas_drivers.driver import ConnectDriver
 from naas_drivers.tools.naas_auth import NaasAuth
 from datetime import datetime
-import requests as r
 
 CREDITS_API_FQDN = "credits.naas.ai"
 AUTH_API_PROTOCOL = "https"
 
 
-class NaasCredits:
+class NaasCredits(ConnectDriver):
     __access_token = None
     __headers = None
 
@@ -24,14 +24,14 @@ class NaasCredits:
         return self
 
     def get_plan(self):
-        res = r.get(
+        res = self.session.get(
             f"{AUTH_API_PROTOCOL}://{CREDITS_API_FQDN}/plan", headers=self.headers
         )
         res.raise_for_status()
         return res.json()
 
     def get_balance(self):
-        res = r.get(
+        res = self.session.get(
             f"{AUTH_API_PROTOCOL}://{CREDITS_API_FQDN}/balance", headers=self.headers
         )
         res.raise_for_status()
@@ -47,15 +47,30 @@ class NaasCredits:
         def headers(self):
             return self.__parent.headers
 
+        @property
+        def session(self):
+            return self.__parent.session
+
     class Transactions(__InnerBase):
         def get_currents(self):
-            res = r.get(
+            res = self.session.get(
                 f"{AUTH_API_PROTOCOL}://{CREDITS_API_FQDN}/transactions/current",
                 headers=self.headers,
             )
             res.raise_for_status()
             return res.json()
 
+        @staticmethod
+        def __params(page_size, page_number, start_date, end_date, order_by):
+            params = {
+                "page_size": page_size,
+                "page_number": page_number,
+                "start_date": start_date,
+                "end_date": end_date,
+                "order_by": order_by,
+            }
+            return {k: params[k] for k in params.keys() if params[k] is not None}
+
         def get(
             self,
             page_size: int = None,
@@ -64,16 +79,29 @@ class NaasCredits:
             end_date: datetime = None,
             order_by: str = None,
         ):
-            params = {
-                "page_size": page_size,
-                "page_number": page_number,
-                "start_date": start_date,
-                "end_date": end_date,
-                "order_by": order_by,
-            }
-            params = {k: params[k] for k in params.keys() if params[k] is not None}
+            params = self.__params(
+                page_size, page_number, start_date, end_date, order_by
+            )
+            res = self.session.get(
+                f"{AUTH_API_PROTOCOL}://{CREDITS_API_FQDN}/transactions",
+                headers=self.headers,
+                params=params,
+            )
+            res.raise_for_status()
+            return res.json()
 
-            res = r.get(
+        async def aget(
+            self,
+            page_size: int = None,
+            page_number: int = None,
+            start_date: datetime = None,
+            end_date: datetime = None,
+            order_by: str = None,
+        ):
+            params = self.__params(
+                page_size, page_number, start_date, end_date, order_by
+            )
+            res = await self.session.aget(
                 f"{AUTH_API_PROTOCOL}://{CREDITS_API_FQDN}/transactions",
                 headers=self.headers,
                 params=params,
@@ -100,7 +128,7 @@ class NaasCredits:
             }
             params = {k: params[k] for k in params.keys() if params[k] is not None}
 
-            res = r.get(
+            res = self.session.get(
                 f"{AUTH_API_PROTOCOL}://{CREDITS_API_FQDN}/admin/transactions",
                 headers=self.headers,
                 params=params,
@@ -127,7 +155,7 @@ class NaasCredits:
             }
             params = {k: params[k] for k in params.keys() if params[k] is not None}
 
-            res = r.get(
+            res = self.session.get(
                 f"{AUTH_API_PROTOCOL}://{CREDITS_API_FQDN}/admin/transactions/current",
                 headers=self.headers,
                 params=params,
@@ -136,7 +164,7 @@ class NaasCredits:
             return res.json()
 
         def import_bulk(self, username, files):
-            res = r.post(
+            res = self.session.post(
                 f"{AUTH_API_PROTOCOL}://{CREDITS_API_FQDN}/transactions/import/bulk",
                 headers=self.headers,
                 files=files,
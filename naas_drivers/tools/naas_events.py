@@ -1,6 +1,5 @@
 from naas_drivers.driver import InDriver, OutDriver
 from naas_drivers.tools.naas_auth import NaasAuth
-import requests
 from typing import List
 
 EVENTS_API_FQDN = "events.naas.ai"
@@ -15,13 +14,29 @@ class NaasEvents(InDriver, OutDriver):
         return self
 
     def add_events(self, events: List[any]):
-        res = requests.post(
+        res = self.session.post(
+            f"https://{EVENTS_API_FQDN}/events", headers=self.__headers, json=events
+        )
+        res.raise_for_status()
+        return res.json()
+
+    async def aadd_events(self, events: List[any]):
+        res = await self.session.apost(
             f"https://{EVENTS_API_FQDN}/events", headers=self.__headers, json=events
         )
         res.raise_for_status()
         return res.json()
 
     def user_me(self):
-        res = requests.get(f"https://{EVENTS_API_FQDN}/user/me", headers=self.__headers)
+        res = self.session.get(
+            f"https://{EVENTS_API_FQDN}/user/me", headers=self.__headers
+        )
+        res.raise_for_status()
+        return res.json()
+
+    async def auser_me(self):
+        res = await self.session.aget(
+            f"https://{EVENTS_API_FQDN}/user/me", headers=self.__headers
+        )
         res.raise_for_status()
         return res.json()
@@ -1,4 +1,5 @@
 from naas_drivers.driver import InDriver, OutDriver
+from naas_drivers.pagination import CursorPaginator
 import dataclasses
 from dataclasses import dataclass, field
 from typing import List, Optional, Union
@@ -101,28 +102,31 @@ class Notion(InDriver, OutDriver):
             return from_dict(data_class=Database, data=data)
 
         def query(self, database_id, query={}):
-            database_id = ensure_database_id(database_id)
-            ret = []
-            has_more = True
-            next_cursor = None
-
-            while has_more:
-                if has_more is True and next_cursor is not None:
-                    query["start_cursor"] = next_cursor
-
-                response = self.client.databases.query(database_id=database_id, **query)
-                results = response.get("results")
+            return [
+                page for pages in self.iter_query(database_id, query) for page in pages
+            ]
 
-                for r in results:
-                    ret.append(from_dict(data_class=Page, data=r))
-
-                if response.get("has_more") is True:
-                    has_more = True
-                    next_cursor = response.get("next_cursor")
-                else:
-                    has_more = False
+        def iter_query(self, database_id, query={}):
+            """Lazy iterable over the database pages, one list per API call."""
+            database_id = ensure_database_id(database_id)
 
-            return ret
+            def fetch(cursor):
+                params = dict(query)
+                if cursor is not None:
+                    params["start_cursor"] = cursor
+                return self.client.databases.query(database_id=database_id, **params)
+
+            return CursorPaginator(
+                fetch,
+                get_records=lambda response: [
+                    from_dict(data_class=Page, data=r) for r in response.get("results")
+                ],
+                get_cursor=lambda response: (
+                    response.get("next_cursor")
+                    if response.get("has_more") is True
+                    else None
+                ),
+            )
 
         def create(self, db):
             payload = self.parent.to_dict(db)
@@ -1,5 +1,4 @@
 from naas_drivers.driver import InDriver
-import requests
 import os
 
 
@@ -35,7 +34,7 @@ class Pdf(InDriver):
         elif html:
             json["html"] = html
 
-        r = requests.post(
+        r = self.session.post(
             url=f"{self.api_url}/api/render",
             json=json,
         )
@@ -1,5 +1,4 @@
 import os
-import requests
 import plotly.express as px
 
 config = {"displayModeBar": False}
@@ -41,7 +40,7 @@ class Plotly:
             }
             if selector:
                 json["screenshot"]["selector"] = selector
-            req = requests.post(
+            req = self.session.post(
                 url=f"{os.environ.get('SCREENSHOT_API', 'http://naas-screenshot:9000')}/api/render",  # Sensitive
                 json=json,
             )
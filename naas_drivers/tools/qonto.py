@@ -1,13 +1,13 @@
+from naas_drivers.accumulator import FrameAccumulator
+from naas_drivers.driver import ConnectDriver
+from naas_drivers.pagination import PageNumberPaginator
+from naas_drivers.schema import Schema
 import pandas as pd
 import requests
 from datetime import datetime
-import plotly.graph_objects as go
 import urllib
-from naas_drivers.tools.emailbuilder import EmailBuilder
 import pydash as _pd
 
-emailbuilder = EmailBuilder()
-
 QONTO_API_URL = "https://thirdparty.qonto.com/v2"
 DATE_FORMAT = "%Y-%m-%d"
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -16,8 +16,37 @@ NUMBER_FORMAT = "{:,.2f} €"
 QONTO_CARD = "https://lib.umso.co/lib_sluGpRGQOLtkyEpz/98a28jf4yswpuert.png"
 NAAS_WEBSITE = "https://www.naas.ai"
 
-
-class Qonto:
+TRANSACTIONS_SCHEMA = Schema(
+    "qonto.transactions",
+    {
+        "IBAN": "string",
+        "SETTLED_AT": "datetime",
+        "EMITTED_AT": "datetime",
+        "TRANSACTION_ID": "string",
+        "TRANSACTION_ORDER": "int64",
+        "LABEL": "string",
+        "STATUS": "category",
+        "CATEGORY": "category",
+        "REFERENCE": "string",
+        "OPERATION_TYPE": "category",
+        "CARD_LAST_DIGITS": "string",
+        "SIDE": "category",
+        "AMOUNT": "float64",
+        "CURRENCY": "category",
+        "VAT_AMOUNT": "float64",
+        "VAT_RATE": "float64",
+        "LOCAL_AMOUNT": "float64",
+        "LOCAL_CURRENCY": "category",
+        "NOTE": "string",
+        "ATTACHMENT_IDS": "object",
+        "ATTACHMENT_LOST": "bool",
+        "ATTACHMENT_REQUIRED": "bool",
+    },
+    fill="Not defined",
+)
+
+
+class Qonto(ConnectDriver):
     @staticmethod
     def get_dates(df, date_column, date_from=None, date_to=None):
 
@@ -66,10 +95,10 @@ class Qonto:
         }
 
         # Init end point
-        self.organizations = Organizations(self.user_id, self.headers)
-        self.positions = Organizations(self.user_id, self.headers)
-        self.transactions = Transactions(self.user_id, self.headers)
-        self.statements = Statements(self.user_id, self.headers)
+        self.organizations = Organizations(self.user_id, self.headers, self.session)
+        self.positions = Organizations(self.user_id, self.headers, self.session)
+        self.transactions = Transactions(self.user_id, self.headers, self.session)
+        self.statements = Statements(self.user_id, self.headers, self.session)
 
         # Set connexion to active
         self.connected = True
@@ -77,10 +106,11 @@ class Qonto:
 
 
 class Organizations(Qonto):
-    def __init__(self, user_id, headers):
+    def __init__(self, user_id, headers, session):
         Qonto.__init__(self)
         self.user_id = user_id
         self.headers = headers
+        self._session = session
 
     def get(self, cols_to_drop=["SLUG", "BALANCE_CENTS", "AUTHORIZED_BALANCE_CENTS"]):
         """
@@ -104,13 +134,26 @@ class Organizations(Qonto):
         """
 
         req_url = f"{QONTO_API_URL}/organization"
-        res = requests.get(req_url, headers=self.headers)
+        res = self.session.get(req_url, headers=self.headers)
+        try:
+            res.raise_for_status()
+        except requests.HTTPError as e:
+            return e
+        return Organizations.accounts_df(res.json(), cols_to_drop)
+
+    async def aget(
+        self, cols_to_drop=["SLUG", "BALANCE_CENTS", "AUTHORIZED_BALANCE_CENTS"]
+    ):
+        req_url = f"{QONTO_API_URL}/organization"
+        res = await self.session.aget(req_url, headers=self.headers)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
             return e
-        res_json = res.json()
+        return Organizations.accounts_df(res.json(), cols_to_drop)
 
+    @staticmethod
+    def accounts_df(res_json, cols_to_drop):
         # Get bank accounts
         slug = _pd.get(res_json, "organization.slug")
         legal_name = _pd.get(res_json, "organization.legal_name")
@@ -131,10 +174,11 @@ class Organizations(Qonto):
 
 
 class Transactions(Qonto):
-    def __init__(self, user_id, headers):
+    def __init__(self, user_id, headers, session):
         Qonto.__init__(self)
         self.user_id = user_id
         self.headers = headers
+        self._session = session
 
     def get(self, date="EMITTED_AT", date_from=None, date_to=None):
         """
@@ -162,6 +206,10 @@ class Transactions(Qonto):
         - ATTACHMENT_LOST
         - ATTACHMENT_REQUIRED
 
+        Columns are typed with TRANSACTIONS_SCHEMA: SETTLED_AT and EMITTED_AT
+        are UTC datetime64 instead of strings, missing amounts and VAT rates
+        stay NaN, only missing string and category values become "Not defined".
+
         Parameters
         ----------
         date: str (default "EMITTED_AT"):
@@ -175,87 +223,47 @@ class Transactions(Qonto):
         df_organisations = Organizations.get(self)
 
         # For each bank account, get all transactions
-        df_transaction = pd.DataFrame()
-        for _, row in df_organisations.iterrows():
-            iban = row["IBAN"]
-
-            # Get transactions
-            has_more = True
-            current_page = 1
-            while has_more:
-                params = {
-                    "current_page": current_page,
-                    "iban": iban,
-                }
-                res = requests.get(
-                    url=f"{QONTO_API_URL}/transactions?{urllib.parse.urlencode(params, safe='(),')}",
-                    headers=self.headers,
-                )
-                try:
-                    res.raise_for_status()
-                except requests.HTTPError as e:
-                    return e
-                items = res.json()
-                transactions = items.get("transactions")
-                df = pd.DataFrame.from_records(transactions)
-                df["iban"] = iban
-                df_transaction = pd.concat([df_transaction, df], axis=0)
-                # Check if next page exists
-                next_page = items.get("meta").get("next_page")
-                if next_page is None:
-                    has_more = False
-                else:
-                    current_page = int(next_page)
+        acc = FrameAccumulator()
+        for iban in df_organisations["IBAN"]:
+            try:
+                for records in self.iter_transactions(iban):
+                    acc.extend(records)
+            except requests.HTTPError as e:
+                return e
+        return Transactions.transactions_df(acc, date, date_from, date_to)
+
+    async def aget(self, date="EMITTED_AT", date_from=None, date_to=None):
+        # Get organizations
+        df_organisations = await Organizations.aget(self)
+
+        # For each bank account, get all transactions
+        acc = FrameAccumulator()
+        for iban in df_organisations["IBAN"]:
+            try:
+                async for records in self.iter_transactions(iban):
+                    acc.extend(records)
+            except requests.HTTPError as e:
+                return e
+        return Transactions.transactions_df(acc, date, date_from, date_to)
+
+    @staticmethod
+    def transactions_df(acc, date, date_from, date_to):
+        df_transaction = acc.to_df().rename(columns=str.upper)
 
         # Formatting
-        df_transaction["transaction_order"] = df_transaction.apply(
-            lambda row: int(row["transaction_id"].split("-")[-1]), axis=1
-        )
+        if len(df_transaction) > 0:
+            df_transaction["TRANSACTION_ORDER"] = (
+                df_transaction["TRANSACTION_ID"].str.rsplit("-", n=1).str[-1]
+            )
+        df_transaction = TRANSACTIONS_SCHEMA.apply(df_transaction)
         df_transaction = df_transaction.sort_values(
-            by=["iban", "transaction_order"]
+            by=["IBAN", "TRANSACTION_ORDER"]
         ).reset_index(drop=True)
 
-        # Select columns to keep
-        to_keep = [
-            "iban",
-            "settled_at",
-            "emitted_at",
-            "transaction_id",
-            "transaction_order",
-            "label",
-            "status",
-            "category",
-            "reference",
-            "operation_type",
-            "card_last_digits",
-            "side",
-            "amount",
-            "currency",
-            "vat_amount",
-            "vat_rate",
-            "local_amount",
-            "local_currency",
-            "note",
-            "attachment_ids",
-            "attachment_lost",
-            "attachment_required",
-        ]
-        df_transaction = df_transaction[to_keep]
-
         # Sign amounts
-        df_transaction.loc[
-            df_transaction["side"] == "debit", "amount"
-        ] = df_transaction["amount"] * (-1)
-        df_transaction.loc[
-            df_transaction["side"] == "debit", "local_amount"
-        ] = df_transaction["local_amount"] * (-1)
-        df_transaction.loc[
-            df_transaction["side"] == "debit", "vat_amount"
-        ] = df_transaction["vat_amount"] * (-1)
-
-        # Format columns in upper case
-        df_transaction = df_transaction.fillna("Not defined")
-        df_transaction.columns = df_transaction.columns.str.upper()
+        debit = df_transaction["SIDE"] == "debit"
+        amounts = ["AMOUNT", "LOCAL_AMOUNT", "VAT_AMOUNT"]
+        df_transaction.loc[debit, amounts] = -df_transaction.loc[debit, amounts]
 
         # Filter dataframe
         df_transaction = Qonto.filter_dates(
@@ -263,12 +271,62 @@ class Transactions(Qonto):
         )
         return df_transaction
 
+    def iter_transactions(self, iban):
+        """
+        Return a lazy iterable over the transactions of a bank account,
+        one list of raw transactions per page.
+
+        Parameters
+        ----------
+        iban: str:
+            IBAN of the bank account.
+        """
+
+        def fetch(current_page):
+            params = {
+                "current_page": current_page,
+                "iban": iban,
+            }
+            res = self.session.get(
+                url=f"{QONTO_API_URL}/transactions?{urllib.parse.urlencode(params, safe='(),')}",
+                headers=self.headers,
+            )
+            res.raise_for_status()
+            return res.json()
+
+        async def afetch(current_page):
+            params = {
+                "current_page": current_page,
+                "iban": iban,
+            }
+            res = await self.session.aget(
+                url=f"{QONTO_API_URL}/transactions",
+                params=params,
+                headers=self.headers,
+            )
+            res.raise_for_status()
+            return res.json()
+
+        def get_next_page(items, current_page):
+            next_page = _pd.get(items, "meta.next_page")
+            return int(next_page) if next_page is not None else None
+
+        return PageNumberPaginator(
+            fetch,
+            afetch=afetch,
+            get_records=lambda items: [
+                {**t, "iban": iban} for t in items.get("transactions")
+            ],
+            get_next_page=get_next_page,
+        )
+
 
 class Statements(Transactions):
-    def __init__(self, user_id, headers):
+    def __init__(self, user_id, headers, session):
         Qonto.__init__(self)
         self.user_id = user_id
         self.headers = headers
+        self._session = session
 
     def get(
         self,
@@ -313,7 +371,30 @@ class Statements(Transactions):
 
         # Get transactions
         df = Transactions.get(self, date)
+        return Statements.statements_df(df, date, to_group, date_from, date_to)
 
+    async def aget(
+        self,
+        date="EMITTED_AT",
+        to_group=[
+            "IBAN",
+            "DATE",
+            "TRANSACTION_ID",
+            "TRANSACTION_ORDER",
+            "LABEL",
+            "REFERENCE",
+            "CATEGORY",
+            "OPERATION_TYPE",
+            "CURRENCY",
+        ],
+        date_from=None,
+        date_to=None,
+    ):
+        df = await Transactions.aget(self, date)
+        return Statements.statements_df(df, date, to_group, date_from, date_to)
+
+    @staticmethod
+    def statements_df(df, date, to_group, date_from, date_to):
         # Set date column
         df = df.rename(columns={date: "DATE"})
         df["DATE"] = pd.to_datetime(df["DATE"]).dt.strftime(DATE_FORMAT)
@@ -323,19 +404,16 @@ class Statements(Transactions):
             to_group = ["DATE"] + to_group
         if "IBAN" not in to_group:
             to_group = ["IBAN"] + to_group
-        df = df.groupby(to_group, as_index=False).agg({"AMOUNT": "sum"})
+        # observed: category columns only group their existing values
+        df = df.groupby(to_group, as_index=False, observed=True).agg({"AMOUNT": "sum"})
 
         # Calc position
         if "TRANSACTION_ORDER" in to_group:
             df = df.sort_values(by=["IBAN", "TRANSACTION_ORDER"]).reset_index(drop=True)
         else:
             df = df.sort_values(by=["IBAN", "DATE"]).reset_index(drop=True)
-        df_statement = pd.DataFrame()
-        ibans = df["IBAN"].unique()
-        for iban in ibans:
-            tmp = df[df["IBAN"] == iban]
-            tmp["POSITION"] = tmp.agg({"AMOUNT": "cumsum"})
-            df_statement = pd.concat([df_statement, tmp])
+        df_statement = df.copy()
+        df_statement["POSITION"] = df_statement.groupby("IBAN")["AMOUNT"].cumsum()
 
         # Filter dataframe
         df_statement = Qonto.filter_dates(
@@ -356,6 +434,8 @@ class Statements(Transactions):
         cashout_name="Décaissements",
         cashout_color="#ea484f",
     ):
+        import plotly.graph_objects as go
+
         # Data linechart
         df = self.get(to_group=to_group, date_from=date_from, date_to=date_to)
         df_line = df.copy()
@@ -509,7 +589,9 @@ class Statements(Transactions):
         # Groupby month
         to_group = [summary_type, "ORDER"]
         to_agg = {"AMOUNT": "sum"}
-        df_transaction = df_transaction.groupby(to_group, as_index=False).agg(to_agg)
+        df_transaction = df_transaction.groupby(
+            to_group, as_index=False, observed=True
+        ).agg(to_agg)
 
         # Create summary table
         cash_summary = pd.concat([df_first, df_transaction, df_last], axis=0)
@@ -530,7 +612,7 @@ class Statements(Transactions):
 
         # Groupby
         to_group = ["LABEL", "OPERATION_TYPE", "DATE"]
-        df = df.groupby(to_group, as_index=False).agg({"AMOUNT": "sum"})
+        df = df.groupby(to_group, as_index=False, observed=True).agg({"AMOUNT": "sum"})
         df["DATE"] = pd.to_datetime(df["DATE"]).dt.strftime("%d/%m/%Y")
         # Replace value
         transaction_type = {
@@ -571,6 +653,9 @@ class Statements(Transactions):
         df_last,
         statement_link,
     ):
+        from naas_drivers.tools.emailbuilder import EmailBuilder
+
+        emailbuilder = EmailBuilder()
 
         # Format variable
         date_from = datetime.strptime(date_from, DATE_FORMAT).strftime("%d/%m/%Y")
@@ -1,7 +1,6 @@
 from naas_drivers.driver import OutDriver
 import hashlib
 import os
-import requests
 
 
 class Taggun(OutDriver):
@@ -86,6 +85,6 @@ class Taggun(OutDriver):
                     self._hash,  # value for the parameters
                 ),
             }
-            response = requests.post(self._url, files=files, headers=headers)
+            response = self.session.post(self._url, files=files, headers=headers)
             self.data = response.json()
         return self.data
@@ -1,4 +1,6 @@
+from naas_drivers.concurrency import MAX_IN_FLIGHT
 from naas_drivers.driver import InDriver, OutDriver
+from naas_drivers.pagination import PageNumberPaginator
 import pandas as pd
 import requests
 import os
@@ -8,7 +10,8 @@ from datetime import datetime
 
 class TKCRUD:
     # class TKCRUD(CRUD):
-    def __init__(self, base_url, subdomain, auth):
+    def __init__(self, base_url, subdomain, auth, session):
+        self.session = session
         self.req_headers = {
             "X-Auth-API-Key": auth,
             "X-Auth-Subdomain": subdomain,
@@ -56,7 +59,7 @@ class TKCRUD:
 
     def __get_by_page(self, page):
         data = {"page": page}
-        req = requests.get(
+        req = self.session.get(
             url=f"{self.base_url}/",
             headers=self.req_headers,
             json=data,
@@ -65,23 +68,72 @@ class TKCRUD:
         req.raise_for_status()
         return req.json()
 
-    def get_all(self):
-        items = []
-        current_page = 1
-        more_page = True
-        while more_page:
-            data = self.__get_by_page(current_page)
-            items.extend(data.get("items"))
-            total_pages = data.get("meta").get("pagination").get("total_pages") or 0
-            if current_page == total_pages:
-                more_page = False
-            current_page += 1
+    async def __aget_by_page(self, page):
+        data = {"page": page}
+        req = await self.session.aget(
+            url=f"{self.base_url}/",
+            headers=self.req_headers,
+            json=data,
+            allow_redirects=False,
+        )
+        req.raise_for_status()
+        return req.json()
+
+    def get_all(self, max_in_flight=MAX_IN_FLIGHT):
+        items = [item for items in self.iter_all(max_in_flight) for item in items]
         df = pd.DataFrame.from_records(items)
         return df
 
+    async def aget_all(self, max_in_flight=MAX_IN_FLIGHT):
+        pages = self.iter_all(max_in_flight)
+        items = [item async for items in pages for item in items]
+        return pd.DataFrame.from_records(items)
+
+    def iter_all(self, max_in_flight=MAX_IN_FLIGHT):
+        """
+        Return a lazy iterable over all items, one list per page.
+        The first page gives the page count, the next ones are fetched
+        up to `max_in_flight` at once.
+        """
+
+        def get_total_pages(data):
+            return data.get("meta").get("pagination").get("total_pages") or 0
+
+        def get_next_page(data, current_page):
+            return current_page + 1 if current_page < get_total_pages(data) else None
+
+        return PageNumberPaginator(
+            self.__get_by_page,
+            afetch=self.__aget_by_page,
+            get_records=lambda data: data.get("items"),
+            get_next_page=get_next_page,
+            get_total_pages=get_total_pages,
+            max_in_flight=max_in_flight,
+        )
+
+    def __print_not_found(self, uid, err):
+        err_code = err.response.status_code
+        err_msg = err.response.json()
+        to_print = f"{err_code}: {err_msg}"
+        if err_code == 404:
+            to_print = f"{self.msg} id (id={uid}) not found."
+        print(to_print)
+
+    async def aget(self, uid):
+        try:
+            req = await self.session.aget(
+                url=f"{self.base_url}/{uid}",
+                headers=self.req_headers,
+                allow_redirects=False,
+            )
+            req.raise_for_status()
+            return req.json()
+        except requests.HTTPError as err:
+            self.__print_not_found(uid, err)
+
     def get(self, uid):
         try:
-            req = requests.get(
+            req = self.session.get(
                 url=f"{self.base_url}/{uid}",
                 headers=self.req_headers,
                 allow_redirects=False,
@@ -89,18 +141,13 @@ class TKCRUD:
             req.raise_for_status()
             return req.json()
         except requests.HTTPError as err:
-            err_code = err.response.status_code
-            err_msg = err.response.json()
-            to_print = f"{err_code}: {err_msg}"
-            if err_code == 404:
-                to_print = f"{self.msg} id (id={uid}) not found."
-            print(to_print)
+            self.__print_not_found(uid, err)
 
     def patch(self, data):
         data = self.__values_format(data)
         try:
             uid = data["id"]
-            req = requests.put(
+            req = self.session.put(
                 url=f"{self.base_url}/{uid}",
                 headers=self.req_headers,
                 json=data,
@@ -124,7 +171,7 @@ class TKCRUD:
     def send(self, data):
         data = self.__values_format(data)
         try:
-            req = requests.post(
+            req = self.session.post(
                 url=f"{self.base_url}/",
                 headers=self.req_headers,
                 json=data,
@@ -146,7 +193,7 @@ class TKCRUD:
 
     def delete(self, uid):
         try:
-            req = requests.delete(
+            req = self.session.delete(
                 url=f"{self.base_url}/{uid}",
                 headers=self.req_headers,
                 allow_redirects=False,
@@ -219,7 +266,7 @@ class Enrollment(TKCRUD):
 
 class Courses(TKCRUD):
     def get_chapters(self, uid):
-        req = requests.get(
+        req = self.session.get(
             url=f"{self.base_url}/{uid}/chapters",
             headers=self.req_headers,
             allow_redirects=False,
@@ -242,14 +289,20 @@ class Thinkific(InDriver, OutDriver):
         self.subdomain = subdomain
 
         # Init end point
-        self.users = User(f"{self.base_url}/users", self.subdomain, self.token)
+        self.users = User(
+            f"{self.base_url}/users", self.subdomain, self.token, self.session
+        )
         self.enrollments = Enrollment(
-            f"{self.base_url}/enrollments", self.subdomain, self.token
+            f"{self.base_url}/enrollments", self.subdomain, self.token, self.session
+        )
+        self.courses = Courses(
+            f"{self.base_url}/courses", self.subdomain, self.token, self.session
+        )
+        self.groups = TKCRUD(
+            f"{self.base_url}/groups", self.subdomain, self.token, self.session
         )
-        self.courses = Courses(f"{self.base_url}/courses", self.subdomain, self.token)
-        self.groups = TKCRUD(f"{self.base_url}/groups", self.subdomain, self.token)
         self.group_users = TKCRUD(
-            f"{self.base_url}/group_users", self.subdomain, self.token
+            f"{self.base_url}/group_users", self.subdomain, self.token, self.session
         )
 
         # Set connexion to active
@@ -10,7 +10,6 @@ import time
 import uuid
 import os
 import io
-from IPython.core.display import display, HTML
 import cson
 import jwt
 
@@ -84,14 +83,14 @@ class Toucan(InDriver, OutDriver):
         return self
 
     def __request_small_apps(self):
-        req = requests.get(
+        req = self.session.get(
             f"{self.url_api}/{self.__url_small_apps}", headers=self.__get_headers()
         )
         req.raise_for_status()
         return req.json()
 
     def __request_tc_params(self):
-        req = requests.get(f"{self.url_base}/{self.__url_tc_params}")
+        req = self.session.get(f"{self.url_base}/{self.__url_tc_params}")
         req.raise_for_status()
         res = (
             req.text.replace(self.__replace_tc_params, "")
@@ -103,7 +102,7 @@ class Toucan(InDriver, OutDriver):
         return json_conf
 
     def __request_user(self):
-        req = requests.post(f"{self.url_api}/{self.__url_login}", json=self.login)
+        req = self.session.post(f"{self.url_api}/{self.__url_login}", json=self.login)
         req.raise_for_status()
         return req.json()
 
@@ -182,6 +181,8 @@ class Toucan(InDriver, OutDriver):
         return {"authorization": f"Bearer {self.__token}"}
 
     def embed(self, small_app, slide, hosts=None, mode="webcomponent", height="800px"):
+        from IPython.core.display import display, HTML
+
         allowed_hosts = (
             hosts
             if hosts
@@ -203,7 +204,7 @@ class Toucan(InDriver, OutDriver):
             "smallApp": small_app,
             "uid": uid,
         }
-        req = requests.post(
+        req = self.session.post(
             f"{self.url_api}/{self.__url_embed}",
             headers=self.__get_headers(),
             json=data,
@@ -259,17 +260,17 @@ class Toucan(InDriver, OutDriver):
             return ".small-app-home__content"
 
     def get_version(self):
-        req_api = requests.get(f"{self.url_api}", headers=self.__get_headers())
+        req_api = self.session.get(f"{self.url_api}", headers=self.__get_headers())
         req_api.raise_for_status()
         result = req_api.json()
-        req_app = requests.get(f"{self.url_base}/{self.__url_tc_app_version}")
+        req_app = self.session.get(f"{self.url_base}/{self.__url_tc_app_version}")
         req_app.raise_for_status()
         front_version = req_app.text().strip()
         result["frontVersion"] = front_version
         return result
 
     def get_app_config(self, app_name):
-        req = requests.get(
+        req = self.session.get(
             f"{self.url_api}/{app_name}/{self.__url_config}",
             headers=self.__get_headers(),
         )
@@ -277,14 +278,14 @@ class Toucan(InDriver, OutDriver):
         return req.json()
 
     def get_app_data(self, app_name):
-        req = requests.get(
+        req = self.session.get(
             f"{self.url_api}/{app_name}/{self.__url_data}", headers=self.__get_headers()
         )
         req.raise_for_status()
         return req.json()
 
     def get_app_reports_ids(self, app_name):
-        req = requests.get(
+        req = self.session.get(
             f"{self.url_api}/{app_name}/{self.__url_reports}/{self.__ur_ids}",
             headers=self.__get_headers(),
         )
@@ -292,7 +293,7 @@ class Toucan(InDriver, OutDriver):
         return req.json()
 
     def get_app_reports(self, app_name):
-        req = requests.get(
+        req = self.session.get(
             f"{self.url_api}/{app_name}/{self.__url_reports}",
             headers=self.__get_headers(),
         )
@@ -300,7 +301,7 @@ class Toucan(InDriver, OutDriver):
         return req.json()
 
     def get_users(self):
-        req = requests.get(
+        req = self.session.get(
             f"{self.url_api}/{self.__url_users}", headers=self.__get_headers()
         )
         req.raise_for_status()
@@ -384,7 +385,7 @@ class Toucan(InDriver, OutDriver):
             files = {"file": file_upload}
             format_url = ""
 
-        req = requests.put(
+        req = self.session.put(
             f"{self.url_api}/{app_name}/{self.__url_config}{config_name}?stage={stage}{format_url}",
             headers=self.__get_headers(),
             files=files,
@@ -419,7 +420,7 @@ class Toucan(InDriver, OutDriver):
             config_name = "/notifications_handlers"
             format_url = ""
 
-        req = requests.get(
+        req = self.session.get(
             f"{self.url_api}/{app_name}/{self.__url_config}{config_name}?stage={stage}{format_url}",
             headers=self.__get_headers(),
         )
@@ -439,7 +440,7 @@ class Toucan(InDriver, OutDriver):
         force=True,
     ):
         force_str = "true" if force else "false"
-        req = requests.post(
+        req = self.session.post(
             f"{self.url_api}/{app_name}/{self.__url_config}/pull?force={force_str}&stage={stage}",
             headers=self.__get_headers(),
             json={"operations": operations},
@@ -448,7 +449,7 @@ class Toucan(InDriver, OutDriver):
         return req.json()
 
     def get_data(self, app_name, domain, stage="staging"):
-        req = requests.get(
+        req = self.session.get(
             f"{self.url_api}/{app_name}/domain/{domain}?stage={stage}",
             headers=self.__get_headers(),
         )
@@ -457,7 +458,7 @@ class Toucan(InDriver, OutDriver):
         return io.StringIO(s_data)
 
     def get_metadata(self, app_name, stage="staging"):
-        req = requests.get(
+        req = self.session.get(
             f"{self.url_api}/{app_name}/metadata?stage={stage}",
             headers=self.__get_headers(),
         )
@@ -466,7 +467,7 @@ class Toucan(InDriver, OutDriver):
 
     def create_small_app(self, app_name, id_app=None):
         body = {"name": app_name, "id": id_app if id_app else app_name}
-        req = requests.post(
+        req = self.session.post(
             f"{self.url_api}/small-apps", headers=self.__get_headers(), json=body
         )
         req.raise_for_status()
@@ -486,7 +487,7 @@ class Toucan(InDriver, OutDriver):
         ],
     ):
         notification_str = "true" if notification else "false"
-        req = requests.post(
+        req = self.session.post(
             f"{self.url_api}/{app_name}/{self.__url_config}/operations?notify={notification_str}&stage={stage}",
             headers=self.__get_headers(),
             json={"operations": operations},
@@ -495,7 +496,7 @@ class Toucan(InDriver, OutDriver):
         return req.json()
 
     def load_conf(self, app_name, stage="staging"):
-        req = requests.post(
+        req = self.session.post(
             f"{self.url_api}/{app_name}/{self.__url_load}?stage={stage}",
             headers=self.__get_headers(),
         )
@@ -503,7 +504,7 @@ class Toucan(InDriver, OutDriver):
         return req.json()
 
     def release_conf(self, app_name, stage="staging"):
-        req = requests.post(
+        req = self.session.post(
             f"{self.url_api}/{app_name}/{self.__url_release}?stage={stage}",
             headers=self.__get_headers(),
         )
@@ -569,7 +570,7 @@ class Toucan(InDriver, OutDriver):
                 try:
                     if self.debug:
                         print(f"Request Screenshot {path}")
-                    req = requests.get(
+                    req = self.session.get(
                         self.__url_screenshot_api,
                         params={
                             "url": url.get("url"),
@@ -1,3 +1,4 @@
+from naas_drivers.pagination import TokenPaginator
 import tweepy
 import pandas as pd
 from typing import List
@@ -87,31 +88,73 @@ class Twitter:
         start_time=datetime.datetime.now() - datetime.timedelta(days=30),
         end_time=datetime.datetime.now(),
     ) -> pd.DataFrame:
-        should_stop = False
-        tweets_array = []
-        next_token = None
-
-        while len(tweets_array) < tweet_count and should_stop is False:
-            tweets_left_to_fetch = tweet_count - len(tweets_array)
-
-            if tweets_left_to_fetch > 100:
-                max_results = 100
-            elif tweets_left_to_fetch < 5:
-                max_results = 5
-            else:
-                max_results = tweets_left_to_fetch
-            tweets = self.__app_client.get_users_tweets(
+        tweets_array = [
+            tweet
+            for tweets in self.iter_users_tweets(
+                user_id, tweet_count, tweet_fields, start_time, end_time
+            )
+            for tweet in tweets
+        ]
+        # Create final dataframe
+        as_types = {
+            "PUBLIC_RETWEETS": int,
+            "PUBLIC_REPLIES": int,
+            "PUBLIC_LIKES": int,
+            "PUBLIC_QUOTES": int,
+            "ORGANIC_RETWEETS": int,
+            "ORGANIC_REPLIES": int,
+            "ORGANIC_LIKES": int,
+            "ORGANIC_QUOTES": int,
+            "USER_PROFILE_CLICKS": int,
+            "IMPRESSIONS": int,
+        }
+        df = pd.DataFrame(tweets_array).astype(as_types)
+        df["ENGAGEMENTS"] = (
+            df["PUBLIC_RETWEETS"]
+            + df["PUBLIC_REPLIES"]
+            + df["PUBLIC_LIKES"]
+            + df["PUBLIC_QUOTES"]
+            + df["USER_PROFILE_CLICKS"]
+        )
+        df["ENGAGEMENT_RATE"] = df["ENGAGEMENTS"] / df["IMPRESSIONS"]
+        df = df.round({"ENGAGEMENT_RATE": 4})
+        df = df.fillna({"ENGAGEMENT_RATE": 0})
+        df["ENGAGEMENT_RATE"] = df["ENGAGEMENT_RATE"].replace(inf, 0)
+        df["ENGAGEMENT_RATE"] = df["ENGAGEMENT_RATE"].apply(lambda x: 0 if x < 0 else x)
+        return df.reset_index(drop=True)
+
+    def iter_users_tweets(
+        self,
+        user_id: str,
+        tweet_count=200,
+        tweet_fields: List[str] = tweet_fields,
+        start_time=datetime.datetime.now() - datetime.timedelta(days=30),
+        end_time=datetime.datetime.now(),
+    ):
+        """
+        Yield tweets page by page, as lists of get_users_tweets rows.
+        Parameters are the same as get_users_tweets.
+        """
+
+        def fetch(next_token):
+            return self.__app_client.get_users_tweets(
                 id=user_id,
-                max_results=max_results,
+                max_results=max(pages.remaining(100), 5),
                 start_time=start_time,
                 end_time=end_time,
                 pagination_token=next_token,
             )
-            next_token = pydash.get(tweets, "meta.next_token", None)
-            if next_token is None:
-                should_stop = True
-            is_own_tweets = user_id == self.__me.id
-            for tweet in tweets.data:
+
+        pages = TokenPaginator(
+            fetch,
+            get_records=lambda tweets: tweets.data or [],
+            get_cursor=lambda tweets: pydash.get(tweets, "meta.next_token", None),
+            limit=tweet_count,
+        )
+        is_own_tweets = user_id == self.__me.id
+        for tweets in pages:
+            rows = []
+            for tweet in tweets:
                 tweet_id = tweet.id
 
                 if is_own_tweets is True:
@@ -128,7 +171,7 @@ class Twitter:
                     )
                 rtd = rich_tweet_response.data
 
-                tweets_array.append(
+                rows.append(
                     {
                         "TWEET_ID": rtd.id,
                         "TWEET_URL": f"https://twitter.com/{self.__me.username}/status/{rtd.id}",
@@ -167,30 +210,4 @@ class Twitter:
                         ),
                     }
                 )
-        # Create final dataframe
-        as_types = {
-            "PUBLIC_RETWEETS": int,
-            "PUBLIC_REPLIES": int,
-            "PUBLIC_LIKES": int,
-            "PUBLIC_QUOTES": int,
-            "ORGANIC_RETWEETS": int,
-            "ORGANIC_REPLIES": int,
-            "ORGANIC_LIKES": int,
-            "ORGANIC_QUOTES": int,
-            "USER_PROFILE_CLICKS": int,
-            "IMPRESSIONS": int,
-        }
-        df = pd.DataFrame(tweets_array).astype(as_types)
-        df["ENGAGEMENTS"] = (
-            df["PUBLIC_RETWEETS"]
-            + df["PUBLIC_REPLIES"]
-            + df["PUBLIC_LIKES"]
-            + df["PUBLIC_QUOTES"]
-            + df["USER_PROFILE_CLICKS"]
-        )
-        df["ENGAGEMENT_RATE"] = df["ENGAGEMENTS"] / df["IMPRESSIONS"]
-        df = df.round({"ENGAGEMENT_RATE": 4})
-        df = df.fillna({"ENGAGEMENT_RATE": 0})
-        df["ENGAGEMENT_RATE"] = df["ENGAGEMENT_RATE"].replace(inf, 0)
-        df["ENGAGEMENT_RATE"] = df["ENGAGEMENT_RATE"].apply(lambda x: 0 if x < 0 else x)
-        return df.reset_index(drop=True)
\ No newline at end of file
+            yield rows
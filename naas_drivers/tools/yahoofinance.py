@@ -1,3 +1,4 @@
+from naas_drivers.accumulator import FrameAccumulator
 import pandas as pd
 import datetime as dt
 
@@ -14,7 +15,7 @@ class Yahoofinance:
     ):
         """Generate financial data"""
         # Init dataframe
-        df_stocks = pd.DataFrame()
+        acc = FrameAccumulator(ignore_index=False)
 
         # If tickers is string => change to list
         if isinstance(tickers, str):
@@ -63,6 +64,7 @@ class Yahoofinance:
                 else:
                     error_text = f"❌ We can not calculate moving averages. Columns '{moving_average_col}' does not exist in dataframe."
                     print(error_text)
-            df_stocks = pd.concat([df_stocks, df])
+            acc.add_frame(df)
+        df_stocks = acc.to_df()
         df_stocks["Date"] = pd.to_datetime(df_stocks["Date"], format="%Y-%m-%d")
         return df_stocks
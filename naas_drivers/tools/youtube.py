@@ -1,3 +1,5 @@
+from naas_drivers.driver import ConnectDriver
+from naas_drivers.pagination import TokenPaginator
 import requests
 import pandas as pd
 import datetime
@@ -10,7 +12,7 @@ import pydash as _
 YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
 
 
-class Youtube:
+class Youtube(ConnectDriver):
     def __init__(self):
         self.transcript = Transcript()
 
@@ -22,8 +24,8 @@ class Youtube:
         self.base_params = {"key": self.api_key}
 
         # Init end point
-        self.channel = Channel(self.base_params)
-        self.video = Video(self.base_params)
+        self.channel = Channel(self.base_params, self.session)
+        self.video = Video(self.base_params, self.session)
 
         # Set connexion to active
         self.connected = True
@@ -35,9 +37,10 @@ class Youtube:
 
 
 class Channel(Youtube):
-    def __init__(self, base_params):
+    def __init__(self, base_params, session):
         Youtube.__init__(self)
         self.base_params = base_params
+        self._session = session
 
     def __get_channel_id_from_url(self, channel_url):
         channel_id = channel_url.split("channel/")[-1].split("/")[0]
@@ -47,7 +50,7 @@ class Channel(Youtube):
         channel_id = self.__get_channel_id_from_url(channel_url)
         params = {"part": "contentDetails", "id": channel_id}
         params.update(self.base_params)
-        res = requests.get(f"{YOUTUBE_API_URL}/channels", params=params)
+        res = self.session.get(f"{YOUTUBE_API_URL}/channels", params=params)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -67,7 +70,7 @@ class Channel(Youtube):
         channel_id = self.__get_channel_id_from_url(channel_url)
         params = {"part": "statistics,snippet", "id": channel_id}
         params.update(self.base_params)
-        res = requests.get(f"{YOUTUBE_API_URL}/channels", params=params)
+        res = self.session.get(f"{YOUTUBE_API_URL}/channels", params=params)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
@@ -95,29 +98,39 @@ class Channel(Youtube):
                 "Please get url with channel id. "
                 "It must start with 'www.youtube.com/channel'"
             )
-        playlist_id = self.__get_uploads_id_from_channel(channel_url)
-        videos = []
         data = []
-        nextPageToken = None
-        while len(videos) < number:
-            maxResults = 50 if (number - len(videos)) > 50 else (number - len(videos))
+        try:
+            for videos in self.iter_uploads(channel_url, number):
+                data.extend(videos)
+        except requests.HTTPError as e:
+            return e
+        df = pd.DataFrame(data)
+        df["PUBLISHEDAT"] = pd.to_datetime(df["VIDEO_PUBLISHEDAT"])
+        return df
+
+    def iter_uploads(self, channel_url, number=100):
+        """
+        Return a lazy iterable over the channel uploads, one list of videos
+        (get_uploads rows) per page of 50.
+        """
+        playlist_id = self.__get_uploads_id_from_channel(channel_url)
+
+        def fetch(page_token):
             params = {
                 "part": "snippet,contentDetails",
-                "maxResults": maxResults,
+                "maxResults": 50,
                 "playlistId": playlist_id,
             }
-            if nextPageToken:
-                params["PageToken"] = nextPageToken
+            if page_token:
+                params["pageToken"] = page_token
             params.update(self.base_params)
-            res = requests.get(f"{YOUTUBE_API_URL}/playlistItems", params=params)
-            try:
-                res.raise_for_status()
-            except requests.HTTPError as e:
-                return e
-            videos += _.get(res.json(), "items")
-            nextPageToken = _.get(res.json(), "nextPageToken")
-
-            for video in videos:
+            res = self.session.get(f"{YOUTUBE_API_URL}/playlistItems", params=params)
+            res.raise_for_status()
+            return res.json()
+
+        def get_records(res_json):
+            data = []
+            for video in _.get(res_json, "items"):
                 meta = {
                     "CHANNEL_ID": _.get(video, "snippet.channelId"),
                     "PLAYLIST_ID": _.get(video, "snippet.playlistId"),
@@ -132,23 +145,27 @@ class Channel(Youtube):
                     ),
                 }
                 data.append(meta)
-            if nextPageToken is None:
-                break
-        df = pd.DataFrame(data)
-        df["PUBLISHEDAT"] = pd.to_datetime(df["VIDEO_PUBLISHEDAT"])
-        return df
+            return data
+
+        return TokenPaginator(
+            fetch,
+            get_records=get_records,
+            get_cursor=lambda res_json: _.get(res_json, "nextPageToken"),
+            limit=number,
+        )
 
 
 class Video(Youtube):
-    def __init__(self, base_params):
+    def __init__(self, base_params, session):
         Youtube.__init__(self)
         self.base_params = base_params
+        self._session = session
 
     def get_statistics(self, video_url):
         video_id = Youtube.get_video_id_from_url(self, video_url)
         params = {"part": "statistics,snippet,contentDetails", "id": video_id}
         params.update(self.base_params)
-        res = requests.get(f"{YOUTUBE_API_URL}/videos", params=params)
+        res = self.session.get(f"{YOUTUBE_API_URL}/videos", params=params)
         try:
             res.raise_for_status()
         except requests.HTTPError as e:
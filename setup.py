@@ -17,6 +17,9 @@ extras_require = {
     "airtable": [
         "airtable-python-wrapper==0.15.2",
     ],
+    "async": [
+        "httpx==0.24.1",
+    ],
     # "bigquery": [
     #     "google-cloud-bigquery==3.19.0",
     #     "pandas-gbq==0.17.7"
@@ -55,6 +58,9 @@ extras_require = {
     "newsapi": [
         "newsapi-python==0.2.6",
     ],
+    "parquet": [
+        "pyarrow==4.0.1",
+    ],
     "notion": [
         "notion-client==0.7.1",
         "dacite==1.6.0",
@@ -0,0 +1,21 @@
+import pandas as pd
+
+from naas_drivers.accumulator import FrameAccumulator
+
+
+def test_accumulator_mixes_records_and_frames():
+    acc = FrameAccumulator(columns=["ID", "NAME"], dtypes={"ID": "int64"})
+    acc.extend([{"ID": 1, "NAME": "a"}, {"ID": 2}])
+    acc.add_frame(pd.DataFrame({"ID": [3], "NAME": ["c"]}))
+    acc.append({"ID": 4, "NAME": "d"})
+    acc.add_columns({"ID": [5, 6], "NAME": ["e", "f"]})
+    assert len(acc) == 6
+    df = acc.to_df()
+    assert df["ID"].tolist() == [1, 2, 3, 4, 5, 6]
+    assert df.index.tolist() == list(range(6))
+    assert str(df["ID"].dtype) == "int64"
+    assert list(df.columns) == ["ID", "NAME"]
+
+
+def test_accumulator_empty():
+    assert FrameAccumulator().to_df().empty
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+import requests
+
+httpx = pytest.importorskip("httpx")
+
+from naas_drivers.driver import InDriver, OutDriver  # noqa: E402
+from naas_drivers.pagination import LinkHeaderPaginator  # noqa: E402
+from naas_drivers.retry import Retry  # noqa: E402
+from naas_drivers.tools.github import Github  # noqa: E402
+from naas_drivers.tools.hubspot import HubSpot  # noqa: E402
+
+
+class Echo(InDriver, OutDriver):
+    async def aget(self, url):
+        res = await self.session.aget(url)
+        res.raise_for_status()
+        return res.json()
+
+    async def asend(self, url, data):
+        return (await self.session.apost(url, json=data)).json()
+
+
+def mock(driver, handler):
+    driver.session.async_transport.transport = httpx.MockTransport(handler)
+    return driver
+
+
+def test_async_twins_share_the_session():
+    attempts = {}
+
+    def handler(request):
+        assert request.headers["X-Session"] == "1"
+        if request.method == "POST":
+            return httpx.Response(201, json={"created": request.read().decode()})
+        attempts[request.url.path] = attempts.get(request.url.path, 0) + 1
+        if request.url.path == "/items/7" and attempts[request.url.path] == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"id": int(request.url.path.split("/")[-1])})
+
+    driver = mock(Echo().configure_session(headers={"X-Session": "1"}), handler)
+    driver.retry.asleep = lambda seconds: asyncio.sleep(0)
+
+    async def main():
+        items = await asyncio.gather(
+            *(driver.aget(f"https://api.test/items/{i}") for i in range(500))
+        )
+        created = await driver.asend("https://api.test/items", {"id": 500})
+        await driver.aclose()
+        return items, created
+
+    items, created = asyncio.run(main())
+    assert [item["id"] for item in items] == list(range(500))
+    assert created == {"created": '{"id": 500}'}
+    assert driver.retry.stats()["retries"] == 1
+
+
+def test_async_errors_are_requests_errors():
+    def handler(request):
+        if request.url.path == "/down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(404)
+
+    driver = mock(Echo(), handler)
+    driver.session.middlewares = [Retry(max_retries=0)]
+    with pytest.raises(requests.ConnectionError):
+        asyncio.run(driver.aget("https://api.test/down"))
+    with pytest.raises(requests.HTTPError):
+        asyncio.run(driver.aget("https://api.test/missing"))
+
+
+def test_sync_middleware_has_no_async_twin():
+    driver = mock(Echo(), lambda request: httpx.Response(200, json={}))
+    driver.session.middlewares = [lambda send, method, url, **kwargs: None]
+    with pytest.raises(TypeError):
+        asyncio.run(driver.aget("https://api.test/items"))
+
+
+def test_link_header_paginator_async(requests_mock):
+    url = "https://api.github.com/repos/org/repo/pulls"
+
+    def handler(request):
+        assert request.headers["Authorization"] == "token t1"
+        page = int(request.url.params.get("page", 1))
+        links = (
+            f'<{url}?per_page=2&page=2>; rel="next", '
+            f'<{url}?per_page=2&page=4>; rel="last"'
+        )
+        headers = {"Link": links} if page == 1 else {}
+        return httpx.Response(200, json=[{"page": page}], headers=headers)
+
+    github = mock(Github().connect("t1"), handler)
+    pages = LinkHeaderPaginator(
+        github.session, url, params={"per_page": 2}, max_in_flight=3
+    )
+    assert asyncio.run(pages.ato_df())["page"].tolist() == [1, 2, 3, 4]
+    assert pages.url is None
+    assert requests_mock.call_count == 0
+
+
+def test_hubspot_aget_all():
+    def handler(request):
+        after = request.url.params.get("after")
+        if after is None:
+            body = {"results": [{"properties": {"id": "1"}}]}
+            body["paging"] = {"next": {"after": "1"}}
+        else:
+            body = {"results": [{"properties": {"id": "2"}}]}
+        return httpx.Response(200, json=body)
+
+    hubspot = mock(HubSpot(), handler).connect("token")
+    df = asyncio.run(hubspot.contacts.aget_all())
+    assert df["id"].tolist() == ["1", "2"]
@@ -0,0 +1,27 @@
+import json
+
+from benchmarks.bench_drivers import compare, main
+
+
+def test_drivers_run_against_stub_server(tmp_path, capsys):
+    results = tmp_path / "results.json"
+    only = "github_stargazers,hubspot_contacts,thinkific_users,gsheet_get"
+    args = ["--sizes", "150", "--repeat", "1", "--only", only, "--save", str(results)]
+    assert main(args) == 0
+    saved = json.loads(results.read_text())
+    assert {key: value["rows"] for key, value in saved.items()} == {
+        "github_stargazers[150]": 150,
+        "hubspot_contacts[150]": 150,
+        "thinkific_users[150]": 150,
+        "gsheet_get[150]": 150,
+    }
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {"a[10]": {"seconds": 1.0, "peak_mb": 10.0}}
+    assert compare({"a[10]": {"seconds": 1.2, "peak_mb": 10.0}}, baseline, 0.25) == []
+    assert compare({"a[10]": {"seconds": 1.3, "peak_mb": 13.0}}, baseline, 0.25) == [
+        "a[10] seconds: 1.000 -> 1.300",
+        "a[10] peak_mb: 10.000 -> 13.000",
+    ]
+    assert compare({"b[10]": {"seconds": 9.0, "peak_mb": 9.0}}, baseline, 0.25) == []
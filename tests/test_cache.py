@@ -0,0 +1,107 @@
+import pytest
+
+from naas_drivers import cache as cache_module
+from naas_drivers.cache import ConditionalCache, TTLCache
+from naas_drivers.concurrency import fan_out
+from naas_drivers.driver import ConnectDriver
+from naas_drivers.tools.github import Github
+
+URL = "https://api.test/items"
+
+
+def etag_server(requests_mock, url, body, etag, headers=None):
+    def callback(request, context):
+        context.headers.update(headers or {})
+        context.headers["ETag"] = etag
+        if request.headers.get("If-None-Match") == etag:
+            context.status_code = 304
+            return ""
+        context.headers["Content-Type"] = "application/json"
+        return body
+
+    requests_mock.get(url, text=callback)
+
+
+def test_conditional_cache_hit(requests_mock, tmp_path):
+    etag_server(requests_mock, URL, '[{"id": 1}]', '"v1"')
+    driver = ConnectDriver()
+    cache = ConditionalCache(str(tmp_path))
+    driver.session.middlewares = [cache]
+    assert driver.session.get(URL).json() == [{"id": 1}]
+    res = driver.session.get(URL)
+    assert res.status_code == 200
+    assert res.json() == [{"id": 1}]
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    # Persisted on disk
+    assert ConditionalCache(str(tmp_path)).stats()["entries"] == 1
+
+
+def test_conditional_cache_lru_eviction(requests_mock, tmp_path):
+    for i in range(3):
+        etag_server(requests_mock, f"{URL}/{i}", "x" * 100, f'"{i}"')
+    driver = ConnectDriver()
+    cache = ConditionalCache(str(tmp_path), max_bytes=500)
+    driver.session.middlewares = [cache]
+    driver.session.get(f"{URL}/0")
+    driver.session.get(f"{URL}/1")
+    driver.session.get(f"{URL}/0")
+    driver.session.get(f"{URL}/2")
+    assert cache.evictions == 1
+    driver.session.get(f"{URL}/1")
+    assert "If-None-Match" not in requests_mock.last_request.headers
+    driver.session.get(f"{URL}/2")
+    assert requests_mock.last_request.headers["If-None-Match"] == '"2"'
+
+
+def test_github_cache_keeps_pagination(requests_mock, tmp_path):
+    api = "https://api.github.com/repos/org/repo/stargazers"
+    star = '[{"user": {"login": "%s", "id": 1}, "starred_at": "2023-01-01T00:00:00Z"}]'
+    etag_server(
+        requests_mock,
+        f"{api}?per_page=100&page=1",
+        star % "a",
+        '"p1"',
+        headers={"Link": f'<{api}?per_page=100&page=2>; rel="next"'},
+    )
+    etag_server(requests_mock, f"{api}?per_page=100&page=2", star % "b", '"p2"')
+    github = Github().connect("token", cache_dir=str(tmp_path))
+    first = github.repos.get_stargazers("https://github.com/org/repo")
+    second = github.repos.get_stargazers("https://github.com/org/repo")
+    assert second["LOGIN"].tolist() == first["LOGIN"].tolist() == ["a", "b"]
+    assert github.cache.hits == 2
+
+
+def test_ttl_cache_modes_and_expiry(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.sqlite")
+    cache = TTLCache(path, ttls={"daily": 100, "forever": None})
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    assert cache.fetch("daily", "a", fetch) == {"n": 1}
+    assert cache.fetch("daily", "a", fetch) == {"n": 1}
+    assert cache.fetch("daily", "a", fetch, mode="refresh") == {"n": 2}
+    assert cache.fetch("daily", "a", fetch, mode="bypass") == {"n": 3}
+    cache.fetch("forever", "a", fetch)
+    # Shared with other instances (and processes) through the file
+    assert TTLCache(path).get("daily", "a") == {"n": 2}
+
+    now = cache_module.time.time()
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + 101)
+    assert cache.get("daily", "a") is None
+    assert cache.get("forever", "a") == {"n": 4}
+    assert cache.stats()["entries"] == 2
+    with pytest.raises(ValueError):
+        cache.fetch("daily", "a", fetch, mode="reuse")
+
+
+def test_ttl_cache_counts_concurrent_lookups(tmp_path):
+    cache = TTLCache(str(tmp_path / "cache.sqlite"))
+    cache.set("daily", "a", 1)
+    fan_out(lambda key: cache.get("daily", key), ["a", "b"] * 200, max_in_flight=8)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (200, 200)
@@ -0,0 +1,74 @@
+import pytest
+
+from naas_drivers.checkpoint import Checkpoint
+from naas_drivers.pagination import CursorPaginator
+from naas_drivers.tools.hubspot import HubSpot
+
+DATA = [{"id": i} for i in range(50)]
+
+
+def paginator(fail_at=None):
+    def fetch(cursor):
+        cursor = cursor or 0
+        if cursor == fail_at:
+            raise ConnectionError(cursor)
+        return {"data": DATA[cursor:][:10], "next": cursor + 10}
+
+    return CursorPaginator(
+        fetch,
+        get_records=lambda data: data["data"],
+        get_cursor=lambda data: data["next"] if data["next"] < len(DATA) else None,
+    )
+
+
+def test_resume_after_failure(tmp_path):
+    checkpoint = Checkpoint("items", str(tmp_path), every=2)
+    fetched = []
+    with pytest.raises(ConnectionError):
+        for records in checkpoint.iterate(paginator(fail_at=30)):
+            fetched.extend(records)
+    assert fetched == DATA[:30]
+
+    pages = paginator()
+    resumed = [r for records in checkpoint.iterate(pages, resume=True) for r in records]
+    assert resumed == DATA
+    assert pages.state()["done"] is True
+
+    checkpoint.clear()
+    assert checkpoint.load() == (None, [])
+
+
+def test_without_resume_starts_over(tmp_path):
+    checkpoint = Checkpoint("items", str(tmp_path), every=1)
+    with pytest.raises(ConnectionError):
+        list(checkpoint.iterate(paginator(fail_at=20)))
+    assert len(checkpoint.load()[1]) == 20
+    records = [r for records in checkpoint.iterate(paginator()) for r in records]
+    assert records == DATA
+
+
+def test_hubspot_get_all_resume(requests_mock, tmp_path):
+    url = "https://api.hubapi.com/crm/v3/objects/contacts/"
+    page = {
+        "results": [{"properties": {"id": "1"}}],
+        "paging": {"next": {"after": "2"}},
+    }
+    requests_mock.get(url, json=page)
+    requests_mock.get(f"{url}?after=2", status_code=400)
+    contacts = HubSpot().connect("token").contacts
+    with pytest.raises(Exception):
+        contacts.get_all(checkpoint_path=str(tmp_path))
+
+    requests_mock.get(f"{url}?after=2", json={"results": [{"properties": {"id": "2"}}]})
+    # Other properties do not resume from that checkpoint
+    calls = len(requests_mock.request_history)
+    contacts.get_all(
+        hs_properties=["email"], resume=True, checkpoint_path=str(tmp_path)
+    )
+    assert "after" not in requests_mock.request_history[calls].qs
+    assert requests_mock.request_history[calls].qs["properties"] == ["email"]
+
+    df = contacts.get_all(resume=True, checkpoint_path=str(tmp_path))
+    assert df["id"].tolist() == ["1", "2"]
+    assert requests_mock.request_history[-1].qs["after"] == ["2"]
+    assert list(tmp_path.iterdir()) == []
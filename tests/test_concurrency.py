@@ -0,0 +1,48 @@
+import threading
+import time
+
+import pytest
+
+from naas_drivers.concurrency import fan_out, fan_out_iter
+
+
+def test_fan_out_keeps_order_and_bounds_concurrency():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def work(item):
+        with lock:
+            running.append(item)
+            peak.append(len(running))
+        time.sleep(0.01 * (5 - item % 5))
+        with lock:
+            running.remove(item)
+        return item * 2
+
+    assert fan_out(work, range(20), max_in_flight=4) == [i * 2 for i in range(20)]
+    assert max(peak) <= 4
+
+
+def test_fan_out_raises():
+    def work(item):
+        if item == 3:
+            raise ValueError(item)
+        return item
+
+    with pytest.raises(ValueError):
+        fan_out(work, range(5), max_in_flight=2)
+
+
+def test_fan_out_iter_is_lazy_and_ordered():
+    started = []
+
+    def work(item):
+        started.append(item)
+        time.sleep(0.01 * (3 - item % 3))
+        return item * 2
+
+    results = fan_out_iter(work, range(100), max_in_flight=3)
+    assert [next(results) for _ in range(5)] == [0, 2, 4, 6, 8]
+    results.close()
+    assert len(started) <= 8
@@ -0,0 +1,74 @@
+import time
+
+from naas_drivers import driver as driver_module
+from naas_drivers.concurrency import fan_out
+from naas_drivers.driver import ConnectDriver, HTTPSession
+from naas_drivers.tools.github import Github
+
+
+def test_session_is_reused():
+    driver = ConnectDriver()
+    assert isinstance(driver.session, HTTPSession)
+    assert driver.session is driver.session
+
+
+def test_session_created_once_across_threads(monkeypatch):
+    created = []
+
+    class SlowSession(HTTPSession):
+        def __init__(self, **kwargs):
+            time.sleep(0.05)
+            created.append(self)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(driver_module, "HTTPSession", SlowSession)
+    driver = ConnectDriver()
+    sessions = fan_out(lambda _: driver.session, range(8), max_in_flight=8)
+    assert len(created) == 1
+    assert all(session is created[0] for session in sessions)
+
+
+def test_session_shared_with_sub_clients():
+    github = Github().connect("token")
+    assert github.repos.session is github.session
+    assert github.users.session is github.session
+
+
+def test_configure_session(requests_mock):
+    requests_mock.get("https://api.test/ping", json={"ok": True})
+    driver = ConnectDriver().configure_session(
+        pool_maxsize=20, timeout=5, headers={"X-Test": "1"}
+    )
+    adapter = driver.session.get_adapter("https://api.test")
+    assert adapter._pool_maxsize == 20
+    res = driver.session.get("https://api.test/ping")
+    assert res.json() == {"ok": True}
+    assert requests_mock.last_request.headers["X-Test"] == "1"
+    assert requests_mock.last_request.timeout == 5
+    # A new pool keeps the headers of the previous session
+    driver.configure_session(pool_maxsize=30, headers={"X-Other": "2"})
+    driver.session.get("https://api.test/ping")
+    assert requests_mock.last_request.headers["X-Test"] == "1"
+    assert requests_mock.last_request.headers["X-Other"] == "2"
+
+
+def test_session_middlewares(requests_mock):
+    requests_mock.get("https://api.test/ping", json={"ok": True})
+    calls = []
+
+    def outer(send, method, url, **kwargs):
+        calls.append("outer")
+        return send(method, url, **kwargs)
+
+    def inner(send, method, url, **kwargs):
+        calls.append("inner")
+        kwargs["headers"] = {"X-Inner": "1"}
+        return send(method, url, **kwargs)
+
+    driver = ConnectDriver()
+    driver.session.middlewares = [outer, inner]
+    driver.session.get("https://api.test/ping")
+    assert calls == ["outer", "inner"]
+    assert requests_mock.last_request.headers["X-Inner"] == "1"
+    driver.configure_session(timeout=3)
+    assert driver.session.middlewares == [outer, inner]
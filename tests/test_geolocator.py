@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("geopy")
+
+from geopy.exc import GeocoderServiceError  # noqa: E402
+
+from naas_drivers.tools.geolocator import Geolocator  # noqa: E402
+
+
+def test_geocode_rate_recovers_after_throttling():
+    geolocator = Geolocator().connect("key", min_delay_seconds=1)
+    geolocator.bucket.sleep = lambda seconds: None
+    errors = [GeocoderServiceError("busy")] * 2
+
+    def geocode(address):
+        if errors:
+            raise errors.pop()
+        return address
+
+    geolocator.client = geocode
+    assert geolocator.geocode("Paris") == "Paris"
+    assert geolocator.bucket.rate == pytest.approx(0.35)
+    for _ in range(10):
+        geolocator.geocode("Paris")
+    assert geolocator.bucket.rate == pytest.approx(1)
@@ -0,0 +1,210 @@
+import requests
+
+from naas_drivers.tools.github import Github, RateLimitScheduler
+
+API = "https://api.github.com/repos/org/repo"
+
+
+def issue(number, **kwargs):
+    return {
+        "id": 100 + number,
+        "number": number,
+        "html_url": f"https://github.com/org/repo/issues/{number}",
+        "title": f"Issue {number}",
+        "state": "open",
+        "labels": [],
+        "assignees": [{"login": "jane"}, {"login": "john"}],
+        "comments": 0,
+        "created_at": "2023-01-02T03:04:05Z",
+        "updated_at": "2023-02-03T04:05:06Z",
+        "comments_url": f"{API}/issues/{number}/comments",
+        **kwargs,
+    }
+
+
+def test_get_issues(requests_mock):
+    requests_mock.get(
+        f"{API}/issues",
+        json=[issue(1)],
+        headers={"Link": f'<{API}/issues?page=2>; rel="next"'},
+    )
+    requests_mock.get(f"{API}/issues?page=2", json=[issue(2)])
+    requests_mock.get(f"{API}/issues/1/comments", json=[{"body": "hi"}])
+    requests_mock.get(f"{API}/issues/2/comments", json=[])
+    df = Github().connect("token").repos.get_issues("https://github.com/org/repo")
+    assert df["issue_number"].tolist() == [1, 2]
+    assert df["issue_number"].dtype == "int"
+    assert df.loc[0, "issue_labels"] == "None"
+    assert df.loc[0, "issue_assignees"] == "jane, john"
+    assert df.loc[0, "last_created_time"] == "03:04:05"
+    assert df["comments"].tolist() == ["['hi']", "No comments"]
+    assert df.loc[1, "linked_pr_state"] == "None"
+
+
+def test_get_pulls_keeps_open_ones(requests_mock):
+    pulls = [
+        issue(i, state=state, requested_reviewers=[])
+        for i, state in ((1, "open"), (2, "closed"), (3, "open"))
+    ]
+    requests_mock.get(f"{API}/pulls", json=pulls)
+    df = Github().connect("token").repos.get_pulls("https://github.com/org/repo")
+    assert df["PR_number"].tolist() == [1, 3]
+    assert df.index.tolist() == [0, 1]
+    assert df.loc[0, "requested_reviewers"] == "None"
+
+
+def test_get_profiles(requests_mock):
+    requests_mock.get(
+        "https://api.github.com/orgs/org/teams?page=1",
+        json=[
+            {
+                "name": "Core",
+                "slug": "core",
+                "description": "Core team",
+                "members_url": "https://api.github.com/teams/1/members{/member}",
+            }
+        ],
+    )
+    requests_mock.get("https://api.github.com/orgs/org/teams?page=2", json=[])
+    requests_mock.get(
+        "https://api.github.com/teams/1/members?page=1",
+        json=[{"url": f"https://api.github.com/users/u{i}"} for i in range(5)],
+    )
+    requests_mock.get("https://api.github.com/teams/1/members?page=2", json=[])
+    for i in range(5):
+        requests_mock.get(
+            f"https://api.github.com/users/u{i}",
+            json={
+                "name": f"User {i}",
+                "email": None,
+                "location": "Paris",
+                "company": "naas",
+                "bio": None,
+                "login": f"u{i}",
+                "twitter_username": None,
+                "created_at": "2020-01-01T00:00:00Z",
+                "updated_at": "2021-01-01T00:00:00Z",
+            },
+        )
+    github = Github().connect("token", max_in_flight=3)
+    df = github.teams.get_profiles("https://github.com/orgs/org/teams")
+    assert df["LOGIN_NAME"].tolist() == [f"u{i}" for i in range(5)]
+    assert df["TEAM"].unique().tolist() == ["Core"]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def rate_headers(remaining, reset=1100, limit=100):
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+        "X-RateLimit-Resource": "core",
+    }
+
+
+def test_scheduler_rotates_tokens(requests_mock):
+    clock = FakeClock()
+    github = Github().connect(["t1", "t2"])
+    github.scheduler.clock, github.scheduler.sleep = clock, clock.sleep
+    requests_mock.get(f"{API}/pulls", json=[], headers=rate_headers(50))
+    github.repos.get_pulls("https://github.com/org/repo")
+    requests_mock.get(f"{API}/pulls", json=[], headers=rate_headers(80))
+    github.repos.get_pulls("https://github.com/org/repo")
+    github.repos.get_pulls("https://github.com/org/repo")
+    auths = [r.headers["Authorization"] for r in requests_mock.request_history]
+    assert auths == ["token t1", "token t2", "token t2"]
+
+
+def test_scheduler_paces_requests(requests_mock):
+    clock = FakeClock()
+    github = Github().connect("t1")
+    github.scheduler.clock, github.scheduler.sleep = clock, clock.sleep
+    requests_mock.get(f"{API}/pulls", json=[], headers=rate_headers(10))
+    for _ in range(3):
+        github.repos.get_pulls("https://github.com/org/repo")
+    # 10 requests left for 100s: one every 10s
+    assert clock.slept == [10.0]
+
+
+def test_scheduler_waits_for_reset(requests_mock):
+    clock = FakeClock()
+    github = Github().connect("t1")
+    github.scheduler.clock, github.scheduler.sleep = clock, clock.sleep
+    requests_mock.get(
+        f"{API}/pulls",
+        [
+            {"json": [], "status_code": 403, "headers": rate_headers(0)},
+            {"json": [], "headers": rate_headers(99, reset=1200)},
+        ],
+    )
+    github.repos.get_pulls("https://github.com/org/repo")
+    assert clock.now == 1100
+    assert len(requests_mock.request_history) == 2
+
+
+def test_scheduler_honours_retry_after(requests_mock):
+    clock = FakeClock()
+    github = Github().connect("t1")
+    github.scheduler.clock, github.scheduler.sleep = clock, clock.sleep
+    requests_mock.get(
+        f"{API}/pulls",
+        [
+            {"json": [], "status_code": 403, "headers": {"Retry-After": "30"}},
+            {"json": []},
+        ],
+    )
+    github.repos.get_pulls("https://github.com/org/repo")
+    assert clock.slept == [30]
+
+
+def test_scheduler_waits_for_reset_on_http_date_retry_after(requests_mock):
+    clock = FakeClock()
+    github = Github().connect("t1")
+    github.scheduler.clock, github.scheduler.sleep = clock, clock.sleep
+    retry_after = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    requests_mock.get(
+        f"{API}/pulls",
+        [
+            {
+                "json": [],
+                "status_code": 403,
+                "headers": {**rate_headers(0), **retry_after},
+            },
+            {"json": [], "headers": rate_headers(99, reset=1200)},
+        ],
+    )
+    github.repos.get_pulls("https://github.com/org/repo")
+    assert clock.now == 1100
+
+
+def test_scheduler_refunds_not_modified():
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(["t1"], clock=clock, sleep=clock.sleep)
+
+    def send(status_code, headers=None):
+        def _send(method, url, **kwargs):
+            res = requests.Response()
+            res.status_code = status_code
+            res.headers.update(headers or {})
+            return res
+
+        return _send
+
+    scheduler(send(200, rate_headers(10)), "GET", f"{API}/pulls")
+    for _ in range(3):
+        scheduler(send(304), "GET", f"{API}/pulls")
+    assert scheduler.quota("t1", "core").remaining == 10
+    scheduler(send(200), "GET", f"{API}/pulls")
+    assert scheduler.quota("t1", "core").remaining == 9
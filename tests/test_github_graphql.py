@@ -0,0 +1,140 @@
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from naas_drivers.tools.github import Github
+
+
+def node(typename, number, created, comments=(), state="OPEN", **kwargs):
+    return {
+        "__typename": typename,
+        "databaseId": 1000 + number,
+        "number": number,
+        "url": f"https://github.com/org/repo/issues/{number}",
+        "title": f"{typename} {number}",
+        "state": state,
+        "createdAt": created,
+        "updatedAt": "2023-03-01T10:00:00Z",
+        "labels": {"nodes": [{"name": "bug"}] if number == 1 else []},
+        "assignees": {"nodes": [{"login": "jane"}]},
+        "comments": {
+            "totalCount": len(comments),
+            "nodes": [{"body": body} for body in comments],
+        },
+        **kwargs,
+    }
+
+
+ISSUE_1 = node("Issue", 1, "2023-01-01T00:00:00Z", comments=["first", "second"])
+ISSUE_2 = node("Issue", 2, "2023-01-03T00:00:00Z")
+PULL_3 = node(
+    "PullRequest",
+    3,
+    "2023-01-02T00:00:00Z",
+    reviewRequests={"nodes": [{"requestedReviewer": {"login": "john"}}, {}]},
+)
+
+# Connections served one node per page to exercise pagination
+CONNECTIONS = {
+    "Issues": ("repository.issues", [ISSUE_2, ISSUE_1]),
+    "PullRequests": ("repository.pullRequests", [PULL_3]),
+    "Projects": (
+        "organization.projects",
+        [
+            {
+                "number": 7,
+                "name": "Roadmap",
+                "columns": {
+                    "nodes": [
+                        {"id": "col-1", "name": "Backlog"},
+                        {"id": "col-2", "name": "In progress"},
+                    ]
+                },
+            }
+        ],
+    ),
+    "ColumnCards:col-1": ("node.cards", [{"content": None}, {"content": ISSUE_1}]),
+    "ColumnCards:col-2": ("node.cards", [{"content": PULL_3}]),
+}
+
+
+class StubGraphQLHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        operation = re.search(r"query (\w+)", payload["query"]).group(1)
+        variables = payload["variables"]
+        if "id" in variables:
+            operation = f"{operation}:{variables['id']}"
+        path, nodes = CONNECTIONS[operation]
+        index = int(variables.get("cursor") or 0)
+        data = {
+            "pageInfo": {
+                "hasNextPage": index + 1 < len(nodes),
+                "endCursor": str(index + 1),
+            },
+            "nodes": nodes[index:][:1],
+        }
+        for key in reversed(path.split(".")):
+            data = {key: data}
+        self.server.requests.append(operation)
+        body = json.dumps({"data": data}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def graphql_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGraphQLHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        Github, "graphql_url", f"http://127.0.0.1:{server.server_port}/graphql"
+    )
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_issues_graphql(graphql_server):
+    github = Github().connect("token")
+    df = github.repos.get_issues("https://github.com/org/repo", engine="graphql")
+    assert df["issue_number"].tolist() == [2, 3, 1]
+    assert df["issue_number"].dtype == "int"
+    assert df.loc[2, "issue_labels"] == "bug"
+    assert df.loc[2, "comments"] == "['first', 'second']"
+    assert df.loc[2, "comments_till_date"] == 2
+    assert df.loc[0, "comments"] == "No comments"
+    assert df["linked_pr_state"].tolist() == ["None", "open", "None"]
+    assert graphql_server.requests == ["Issues", "Issues", "PullRequests"]
+
+
+def test_get_pulls_graphql(graphql_server):
+    github = Github().connect("token")
+    df = github.repos.get_pulls("https://github.com/org/repo", engine="graphql")
+    assert df["PR_number"].tolist() == [3]
+    assert df.loc[0, "id"] == 1003
+    assert df.loc[0, "requested_reviewers"] == "john"
+    assert df.loc[0, "commits_url"].endswith("/repos/org/repo/pulls/3/commits")
+
+
+def test_get_project_issues_graphql(graphql_server):
+    github = Github().connect("token")
+    df = github.projects.get_issues(
+        "https://github.com/orgs/org/projects", engine="graphql"
+    )
+    assert df["issue_number"].tolist() == [1, 3]
+    assert df["issue_status"].tolist() == ["Backlog", "In progress"]
+    assert df["stale_issue"].tolist()[0] == "None"
+    assert df["linked_pr_state"].tolist() == ["None", "open"]
+    assert df["project_id"].tolist() == [7, 7]
+    assert df["project_name"].unique().tolist() == ["Roadmap"]
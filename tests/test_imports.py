@@ -0,0 +1,27 @@
+import ast
+import subprocess
+import sys
+
+import pytest
+
+
+def loaded_modules(statement, names):
+    """Names among `names` loaded after running statement in a fresh interpreter."""
+    check = f"print(sorted(n for n in {names!r} if n in sys.modules))"
+    code = "\n".join(["import sys", statement, check])
+    res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert res.returncode == 0, res.stderr
+    return ast.literal_eval(res.stdout)
+
+
+def test_import_naas_drivers_is_light():
+    assert loaded_modules("import naas_drivers", ["pandas", "requests"]) == []
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["linkedin", "linkedin_salesnavigator", "qonto", "huggingface"],
+)
+def test_driver_modules_load_heavy_dependencies_on_use(module):
+    heavy = ["IPython", "plotly", "htmlBuilder", "naas", "transformers", "torch"]
+    assert loaded_modules(f"import naas_drivers.tools.{module}", heavy) == []
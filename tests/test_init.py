@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+
+import naas_drivers
+
+
+def test_new_returns_independent_instances():
+    first = naas_drivers.new("hubspot").connect("token-a")
+    second = naas_drivers.new("hubspot").connect("token-b")
+    assert first is not second
+    assert first is not naas_drivers.hubspot
+    assert first.session is not second.session
+    assert first.contacts.req_headers["authorization"] == "Bearer token-a"
+    assert second.contacts.req_headers["authorization"] == "Bearer token-b"
+
+
+def test_new_unknown_driver():
+    with pytest.raises(ValueError):
+        naas_drivers.new("unknown")
+
+
+def test_isolated_instances_per_thread():
+    shared = naas_drivers.hubspot
+    barrier = threading.Barrier(2)
+    tokens = {}
+
+    def extract(token):
+        with naas_drivers.isolated():
+            naas_drivers.hubspot.connect(token)
+            # Both threads are connected before either reads its credentials
+            barrier.wait()
+            tokens[token] = naas_drivers.hubspot.token
+            assert naas_drivers.hubspot is not shared
+
+    threads = [threading.Thread(target=extract, args=(t,)) for t in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tokens == {"a": "a", "b": "b"}
+    assert naas_drivers.hubspot is shared
+
+
+def test_preload_loads_drivers_and_reports_missing_extras(capsys):
+    df = naas_drivers.preload(["thinkific", "notion", "gsheet"])
+    assert df["DRIVER"].tolist() == ["thinkific", "notion", "gsheet"]
+    assert df["LOADED"].tolist() == [True, False, True]
+    assert df.loc[1, "ERROR"] == "ModuleNotFoundError: No module named 'notion_client'"
+    assert df.loc[1, "EXTRA_REQUIRES"] == "notion"
+    assert "pip install naas-drivers[notion]" in capsys.readouterr().err
+    # Preloaded instances are the ones naas_drivers.<name> returns
+    assert naas_drivers.preload(["thinkific"])["SECONDS"][0] < 0.01
+    assert naas_drivers.thinkific is naas_drivers.thinkific
+
+
+def test_preload_unknown_driver():
+    with pytest.raises(ValueError):
+        naas_drivers.preload(["unknown"])
@@ -0,0 +1,77 @@
+import pytest
+
+import naas_drivers
+from naas_drivers import instrumentation
+from naas_drivers.accumulator import FrameAccumulator
+from naas_drivers.driver import ConnectDriver
+from naas_drivers.instrumentation import current_driver
+from naas_drivers.retry import Retry
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class Api(ConnectDriver):
+    pass
+
+
+def test_requests_retries_and_frames(requests_mock, enabled):
+    events = []
+    enabled.add_hook(events.append)
+    requests_mock.get(
+        "https://api.test/items/12",
+        [{"status_code": 503}, {"json": [{"id": 12}], "status_code": 200}],
+    )
+    driver = Api()
+    driver.session.middlewares = [Retry(sleep=lambda seconds: None)]
+    records = driver.session.get("https://api.test/items/12").json()
+    FrameAccumulator().extend(records).to_df()
+    enabled.remove_hook(events.append)
+
+    df = naas_drivers.stats().set_index("ENDPOINT")
+    items = df.loc["GET api.test/items/{id}"]
+    assert items["DRIVER"] == "Api"
+    assert items["REQUESTS"] == 2
+    assert items["ERRORS"] == 1
+    assert items["RETRIES"] == 1
+    assert items["BYTES"] > 0
+    assert items["LATENCY_LE_0.1S"] + items["LATENCY_LE_0.25S"] == 2
+    assert df.loc["DataFrame", "FRAME_ROWS"] == 1
+    assert [e["event"] for e in events] == ["request", "retry", "request", "frame"]
+
+
+class Other(ConnectDriver):
+    pass
+
+
+def test_driver_is_restored_after_nested_calls(requests_mock, enabled):
+    requests_mock.get("https://api.test/items", json=[])
+    requests_mock.get("https://other.test/items", json=[])
+    api, other = Api(), Other()
+    seen = []
+
+    def nested(send, method, url, **kwargs):
+        other.session.get("https://other.test/items")
+        seen.append(current_driver.get())
+        return send(method, url, **kwargs)
+
+    api.session.middlewares = [nested]
+    api.session.get("https://api.test/items")
+    assert seen == ["Api"]
+    assert current_driver.get() is None
+    drivers = naas_drivers.stats().set_index("ENDPOINT")["DRIVER"]
+    assert drivers["GET api.test/items"] == "Api"
+    assert drivers["GET other.test/items"] == "Other"
+
+
+def test_disabled_records_nothing(requests_mock):
+    instrumentation.reset()
+    requests_mock.get("https://api.test/items", json=[])
+    Api().session.get("https://api.test/items")
+    assert len(naas_drivers.stats()) == 0
@@ -0,0 +1,194 @@
+import pytest
+
+from naas_drivers.tools.linkedin import LINKEDIN_HOSTS, LinkedIn
+from naas_drivers.tools.linkedin_salesnavigator import LinkedIn as SalesNavigator
+
+VOYAGER = "https://www.linkedin.com/voyager/api/identity/profiles"
+
+
+def connect():
+    return LinkedIn().connect("li_at", "jsessionid", rate_limit={"rate": 1000})
+
+
+def mock_profile(requests_mock, public_id, status_code=200):
+    urn = f"ACoA{public_id}"
+    requests_mock.get(
+        f"{VOYAGER}/{public_id}",
+        status_code=status_code,
+        json={
+            "data": {
+                "entityUrn": f"urn:li:fs_profile:{urn}",
+                "publicIdentifier": public_id,
+                "firstName": public_id.title(),
+            }
+        },
+    )
+    requests_mock.get(
+        f"{VOYAGER}/{public_id}/networkinfo",
+        json={
+            "data": {
+                "entityUrn": f"urn:li:fs_profileNetworkInfo:{urn}",
+                "followersCount": len(public_id),
+            }
+        },
+    )
+
+
+def test_drivers_share_the_linkedin_rate_limit():
+    linkedin = connect()
+    sales = SalesNavigator().connect(rate_limit={"rate": 1000})
+    assert sales.rate_limiter is linkedin.rate_limiter
+    buckets = [linkedin.rate_limiter.buckets[host] for host in LINKEDIN_HOSTS]
+    assert buckets[0] is buckets[1]
+    other = LinkedIn().connect("li_at", "jsessionid", rate_limit={"rate": 1})
+    assert other.rate_limiter is not linkedin.rate_limiter
+
+
+def test_enrich_deduplicates_and_merges_fields(requests_mock):
+    for public_id in ("ada", "bob", "carl"):
+        mock_profile(requests_mock, public_id, 404 if public_id == "bob" else 200)
+    urls = [
+        "https://www.linkedin.com/in/ada/",
+        "https://www.linkedin.com/in/bob/",
+        "https://www.linkedin.com/in/ada",
+        "https://www.linkedin.com/in/carl/",
+    ]
+    profile = connect().profile
+    df = profile.enrich(urls, fields=["identity", "network"], batch_size=2)
+    assert df["PUBLIC_ID"].tolist() == ["ada", "bob", "carl"]
+    assert df["FIRSTNAME"].fillna("-").tolist() == ["Ada", "-", "Carl"]
+    assert df["FOLLOWERS_COUNT"].tolist() == [3, 3, 4]
+    assert df.loc[1, "PROFILE_ID"] == "ACoAbob"
+    assert df.loc[1, "ERROR"].startswith("identity: 404")
+    assert "EMAIL" not in df.columns
+    assert len(requests_mock.request_history) == 6
+
+
+def test_enrich_resumes_from_checkpoint(requests_mock, tmp_path):
+    for public_id in ("ada", "bob"):
+        mock_profile(requests_mock, public_id)
+    requests_mock.get(f"{VOYAGER}/carl", exc=ConnectionError)
+    urls = [f"https://www.linkedin.com/in/{p}/" for p in ("ada", "bob", "carl")]
+    profile = connect().profile
+    with pytest.raises(ConnectionError):
+        profile.enrich(urls, ["identity"], batch_size=1, checkpoint_path=str(tmp_path))
+
+    mock_profile(requests_mock, "carl")
+    requests_mock.reset_mock()
+    df = profile.enrich(
+        urls, ["identity"], batch_size=1, resume=True, checkpoint_path=str(tmp_path)
+    )
+    assert df["PUBLIC_ID"].tolist() == ["ada", "bob", "carl"]
+    assert [r.url for r in requests_mock.request_history] == [f"{VOYAGER}/carl"]
+
+
+def test_enrich_unknown_field():
+    with pytest.raises(ValueError):
+        connect().profile.enrich(["https://www.linkedin.com/in/ada/"], ["skills"])
+
+
+def test_identity_cache(requests_mock, tmp_path):
+    mock_profile(requests_mock, "ada")
+    path = str(tmp_path / "linkedin.sqlite")
+    url = "https://www.linkedin.com/in/ada/"
+    linkedin = LinkedIn().connect(
+        "li_at", "jsessionid", rate_limit={"rate": 1000}, cache_path=path
+    )
+    assert linkedin.profile.get_identity(url)["FIRSTNAME"][0] == "Ada"
+    linkedin.profile.get_identity(url)
+    assert requests_mock.call_count == 1
+    linkedin.profile.get_identity(url, cache="refresh")
+    linkedin.profile.get_identity(url, cache="bypass")
+    assert requests_mock.call_count == 3
+    # enrich and other connections reuse the cached profile
+    other = LinkedIn().connect("li_at", "jsessionid", cache_path=path)
+    df = other.profile.enrich([url], ["identity"])
+    assert df["FIRSTNAME"].tolist() == ["Ada"]
+    assert requests_mock.call_count == 3
+
+
+def test_company_sync_posts_feed_stops_at_known_posts(requests_mock, tmp_path):
+    api = "https://3hz1hdpnlf.execute-api.eu-west-1.amazonaws.com/prod/company"
+    company_url = "https://www.linkedin.com/company/naas-ai/"
+    feed = {"posts": [str(i) for i in range(19, 9, -1)]}
+
+    def posts(request, context):
+        start, count = int(request.qs["start"][0]), int(request.qs["count"][0])
+        ids = feed["posts"][start:][:count]
+        return [{"ACTIVITY_ID": i, "COMMENTS": 1, "LIKES": 1} for i in ids]
+
+    requests_mock.post(f"{api}/getPostsFeed", json=posts)
+    requests_mock.post(f"{api}/getPostsViews", json={"VIEWS": 4})
+    company = connect().company
+    path = str(tmp_path)
+    df = company.sync_posts_feed(company_url, count=2, refresh=2, path=path)
+    assert df["ACTIVITY_ID"].tolist() == feed["posts"]
+    assert df["ENGAGEMENT_SCORE"].tolist() == [0.5] * 10
+
+    # Two new posts: pages stop at the first page of known posts
+    feed["posts"] = ["21", "20"] + feed["posts"]
+    requests_mock.reset_mock()
+    df = company.sync_posts_feed(company_url, count=2, refresh=2, path=path)
+    assert df["ACTIVITY_ID"].tolist() == feed["posts"]
+    calls = [r.path.rsplit("/", 1)[-1] for r in requests_mock.request_history]
+    assert calls == ["getpostsfeed"] * 2 + ["getpostsviews"] * 2
+
+
+def test_post_get_engagement(requests_mock):
+    api = "https://3hz1hdpnlf.execute-api.eu-west-1.amazonaws.com/prod"
+
+    def likes(request, context):
+        activity_id, start = request.qs["activity_id"][0], int(request.qs["start"][0])
+        if activity_id == "2" or start > 0:
+            return []
+        return [{"FULLNAME": name} for name in ("a", "b")]
+
+    requests_mock.post(f"{api}/post/getLikes", json=likes)
+    requests_mock.post(f"{api}/post/getComments", json=[])
+    requests_mock.post(
+        f"{api}/post/getStats",
+        json=lambda request, context: [
+            {"ACTIVITY_ID": request.qs["activity_id"][0], "LIKES": 2}
+        ],
+    )
+    requests_mock.post(
+        f"{api}/company/getPostsViews",
+        [{"json": {"VIEWS": 10}}, {"status_code": 404}],
+    )
+    post_url = "https://www.linkedin.com/posts/naas-ai_data-activity-2-akfv"
+    dfs = connect().post.get_engagement(["1"], [post_url], max_in_flight=1)
+    assert list(dfs) == ["stats", "comments", "likes", "views"]
+    assert dfs["stats"]["ACTIVITY_ID"].tolist() == ["1", "2"]
+    assert dfs["comments"].empty
+    assert dfs["likes"].fillna("-").values.tolist() == [
+        ["1", "a", "-"],
+        ["1", "b", "-"],
+    ]
+    # The failing post does not abort the others
+    views = dfs["views"].fillna("-").values.tolist()
+    assert views[0] == ["1", 10, "-"]
+    assert views[1][:2] == ["2", "-"]
+    assert views[1][2].startswith("views: 404")
+    with pytest.raises(ValueError):
+        connect().post.get_engagement(["1"], kinds=["shares"])
+
+
+def test_network_followers_are_streamed_without_duplicates(requests_mock, tmp_path):
+    api = "https://3hz1hdpnlf.execute-api.eu-west-1.amazonaws.com/prod"
+
+    def followers(request, context):
+        start = int(request.qs["start"][0])
+        ids = ["a", "b", "b", "c", "a"][start:][:2]
+        return [{"PROFILE_ID": i, "FOLLOWER_COUNT": 1} for i in ids]
+
+    requests_mock.post(f"{api}/network/getFollowers", json=followers)
+    network = connect().network
+    df = network.get_followers(count=2, limit=-1)
+    assert df["PROFILE_ID"].tolist() == ["a", "b", "c"]
+    assert str(df["FOLLOWER_COUNT"].dtype) == "Int64"
+    assert df["FOLLOWING"].isna().all()
+    # limit counts unique followers
+    df = network.get_followers(count=2, limit=3)
+    assert df["PROFILE_ID"].tolist() == ["a", "b", "c"]
+    path = str(tmp_path / "followers.parquet")
+    assert network.stream_followers(count=2, limit=-1).write(path) == 3
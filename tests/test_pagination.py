@@ -0,0 +1,164 @@
+import asyncio
+
+import pytest
+
+from naas_drivers.pagination import (
+    CursorPaginator,
+    LinkHeaderPaginator,
+    OffsetPaginator,
+    PageNumberPaginator,
+)
+from naas_drivers.driver import HTTPSession
+
+DATA = [{"id": i} for i in range(25)]
+
+
+def test_offset_paginator_limit():
+    calls = []
+
+    def fetch(start, count):
+        calls.append((start, count))
+        return DATA[start:][:count]
+
+    pages = OffsetPaginator(fetch, count=10, limit=15)
+    assert list(pages.records()) == DATA[:15]
+    assert calls == [(0, 10), (10, 5)]
+
+
+def test_offset_paginator_stops_on_empty_page():
+    pages = OffsetPaginator(lambda start, count: DATA[start:][:count], count=10)
+    assert [len(page) for page in pages] == [10, 10, 5]
+
+
+def test_cursor_paginator():
+    def fetch(cursor):
+        cursor = cursor or 0
+        nxt = cursor + 10 if cursor + 10 < len(DATA) else None
+        return {"data": DATA[cursor:][:10], "next": nxt}
+
+    waits = []
+    pages = CursorPaginator(
+        fetch,
+        get_records=lambda data: data["data"],
+        get_cursor=lambda data: data["next"],
+        wait=lambda: waits.append(1),
+    )
+    assert list(pages.records()) == DATA
+    assert len(waits) == 2
+
+
+def test_page_number_paginator():
+    chunks = [DATA[:10], DATA[10:20], DATA[20:]]
+    pages = PageNumberPaginator(
+        lambda page: chunks[page - 1],
+        get_next_page=lambda data, page: page + 1 if len(data) == 10 else None,
+    )
+    assert pages.to_df()["id"].tolist() == list(range(25))
+
+
+def test_link_header_paginator(requests_mock):
+    url = "https://api.test/items"
+    requests_mock.get(
+        url,
+        json=[1, 2],
+        headers={"Link": f'<{url}?page=2>; rel="next"'},
+    )
+    requests_mock.get(f"{url}?page=2", json=[3])
+    pages = LinkHeaderPaginator(HTTPSession(), url, params={"per_page": 2})
+    assert list(pages.records()) == [1, 2, 3]
+
+
+def test_page_number_paginator_fetches_known_pages_concurrently():
+    chunks = [DATA[:10], DATA[10:20], DATA[20:]]
+    fetched = []
+
+    def fetch(page):
+        fetched.append(page)
+        return {"items": chunks[page - 1], "total": len(chunks)}
+
+    pages = PageNumberPaginator(
+        fetch,
+        get_records=lambda data: data["items"],
+        get_total_pages=lambda data: data["total"],
+        max_in_flight=3,
+    )
+    assert list(pages.records()) == DATA
+    assert sorted(fetched) == [1, 2, 3]
+    assert pages.page is None
+
+
+def test_link_header_paginator_fetches_up_to_last_page(requests_mock):
+    url = "https://api.test/items"
+    requests_mock.get(
+        url,
+        json=[1, 2],
+        headers={
+            "Link": f'<{url}?per_page=2&page=2>; rel="next", '
+            f'<{url}?per_page=2&page=4>; rel="last"'
+        },
+    )
+    for page in (2, 3, 4):
+        requests_mock.get(f"{url}?per_page=2&page={page}", json=[page * 10])
+    pages = LinkHeaderPaginator(
+        HTTPSession(), url, params={"per_page": 2}, max_in_flight=3
+    )
+    assert list(pages.records()) == [1, 2, 20, 30, 40]
+    assert requests_mock.call_count == 4
+    assert pages.url is None
+
+
+def test_link_header_paginator_without_page_numbers(requests_mock):
+    # per_page alone does not number the pages: they are followed one by one
+    url = "https://api.test/items"
+    requests_mock.get(
+        url,
+        json=[1, 2],
+        headers={
+            "Link": f'<{url}?per_page=2&cursor=b>; rel="next", '
+            f'<{url}?per_page=2&cursor=z>; rel="last"'
+        },
+    )
+    requests_mock.get(f"{url}?per_page=2&cursor=b", json=[3])
+    pages = LinkHeaderPaginator(
+        HTTPSession(), url, params={"per_page": 2}, max_in_flight=3
+    )
+    assert list(pages.records()) == [1, 2, 3]
+    assert requests_mock.call_count == 2
+
+
+def test_paginator_async_iteration():
+    async def afetch(start, count):
+        return DATA[start:][:count]
+
+    async def collect(pages):
+        return [records async for records in pages]
+
+    pages = OffsetPaginator(None, count=10, afetch=afetch)
+    assert asyncio.run(collect(pages)) == [DATA[:10], DATA[10:20], DATA[20:]]
+    pages = OffsetPaginator(None, count=10, limit=15, afetch=afetch)
+    assert asyncio.run(pages.ato_df())["id"].tolist() == list(range(15))
+    with pytest.raises(TypeError):
+        asyncio.run(collect(OffsetPaginator(lambda start, count: [])))
+
+
+def test_page_number_paginator_fetches_pages_concurrently_async():
+    chunks = [DATA[:10], DATA[10:20], DATA[20:]]
+    in_flight, max_in_flight = [], []
+
+    async def afetch(page):
+        in_flight.append(page)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0)
+        in_flight.remove(page)
+        return {"items": chunks[page - 1], "total": len(chunks)}
+
+    pages = PageNumberPaginator(
+        None,
+        get_records=lambda data: data["items"],
+        get_total_pages=lambda data: data["total"],
+        max_in_flight=3,
+        afetch=afetch,
+    )
+    assert asyncio.run(pages.ato_df())["id"].tolist() == list(range(25))
+    assert max(max_in_flight) == 2
+    assert pages.page is None
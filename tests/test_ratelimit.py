@@ -0,0 +1,71 @@
+import pytest
+
+from naas_drivers.driver import HTTPSession
+from naas_drivers.ratelimit import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def bucket(clock, **kwargs):
+    return TokenBucket(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_bucket_bursts_then_paces():
+    clock = FakeClock()
+    limiter = bucket(clock, rate=2, burst=3)
+    for _ in range(5):
+        limiter.acquire()
+    assert clock.slept == [0.5, 0.5]
+    clock.now += 10
+    limiter.acquire()
+    assert len(clock.slept) == 2
+
+
+def test_bucket_aimd():
+    clock = FakeClock()
+    limiter = bucket(clock, rate=1, max_rate=2, min_rate=0.25, increase=0.5)
+    limiter.succeeded()
+    limiter.succeeded()
+    limiter.succeeded()
+    assert limiter.rate == 2
+    limiter.throttled()
+    assert limiter.rate == 1
+    limiter.throttled()
+    limiter.throttled()
+    assert limiter.rate == 0.25
+    assert limiter.throttles == 3
+
+
+def test_bucket_pauses_for_retry_after():
+    clock = FakeClock()
+    limiter = bucket(clock, rate=10, burst=5)
+    limiter.throttled(retry_after=30)
+    assert limiter.acquire() == pytest.approx(30)
+
+
+def test_rate_limiter_middleware(requests_mock):
+    clock = FakeClock()
+    slow = bucket(clock, rate=1, burst=1)
+    fast = bucket(clock, rate=100, burst=100)
+    limiter = RateLimiter({"api.test": fast, "api.test/search": slow})
+    assert limiter.get_bucket("https://api.test/search/items?q=1") is slow
+    assert limiter.get_bucket("https://api.test/searching") is fast
+    assert limiter.get_bucket("https://other.test/search") is None
+
+    requests_mock.get("https://api.test/search", status_code=429)
+    session = HTTPSession(middlewares=[limiter])
+    assert session.get("https://api.test/search").status_code == 429
+    assert slow.rate == 0.5
+    session.get("https://api.test/search")
+    assert clock.slept == [2]
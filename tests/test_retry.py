@@ -0,0 +1,68 @@
+import pytest
+import requests
+
+from naas_drivers.driver import ConnectDriver, HTTPSession
+from naas_drivers.retry import Retry
+
+URL = "https://api.test/items"
+
+
+def session(**kwargs):
+    slept = []
+    retry = Retry(sleep=slept.append, **kwargs)
+    return HTTPSession(middlewares=[retry]), retry, slept
+
+
+def test_retries_transient_errors(requests_mock):
+    requests_mock.get(
+        URL,
+        [
+            {"status_code": 502},
+            {"status_code": 429, "headers": {"Retry-After": "7"}},
+            {"json": {"ok": True}},
+        ],
+    )
+    http, retry, slept = session()
+    assert http.get(URL).json() == {"ok": True}
+    assert slept[1] >= 7
+    stats = retry.stats()
+    assert stats["retries"] == 2
+    assert stats["retried_requests"] == 1
+    assert stats["by_reason"] == {502: 1, 429: 1}
+
+
+def test_gives_up_after_max_retries(requests_mock):
+    requests_mock.get(URL, status_code=503)
+    http, retry, slept = session(max_retries=2)
+    assert http.get(URL).status_code == 503
+    assert requests_mock.call_count == 3
+    assert retry.stats()["exhausted"] == 1
+
+
+def test_post_only_retried_when_safe(requests_mock):
+    requests_mock.post(URL, [{"status_code": 500}, {"status_code": 201}])
+    http, retry, _ = session()
+    assert http.post(URL).status_code == 500
+    assert http.post(URL, headers={"Idempotency-Key": "1"}).status_code == 201
+
+    requests_mock.post(URL, [{"status_code": 429}, {"status_code": 201}])
+    assert http.post(URL).status_code == 201
+
+
+def test_network_errors_and_budget(requests_mock):
+    requests_mock.get(URL, exc=requests.ConnectionError)
+    http, retry, _ = session(budget=2)
+    with pytest.raises(requests.ConnectionError):
+        http.get(URL)
+    assert retry.stats()["retries"] == 2
+    assert retry.stats()["exhausted"] == 1
+
+
+def test_driver_session_retries(requests_mock):
+    driver = ConnectDriver()
+    assert driver.retry.max_retries == 3
+    driver.configure_session(max_retries=0)
+    assert driver.retry.max_retries == 0
+    requests_mock.get(URL, status_code=503)
+    assert driver.session.get(URL).status_code == 503
+    assert requests_mock.call_count == 1
@@ -0,0 +1,44 @@
+import pandas as pd
+
+from naas_drivers.accumulator import FrameAccumulator
+from naas_drivers.schema import STRING, Schema, astype, get_schema
+
+
+def test_astype_converts_columns_in_one_pass():
+    df = pd.DataFrame(
+        {
+            "ID": ["1", "2"],
+            "DATE": ["2023-01-02T03:04:05Z", None],
+            "STATE": ["open", None],
+            "NAME": ["a", None],
+        }
+    )
+    dtypes = {"ID": "int64", "DATE": "datetime", "STATE": "category"}
+    df = astype(df, {**dtypes, "NAME": "string", "MISSING": "int64"}, fill="None")
+    assert df["ID"].tolist() == [1, 2]
+    assert pd.api.types.is_datetime64_any_dtype(df["DATE"])
+    assert str(df["DATE"].dt.tz) == "UTC"
+    assert df["DATE"].isna().tolist() == [False, True]
+    assert df["STATE"].cat.categories.tolist() == ["None", "open"]
+    assert df["NAME"].dtype == STRING
+    assert df["NAME"].tolist() == ["a", "None"]
+    assert "MISSING" not in df.columns
+
+
+def test_schema_orders_columns_and_registers():
+    schema = Schema("test.rows", {"ID": "int64", "NAME": "string", "TAGS": "object"})
+    df = schema.apply(pd.DataFrame({"NAME": ["a"], "OTHER": [0], "ID": [1]}))
+    assert list(df.columns) == ["ID", "NAME", "TAGS"]
+    assert get_schema("test.rows") is schema
+    empty = schema.apply(pd.DataFrame())
+    assert empty.empty
+    assert str(empty["ID"].dtype) == "int64"
+
+
+def test_accumulator_builds_typed_frame_from_schema():
+    schema = Schema("test.issues", {"NUMBER": "int64", "STATE": "category"})
+    acc = FrameAccumulator(schema=schema)
+    acc.extend([{"STATE": "open", "NUMBER": 1}, {"STATE": "closed", "NUMBER": 2}])
+    df = acc.to_df()
+    assert list(df.columns) == ["NUMBER", "STATE"]
+    assert df.dtypes.astype(str).tolist() == ["int64", "category"]
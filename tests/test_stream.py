@@ -0,0 +1,65 @@
+import csv
+
+import pandas as pd
+import pytest
+
+from naas_drivers.stream import RecordStream
+
+PAGES = [
+    [{"PROFILE_ID": "a", "N": 1}, {"PROFILE_ID": "b", "N": None}],
+    [{"PROFILE_ID": "a", "N": 3}, {"PROFILE_ID": None, "N": 4}],
+    [{"PROFILE_ID": "b", "N": 5}],
+    [{"PROFILE_ID": "c", "N": 6, "EXTRA": "x"}],
+]
+
+
+def test_stream_drops_seen_records():
+    batches = list(RecordStream(PAGES))
+    assert [[r["N"] for r in records] for records in batches] == [[1, None], [4], [6]]
+    assert len(list(RecordStream(PAGES, key=None).records())) == 6
+    df = RecordStream(PAGES).to_df()
+    assert df["PROFILE_ID"].fillna("-").tolist() == ["a", "b", "-", "c"]
+
+
+def test_stream_limit_counts_unique_records():
+    fetched = []
+
+    def pages():
+        for records in PAGES:
+            fetched.append(records)
+            yield records
+
+    batches = list(RecordStream(pages(), limit=3))
+    assert [[r["N"] for r in records] for records in batches] == [[1, None], [4]]
+    assert len(fetched) == 2
+
+
+def test_stream_writes_parquet_and_csv(tmp_path):
+    parquet = str(tmp_path / "rows.parquet")
+    assert RecordStream(PAGES).write(parquet) == 4
+    df = pd.read_parquet(parquet)
+    assert list(df.columns) == ["PROFILE_ID", "N"]
+    assert df["N"].fillna(0).tolist() == [1, 0, 4, 6]
+
+    path = str(tmp_path / "rows.csv")
+    assert RecordStream(PAGES).write(path) == 4
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["PROFILE_ID"] for row in rows] == ["a", "b", "", "c"]
+
+    with pytest.raises(ValueError):
+        RecordStream(PAGES).write(str(tmp_path / "rows.xlsx"))
+
+
+def test_stream_failure_keeps_previous_file(tmp_path):
+    path = str(tmp_path / "rows.csv")
+    RecordStream(PAGES).write(path)
+
+    def failing():
+        yield PAGES[0]
+        raise ConnectionError
+
+    with pytest.raises(ConnectionError):
+        RecordStream(failing()).write(path)
+    assert len(pd.read_csv(path)) == 4
+    assert list(tmp_path.iterdir()) == [tmp_path / "rows.csv"]
@@ -0,0 +1,83 @@
+import pytest
+
+from naas_drivers.tools.github import Github
+
+pytest.importorskip("pyarrow")
+
+API = "https://api.github.com/repos/org/repo"
+
+
+def issue(number, state="open", updated="2023-02-01T00:00:00Z"):
+    return {
+        "id": 100 + number,
+        "number": number,
+        "html_url": f"https://github.com/org/repo/issues/{number}",
+        "title": f"Issue {number}",
+        "state": state,
+        "labels": [],
+        "assignees": [],
+        "comments": 0,
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": updated,
+        "comments_url": f"{API}/issues/{number}/comments",
+    }
+
+
+def list_request(requests_mock):
+    return [r for r in requests_mock.request_history if r.path.endswith("/issues")][-1]
+
+
+def test_sync_issues(requests_mock, tmp_path):
+    requests_mock.get(f"{API}/issues/1/comments", json=[])
+    requests_mock.get(f"{API}/issues/2/comments", json=[])
+    requests_mock.get(f"{API}/issues/3/comments", json=[])
+    github = Github().connect("token")
+
+    requests_mock.get(f"{API}/issues", json=[issue(2), issue(1)])
+    df = github.repos.sync_issues("https://github.com/org/repo", path=str(tmp_path))
+    assert df["issue_number"].tolist() == [2, 1]
+    assert "since" not in list_request(requests_mock).qs
+
+    # Issue 1 closed, issue 3 opened since the last sync
+    requests_mock.get(
+        f"{API}/issues",
+        json=[
+            issue(3, updated="2023-03-02T00:00:00Z"),
+            issue(1, state="closed", updated="2023-03-01T00:00:00Z"),
+        ],
+    )
+    df = github.repos.sync_issues("https://github.com/org/repo", path=str(tmp_path))
+    assert list_request(requests_mock).qs["since"] == ["2023-02-01t00:00:00z"]
+    assert list_request(requests_mock).qs["state"] == ["all"]
+    assert df["issue_number"].tolist() == [3, 2]
+
+
+def test_sync_commits(requests_mock, tmp_path):
+    def commit(sha, date):
+        person = {"name": "Jane", "email": "jane@naas.ai", "date": date}
+        return {
+            "sha": sha,
+            "commit": {
+                "message": sha,
+                "author": person,
+                "committer": person,
+                "comment_count": 0,
+                "verification": {"reason": "unsigned", "verified": False},
+            },
+        }
+
+    github = Github().connect("token")
+    requests_mock.get(f"{API}/commits", json=[commit("b", "2023-01-02T00:00:00Z")])
+    github.repos.sync_commits("https://github.com/org/repo", path=str(tmp_path))
+    # "a" was rebased onto "b", keeping its older date
+    requests_mock.get(
+        f"{API}/commits",
+        json=[
+            commit("c", "2023-01-03T00:00:00Z"),
+            commit("b", "2023-01-02T00:00:00Z"),
+            commit("a", "2022-12-30T00:00:00Z"),
+        ],
+    )
+    df = github.repos.sync_commits("https://github.com/org/repo", path=str(tmp_path))
+    assert requests_mock.last_request.qs["since"] == ["2022-12-26t00:00:00z"]
+    assert df["ID"].tolist() == ["c", "b", "a"]